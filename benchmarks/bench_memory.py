@@ -0,0 +1,52 @@
+"""Measures peak RSS and wall time of whole pipeline runs on a full-size synthetic .minecraft directory.
+
+The synthetic unifont covers every codepoint of the enabled UNIFONT_RANGES (see
+tests/synthetic_assets.py). Each run is a fresh process building the Regular and
+Bold OpenType fonts without the persistent cache, once in batch and once with
+--stream. Pass --path to compare against another checkout of the repository
+(one that supports --minecraft-dir).
+
+    python -m benchmarks.bench_memory [--path REPOSITORY]
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from minecraft_fontgen.config import UNIFONT_RANGES
+from tests.synthetic_assets import write_minecraft_dir
+
+RUN_MAIN = """
+import resource, sys
+import minecraft_fontgen.main as main
+sys.argv = ["minecraft-fontgen"] + {args!r}
+main.main()
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+"""
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--path", default=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                        help="Repository checkout to run (default: this one)")
+    args = parser.parse_args()
+
+    codepoints = [codepoint for start, end, enabled in UNIFONT_RANGES if enabled for codepoint in range(start, end + 1)]
+    with tempfile.TemporaryDirectory() as root:
+        minecraft_dir = os.path.join(root, "minecraft")
+        version = write_minecraft_dir(minecraft_dir, codepoints)
+        print(f"{len(codepoints)} unifont codepoints, {args.path}")
+
+        for label, extra in [("batch", []), ("stream", ["--stream"])]:
+            fontgen_args = ["--silent", "--version", version, "--minecraft-dir", minecraft_dir, "--offline", "--no-cache",
+                            "--styles", "regular,bold", "--output", f"output-{label}", *extra]
+            start = time.perf_counter()
+            result = subprocess.run([sys.executable, "-c", RUN_MAIN.format(args=fontgen_args)], cwd=root, check=True,
+                                    capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=args.path))
+            elapsed = time.perf_counter() - start
+            peak = int(result.stdout.split()[-1]) / 1024 # ru_maxrss is in KiB on Linux
+            print(f"{label:6} peak RSS {peak:.0f} MiB, {elapsed:.1f}s")
+
+if __name__ == "__main__":
+    main()
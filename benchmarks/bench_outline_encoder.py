@@ -0,0 +1,46 @@
+"""Times outline encoding through fontTools pens against outline_encoder, per glyph, for both outline formats.
+
+Glyphs are the test corpus (tests/corpus.py, plus a real unifont sample when
+FONTGEN_TEST_UNIFONT points at a unifont ZIP) traced, scaled and drawn like a
+real build, upright and italic.
+
+    python -m benchmarks.bench_outline_encoder [--repeat N]
+"""
+import argparse
+import time
+
+from minecraft_fontgen.functions import set_cache, set_silent
+from minecraft_fontgen.glyph.outline_encoder import encode_charstring, encode_glyf
+from tests.test_outline_encoder import drawn_glyphs, pen_charstring, pen_glyf
+
+def best_time(function, cases, repeat):
+    """Returns the fastest of repeat runs of function over every (contours, width) case, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for contours, width in cases:
+            function(contours, width)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per encoder, the fastest is reported")
+    args = parser.parse_args()
+
+    set_silent(True)
+    set_cache(None)
+    glyphs = drawn_glyphs()
+
+    for label, use_cff, pen, encoder in [
+        ("CFF", True, pen_charstring, encode_charstring),
+        ("TrueType", False, lambda contours, width: pen_glyf(contours), lambda contours, width: encode_glyf(contours)),
+    ]:
+        cases = [(contours, width) for _, cff, contours, width in glyphs if cff == use_cff]
+        pen_time = best_time(pen, cases, args.repeat)
+        encoder_time = best_time(encoder, cases, args.repeat)
+        print(f"{label:8} {len(cases)} glyphs: pen {pen_time / len(cases) * 1e6:.1f} µs/glyph, "
+              f"encoder {encoder_time / len(cases) * 1e6:.1f} µs/glyph ({pen_time / encoder_time:.1f}x)")
+
+if __name__ == "__main__":
+    main()
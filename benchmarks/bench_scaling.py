@@ -0,0 +1,84 @@
+"""Times glyph scaling and its contour helpers against the per-glyph code they replaced (tests/reference/scaling.py).
+
+Inputs are the scaled contours of the test corpus (tests/corpus.py) traced
+regular and bold, plus random polygons with many coinciding vertices. The
+split is also timed on chains of 16 to 256 squares joined corner to corner,
+where every join is a pinch point. The
+current precompute_glyph_scaling also computes contour nesting depths, which
+the reference leaves to Glyph.draw.
+
+    python -m benchmarks.bench_scaling [--repeat N] [--random N]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from minecraft_fontgen.file_io import _inset_shared_vertices, _split_self_touching, _trace_bitmap_contours2, precompute_glyph_scaling
+from minecraft_fontgen.functions import set_silent
+from tests.reference import scaling as reference
+from tests.test_scaling import copy_glyph_map, corpus_glyph_map, scaled_contour_sets
+
+def best_time(function, inputs, repeat):
+    """Returns the fastest of repeat runs of function over fresh copies of inputs, in seconds."""
+    times = []
+    for _ in range(repeat):
+        copies = [[[list(contour) for contour in contours] for contours in arguments] for arguments in inputs]
+        start = time.perf_counter()
+        for arguments in copies:
+            function(*arguments)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def pinch_chains():
+    """Returns (outer, holes) contour sets of 2x2 pixel squares chained corner to corner, traced as one outline
+    with a pinch point between every pair of squares."""
+    contour_sets = []
+    for squares in (16, 64, 256):
+        bitmap = np.zeros((squares * 2, squares * 2), dtype=np.uint8)
+        for square in range(squares):
+            bitmap[square * 2:square * 2 + 2, square * 2:square * 2 + 2] = 1
+        pixel_data = _trace_bitmap_contours2(bitmap)
+        contour_sets.append(tuple([[(x * 128.0, -y * 128.0) for x, y in contour["corners"]] for contour in pixel_data[key].values()]
+                                  for key in ("paths", "holes")))
+    return contour_sets
+
+def report(label, count, before, after):
+    print(f"{label:24} ({count} glyphs): reference {before / count * 1e6:.1f} µs/glyph, "
+          f"current {after / count * 1e6:.1f} µs/glyph ({before / after:.1f}x)")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per implementation, the fastest is reported")
+    parser.add_argument("--random", type=int, default=600, help="Random bitmaps and polygons in the corpus")
+    args = parser.parse_args()
+    set_silent(True)
+
+    contour_sets = scaled_contour_sets(args.random)
+    reference_split = lambda outer, holes: (reference._split_self_touching(outer), reference._split_self_touching(holes))
+    split = lambda outer, holes: (_split_self_touching(outer), _split_self_touching(holes))
+    report("_split_self_touching", len(contour_sets),
+           best_time(reference_split, contour_sets, args.repeat), best_time(split, contour_sets, args.repeat))
+    chains = pinch_chains()
+    report("  pinch chains", len(chains), best_time(reference_split, chains, args.repeat), best_time(split, chains, args.repeat))
+
+    split_sets = [(reference._split_self_touching(outer), reference._split_self_touching(holes)) for outer, holes in contour_sets]
+    report("_inset_shared_vertices", len(split_sets),
+           best_time(reference._inset_shared_vertices, split_sets, args.repeat),
+           best_time(_inset_shared_vertices, split_sets, args.repeat))
+
+    glyph_map = corpus_glyph_map()
+    count = sum(len(tiles) for tiles in glyph_map.values())
+    times = {}
+    for name, function in (("reference", reference.precompute_glyph_scaling), ("current", precompute_glyph_scaling)):
+        maps = [copy_glyph_map(glyph_map) for _ in range(args.repeat)]
+        elapsed = []
+        for copy in maps:
+            start = time.perf_counter()
+            function(copy)
+            elapsed.append(time.perf_counter() - start)
+        times[name] = min(elapsed)
+    report("precompute_glyph_scaling", count, times["reference"], times["current"])
+
+if __name__ == "__main__":
+    main()
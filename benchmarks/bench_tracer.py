@@ -0,0 +1,54 @@
+"""Times the contour tracer against the flood-fill tracer it replaced (tests/reference/tracer.py), in glyphs per second.
+
+Reports the labeling stage on its own and the full trace, over the test corpus
+(tests/corpus.py, plus a real unifont sample when FONTGEN_TEST_UNIFONT points
+at a unifont ZIP), then the full trace of the glyphs whose boundary loops are
+hardest to walk: the U+26C3-like rook, checkerboards full of pinch points and
+nested rings.
+
+    python -m benchmarks.bench_tracer [--repeat N] [--random N]
+"""
+import argparse
+import time
+
+from minecraft_fontgen.file_io import _label_pixel_grid, _trace_bitmap_contours2
+from tests.corpus import corpus_bitmaps, synthetic_bitmaps
+from tests.reference import tracer as reference
+
+def glyphs_per_second(function, bitmaps, repeat):
+    """Returns the best rate over repeat runs of function on a fresh copy of every bitmap."""
+    times = []
+    for _ in range(repeat):
+        copies = [bitmap.copy() for bitmap in bitmaps]
+        start = time.perf_counter()
+        for bitmap in copies:
+            function(bitmap)
+        times.append(time.perf_counter() - start)
+    return len(bitmaps) / min(times)
+
+def report(label, bitmaps, stages, repeat):
+    """Prints reference and current rates for each (stage, reference function, current function)."""
+    for stage, reference_function, function in stages:
+        before = glyphs_per_second(reference_function, bitmaps, repeat)
+        after = glyphs_per_second(function, bitmaps, repeat)
+        print(f"{label} {stage:9} ({len(bitmaps)} glyphs): reference {before:,.0f}/s, current {after:,.0f}/s ({after / before:.1f}x)")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per tracer, the fastest is reported")
+    parser.add_argument("--random", type=int, default=1000, help="Random bitmaps in the corpus")
+    args = parser.parse_args()
+
+    bitmaps = [bitmap for _, bitmap in corpus_bitmaps(args.random)]
+    report("corpus", bitmaps, [
+        ("labeling", reference.label_pixel_grid, _label_pixel_grid),
+        ("trace", reference._trace_bitmap_contours2, _trace_bitmap_contours2),
+    ], args.repeat)
+
+    hard = [bitmap for name, bitmap in synthetic_bitmaps(0) if name.startswith(("rook", "checkerboard", "rings"))]
+    report("hard  ", hard * 100, [
+        ("trace", reference._trace_bitmap_contours2, _trace_bitmap_contours2),
+    ], args.repeat)
+
+if __name__ == "__main__":
+    main()
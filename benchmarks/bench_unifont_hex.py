@@ -0,0 +1,62 @@
+"""Times the unifont .hex parser against the row-by-row parser it replaced (tests/reference/unifont_hex.py).
+
+Pass the unifont ZIP Minecraft downloads (the minecraft/font/unifont.zip
+object of the asset index, under .minecraft/assets/objects) with --zip, or
+set FONTGEN_TEST_UNIFONT. Its .hex files are read from the archive up front,
+so only parsing is timed. Without a ZIP, a synthetic file covering every BMP
+codepoint is timed instead (tests/synthetic_assets.py), which is only a
+stand-in for the real glyph mix.
+
+    python -m benchmarks.bench_unifont_hex [--zip PATH] [--repeat N]
+"""
+import argparse
+import os
+import time
+import zipfile
+
+import numpy as np
+
+from minecraft_fontgen.piston import parse_unifont_hex_bytes
+from tests.reference.unifont_hex import parse_unifont_hex_bytes as reference_parse
+from tests.synthetic_assets import unifont_hex
+
+def best_time(function, hex_files, repeat):
+    """Returns the fastest of repeat runs of function over every .hex file, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for hex_bytes in hex_files:
+            function(hex_bytes)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def read_hex_files(path):
+    """Returns {name: content} for every .hex file in the ZIP at path."""
+    with zipfile.ZipFile(path) as archive:
+        return {name: archive.read(name) for name in archive.namelist() if name.lower().endswith(".hex")}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--zip", default=os.environ.get("FONTGEN_TEST_UNIFONT"), help="Unifont ZIP to parse")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per parser, the fastest is reported")
+    args = parser.parse_args()
+
+    if args.zip:
+        hex_files = read_hex_files(args.zip)
+    else:
+        hex_files = {"synthetic (U+0000-U+FFFF)": unifont_hex(np.random.default_rng(8), range(0x10000))}
+
+    for name, hex_bytes in hex_files.items():
+        glyphs = len(parse_unifont_hex_bytes(hex_bytes))
+        before = best_time(reference_parse, [hex_bytes], args.repeat)
+        after = best_time(parse_unifont_hex_bytes, [hex_bytes], args.repeat)
+        print(f"{name} ({len(hex_bytes) / 2 ** 20:.1f} MiB, {glyphs} glyphs in range): "
+              f"reference {before * 1000:,.0f} ms, current {after * 1000:,.0f} ms ({before / after:.1f}x)")
+
+    if len(hex_files) > 1:
+        before = best_time(reference_parse, hex_files.values(), args.repeat)
+        after = best_time(parse_unifont_hex_bytes, hex_files.values(), args.repeat)
+        print(f"all .hex files: reference {before * 1000:,.0f} ms, current {after * 1000:,.0f} ms ({before / after:.1f}x)")
+
+if __name__ == "__main__":
+    main()
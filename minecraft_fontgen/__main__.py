@@ -2,4 +2,5 @@
 
 from minecraft_fontgen.main import main
 
-main()
+if __name__ == "__main__": # tracing workers (--jobs) re-import this module when spawned
+    main()
@@ -0,0 +1,273 @@
+import hashlib
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+import minecraft_fontgen.config as config
+
+_caches = {}
+_caches_lock = threading.Lock()
+_blob_caches = {}
+
+class ObjectCache:
+    """Content-addressed on-disk object store with SHA-1 verification and size-capped LRU eviction.
+
+    The store's total size is measured once, on the first write, and kept up to
+    date as entries are written and removed; the directory is only walked again
+    when that total goes over the cap, and eviction then frees some headroom so a
+    full store isn't walked on every write. Safe to share between threads.
+    """
+
+    EVICT_RATIO = 0.9 # eviction trims the store to this share of max_size
+
+    def __init__(self, directory, max_size=None):
+        """Initializes a store rooted at directory. max_size (bytes) of None or 0 means unbounded."""
+        self.directory = directory
+        self.max_size = max_size
+        self.total = None # bytes stored, measured on the first put of a capped store
+        self.lock = threading.Lock()
+
+    def path(self, key):
+        """Returns the on-disk path for a key, sharded by its first two characters (like the Mojang CDN)."""
+        return os.path.join(self.directory, key[:2], key)
+
+    def get(self, key, verify=False):
+        """Returns the cached bytes for key, or None on a miss.
+
+        With verify=True the key is treated as the SHA-1 of the content; entries
+        that fail verification are deleted and reported as a miss. Hits refresh
+        the entry's mtime, which serves as the LRU clock for eviction.
+        """
+        path = self.path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except OSError:
+            return None
+
+        if verify and hashlib.sha1(data).hexdigest() != key:
+            self.remove(key)
+            return None
+
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return data
+
+    def get_path(self, key):
+        """Returns the on-disk path of a cached entry for direct (e.g. memory-mapped) reads, or None on a miss.
+        Hits refresh the entry's mtime like get()."""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def put(self, key, data):
+        """Atomically writes bytes under key, then evicts least recently used entries over the size cap."""
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        replaced = self._size(path) if self.max_size else 0
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+
+        if not self.max_size:
+            return
+
+        with self.lock:
+            if self.total is None:
+                self.total = self._scan()[1]
+            else:
+                self.total += len(data) - replaced
+            over = self.total > self.max_size
+        if over:
+            self.evict(keep=key)
+
+    def remove(self, key):
+        """Deletes a cached entry if present."""
+        path = self.path(key)
+        size = self._size(path)
+        try:
+            os.remove(path)
+        except OSError:
+            return
+
+        with self.lock:
+            if self.total is not None:
+                self.total -= size
+
+    def evict(self, keep=None):
+        """Deletes the least recently used entries once the store exceeds max_size, until it fits within
+        EVICT_RATIO of it."""
+        if not self.max_size:
+            return
+
+        with self.lock:
+            entries, total = self._scan()
+            if total > self.max_size:
+                target = self.max_size * self.EVICT_RATIO
+                entries.sort()
+                for _, size, name, path in entries:
+                    if total <= target:
+                        break
+                    if name == keep:
+                        continue
+                    try:
+                        os.remove(path)
+                        total -= size
+                    except OSError:
+                        pass
+            self.total = total
+
+    def _scan(self):
+        """Walks the store, returning ([(mtime, size, name, path), ...], total size)."""
+        entries = []
+        total = 0
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.startswith(".tmp-"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name, path))
+                total += stat.st_size
+        return entries, total
+
+    @staticmethod
+    def _size(path):
+        """Returns the size of the file at path, or 0 if it doesn't exist."""
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+class BlobCache:
+    """SQLite-backed key/value store for many small entries (e.g. traced glyph contours), with size-capped LRU eviction.
+
+    Writes and LRU timestamp updates are buffered in memory and committed in one
+    transaction by flush(), which runs automatically every FLUSH_INTERVAL writes.
+    The database uses incremental auto-vacuum, so pages freed by eviction are
+    returned to the file system and the file shrinks along with the data.
+    Must only be used from the thread that created it.
+    """
+
+    FLUSH_INTERVAL = 1000
+
+    def __init__(self, path, max_size=None):
+        """Opens (creating if needed) the database at path. max_size (bytes of stored data) of None or 0 means unbounded."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.path = path
+        self.max_size = max_size
+        self.connection = sqlite3.connect(path, timeout=30)
+        if self.connection.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            # Takes effect immediately on a new database, an existing one needs a full VACUUM once
+            self.connection.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            self.connection.execute("VACUUM")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS blobs (key TEXT PRIMARY KEY, data BLOB NOT NULL, used REAL NOT NULL)")
+        self.pending = {}
+        self.touched = set()
+
+    def get(self, key):
+        """Returns the cached bytes for key, or None on a miss. Hits refresh the entry's LRU timestamp on flush."""
+        data = self.pending.get(key)
+        if data is not None:
+            return data
+
+        row = self.connection.execute("SELECT data FROM blobs WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self.touched.add(key)
+        return row[0]
+
+    def put(self, key, data):
+        """Buffers bytes under key, flushing once FLUSH_INTERVAL writes are pending."""
+        self.pending[key] = data
+        if len(self.pending) >= self.FLUSH_INTERVAL:
+            self.flush()
+
+    def remove(self, key):
+        """Deletes an entry if present, including a buffered write."""
+        self.pending.pop(key, None)
+        self.touched.discard(key)
+        with self.connection:
+            self.connection.execute("DELETE FROM blobs WHERE key = ?", (key,))
+
+    def flush(self):
+        """Commits buffered writes and LRU timestamps, then evicts least recently used entries over the size cap."""
+        if not self.pending and not self.touched:
+            return
+
+        now = time.time()
+        with self.connection:
+            self.connection.executemany("INSERT OR REPLACE INTO blobs (key, data, used) VALUES (?, ?, ?)",
+                                        [(key, data, now) for key, data in self.pending.items()])
+            self.connection.executemany("UPDATE blobs SET used = ? WHERE key = ?", [(now, key) for key in self.touched])
+        self.pending.clear()
+        self.touched.clear()
+        self.evict()
+
+    def evict(self):
+        """Deletes the least recently used entries until the stored data fits within max_size."""
+        if not self.max_size:
+            return
+
+        total = self.connection.execute("SELECT COALESCE(SUM(LENGTH(data)), 0) FROM blobs").fetchone()[0]
+        if total <= self.max_size:
+            return
+
+        expired = []
+        for key, size in self.connection.execute("SELECT key, LENGTH(data) FROM blobs ORDER BY used"):
+            if total <= self.max_size:
+                break
+            expired.append((key,))
+            total -= size
+
+        with self.connection:
+            self.connection.executemany("DELETE FROM blobs WHERE key = ?", expired)
+        self.connection.executescript("PRAGMA incremental_vacuum") # executescript runs it to completion, execute frees one page
+
+def get_cache(name):
+    """Returns the shared ObjectCache for a cache namespace (e.g. "objects"), or None when caching is disabled."""
+    if not config.CACHE_DIR:
+        return None
+
+    path = os.path.join(config.CACHE_DIR, name)
+    max_size = get_cache_budget(name)
+    with _caches_lock:
+        if path not in _caches or _caches[path].max_size != max_size:
+            _caches[path] = ObjectCache(path, max_size)
+        return _caches[path]
+
+def get_blob_cache(name):
+    """Returns the shared BlobCache for a cache namespace (e.g. "contours"), or None when caching is disabled."""
+    if not config.CACHE_DIR:
+        return None
+
+    path = os.path.join(config.CACHE_DIR, f"{name}.sqlite")
+    if path not in _blob_caches:
+        _blob_caches[path] = BlobCache(path, get_cache_budget(name))
+    return _blob_caches[path]
+
+def get_cache_budget(name):
+    """Returns a namespace's share of CACHE_MAX_SIZE (see CACHE_SIZE_SHARES), so all stores together stay within it.
+    None or 0 (no cap) is passed through."""
+    if not config.CACHE_MAX_SIZE:
+        return config.CACHE_MAX_SIZE
+    return int(config.CACHE_MAX_SIZE * config.CACHE_SIZE_SHARES[name])
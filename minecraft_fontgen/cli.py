@@ -1,7 +1,7 @@
 import argparse
 import os
 
-from minecraft_fontgen.config import OUTPUT_DIR, OPENTYPE, FONT_STYLES
+from minecraft_fontgen.config import OUTPUT_DIR, OPENTYPE, FONT_STYLES, CACHE_DIR, CACHE_MAX_SIZE, MINECRAFT_DIR, TRACE_JOBS, STREAM_GLYPHS
 
 VALID_STYLES = {"regular", "bold", "italic", "bolditalic", "galactic", "illageralt"}
 
@@ -24,7 +24,8 @@ def _load_env_file(path=".env"):
 
 
 def parse_args():
-    """Parses CLI arguments with env var fallbacks. Returns (silent, output_dir, output_fonts, mc_version, use_cff, output_ext, validate)."""
+    """Parses CLI arguments with env var fallbacks. Returns (silent, output_dir, output_fonts, mc_version, use_cff, output_ext, validate, cache_dir, cache_size,
+    minecraft_dir, offline, jobs, stream)."""
     _load_env_file()
 
     parser = argparse.ArgumentParser(description="Minecraft bitmap font to OpenType/TrueType converter.")
@@ -40,6 +41,21 @@ def parse_args():
                         help="Font type: opentype/otf or truetype/ttf (default: opentype)")
     parser.add_argument("--validate", action="store_true", default=None,
                         help="Run FontForge validation on generated fonts (requires fontforge)")
+    parser.add_argument("--cache-dir", type=str, default=None,
+                        help=f"Persistent download cache directory (default: {CACHE_DIR})")
+    parser.add_argument("--cache-size", type=int, default=None,
+                        help=f"Total cache size cap in MB, split between the cached object, unifont, contour and HTTP stores; "
+                             f"least recently used entries are evicted (default: {CACHE_MAX_SIZE // (1024 * 1024)})")
+    parser.add_argument("--no-cache", action="store_true", default=None,
+                        help="Disable the persistent download cache")
+    parser.add_argument("--minecraft-dir", type=str, default=None,
+                        help="Local .minecraft installation or asset mirror to read versions, JARs and assets from")
+    parser.add_argument("--offline", action="store_true", default=None,
+                        help="Never use the network (requires --minecraft-dir, or a cache warmed by an earlier online run of the same version)")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help=f"Worker processes for contour tracing, 0 for one per CPU core (default: {TRACE_JOBS})")
+    parser.add_argument("--stream", action="store_true", default=None,
+                        help="Trace, scale and draw glyphs in codepoint chunks to lower peak memory")
 
     args = parser.parse_args()
 
@@ -113,4 +129,71 @@ def parse_args():
     else:
         validate = False
 
-    return silent, output_dir, output_fonts, mc_version, use_cff, output_ext, validate
+    # --- cache ---
+    if args.no_cache is not None and args.no_cache:
+        cache_dir = None
+    elif args.cache_dir is not None:
+        cache_dir = args.cache_dir
+    elif os.environ.get("FONTGEN_NO_CACHE", "").lower() in ("1", "true", "yes"):
+        cache_dir = None
+    elif os.environ.get("FONTGEN_CACHE_DIR"):
+        cache_dir = os.environ["FONTGEN_CACHE_DIR"]
+    else:
+        cache_dir = CACHE_DIR
+
+    raw_cache_size = None
+    if args.cache_size is not None:
+        raw_cache_size = args.cache_size
+    elif os.environ.get("FONTGEN_CACHE_SIZE"):
+        raw_cache_size = os.environ["FONTGEN_CACHE_SIZE"]
+
+    if raw_cache_size is not None:
+        if not str(raw_cache_size).strip().isdigit():
+            parser.error(f"Invalid cache size: {raw_cache_size}. Expected a whole number of MB (0 for no cap)")
+        cache_size = int(raw_cache_size) * 1024 * 1024
+    else:
+        cache_size = CACHE_MAX_SIZE
+
+    # --- local sources ---
+    if args.minecraft_dir is not None:
+        minecraft_dir = args.minecraft_dir
+    elif os.environ.get("FONTGEN_MINECRAFT_DIR"):
+        minecraft_dir = os.environ["FONTGEN_MINECRAFT_DIR"]
+    else:
+        minecraft_dir = MINECRAFT_DIR
+
+    if minecraft_dir is not None:
+        minecraft_dir = os.path.expanduser(minecraft_dir)
+        if not os.path.isdir(minecraft_dir):
+            parser.error(f"Invalid minecraft directory: {minecraft_dir}")
+
+    if args.offline is not None and args.offline:
+        offline = True
+    elif os.environ.get("FONTGEN_OFFLINE", "").lower() in ("1", "true", "yes"):
+        offline = True
+    else:
+        offline = False
+
+    # --- jobs ---
+    raw_jobs = None
+    if args.jobs is not None:
+        raw_jobs = args.jobs
+    elif os.environ.get("FONTGEN_JOBS"):
+        raw_jobs = os.environ["FONTGEN_JOBS"]
+
+    if raw_jobs is not None:
+        if not str(raw_jobs).strip().isdigit():
+            parser.error(f"Invalid jobs: {raw_jobs}. Expected a whole number of processes (0 for one per CPU core)")
+        jobs = int(raw_jobs)
+    else:
+        jobs = TRACE_JOBS
+
+    # --- stream ---
+    if args.stream is not None and args.stream:
+        stream = True
+    elif os.environ.get("FONTGEN_STREAM", "").lower() in ("1", "true", "yes"):
+        stream = True
+    else:
+        stream = STREAM_GLYPHS
+
+    return silent, output_dir, output_fonts, mc_version, use_cff, output_ext, validate, cache_dir, cache_size, minecraft_dir, offline, jobs, stream
@@ -7,6 +7,14 @@ from math import atan
 SILENT_LOG = False # True to disable logging
 OUTPUT_DIR = "output"
 OPENTYPE = True # False for TrueType
+CACHE_DIR = "cache" # Persistent download cache, kept across runs (None to disable)
+CACHE_MAX_SIZE = 512 * 1024 * 1024 # Total cache size cap in bytes, split between namespaces, least recently used entries are evicted first
+MINECRAFT_DIR = None # Local .minecraft installation or mirror with the same layout (versions/, assets/), checked before the network
+OFFLINE = False # True to never use the network (everything must come from MINECRAFT_DIR or the cache)
+MANIFEST_TTL = 10 * 60 # Seconds a cached version manifest is trusted before it is revalidated (pinned versions never revalidate)
+PARTIAL_JAR_DOWNLOAD = True # Fetch only the font entries of client.jar via HTTP range requests (False for a full download)
+TRACE_JOBS = 1 # Worker processes used to trace glyph contours (1 traces in-process)
+STREAM_GLYPHS = False # True to trace, scale and draw glyphs in codepoint chunks instead of building the whole glyph map first
 
 # ==================================
 # === FONT DETAILS / DO NOT EDIT ===
@@ -40,6 +48,14 @@ MINECRAFT_JSON_FILE = f"{MINECRAFT_JAR_DIR}/font/include/default.json"
 UNIFONT_PATH = "minecraft/font/include/unifont.json"
 TEXTURE_PATH = f"{MINECRAFT_JAR_DIR}/textures/font"
 VALIDATE_SCRIPT = "validate_font.py"
+DOWNLOAD_WORKERS = 4 # Concurrent downloads (unifont ZIPs) sharing the pooled HTTP session
+HTTP_RETRIES = 3 # Retries for failed connections and 429/5xx responses, with exponential backoff
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024 # Chunk size for streamed downloads (client.jar)
+RANGE_TAIL_SIZE = 64 * 1024 # Bytes read from the end of client.jar to locate the ZIP central directory
+RANGE_BLOCK_SIZE = 64 * 1024 # Minimum range request size, also the gap below which font entry ranges are merged
+TRACE_CHUNK_SIZE = 256 # Bitmaps sent to a tracing worker process per task
+STREAM_CHUNK_SIZE = 2048 # Codepoints traced, scaled and drawn together when streaming glyphs (--stream)
+CACHE_SIZE_SHARES = {"objects": 0.3, "unifont": 0.15, "contours": 0.5, "http": 0.05} # Split of CACHE_MAX_SIZE between cache namespaces
 
 # Font Styles (toggle "enabled" to include/exclude a style)
 FONT_STYLES = [
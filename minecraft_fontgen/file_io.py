@@ -1,14 +1,26 @@
+import hashlib
+import json
 import math
 import os
 import shutil
 import sys
+import zlib
 import numpy as np
 
 from collections import defaultdict, deque, OrderedDict
+from itertools import repeat
 from tqdm import tqdm
 from PIL import Image
-from minecraft_fontgen.config import ASCENT, COLUMNS_PER_ROW, DEFAULT_GLYPH_SIZE, OUTPUT_DIR, MINECRAFT_JAR_DIR, WORK_DIR, UNITS_PER_EM, TEXTURE_PATH, FONT_STYLES
-from minecraft_fontgen.functions import get_unicode_codepoint, in_unifont_ranges, log, is_silent, parse_json
+from minecraft_fontgen.config import ASCENT, COLUMNS_PER_ROW, DEFAULT_GLYPH_SIZE, OUTPUT_DIR, MINECRAFT_JAR_DIR, WORK_DIR, UNITS_PER_EM, TEXTURE_PATH, FONT_STYLES, TRACE_CHUNK_SIZE, STREAM_CHUNK_SIZE
+from minecraft_fontgen.cache import get_blob_cache
+from minecraft_fontgen.functions import get_unicode_codepoint, get_process_pool, in_unifont_ranges, log, is_silent, parse_json
+from minecraft_fontgen.glyph.glyph_tile import GlyphTile
+from minecraft_fontgen.unifont_glyphs import UnifontGlyphs
+
+TRACER_VERSION = 1 # bump whenever _trace_bitmap_contours2 output changes, part of every trace cache key
+
+_trace_memo = {}
+trace_memo_stats = {"hits": 0, "cached": 0, "misses": 0}
 
 
 # ==========================================
@@ -168,7 +180,8 @@ def parse_json_providers(byte_data):
     return providers
 
 def slice_provider_tiles(providers):
-    """Slices each provider's bitmap PNG into individual glyph tiles with contour and SVG data."""
+    """Slices each provider's bitmap PNG into individual glyph tiles, tracing each into a Regular and
+    a Bold GlyphTile (tile["glyphs"]) and writing SVG/BMP debug output."""
     log(f"→ ✂️ Slicing bitmap providers into tiles...")
 
     debug_svg_regular = any(s.get("debug", {}).get("svg") for s in FONT_STYLES if s["pixel_style"] == "Regular")
@@ -176,6 +189,9 @@ def slice_provider_tiles(providers):
     debug_svg = debug_svg_regular or debug_svg_bold
     debug_bmp = any(s.get("debug", {}).get("bmp") for s in FONT_STYLES)
 
+    bitmap_grids = []
+    bold_grids = []
+
     for provider in providers:
         bitmap = binarize_provider_bitmap(provider)
         tiles = []
@@ -183,6 +199,9 @@ def slice_provider_tiles(providers):
         # Calculate tile dimensions
         width, height = bitmap.size
         glyph_width = width / COLUMNS_PER_ROW
+        rows = -(-len(provider["chars"]) // COLUMNS_PER_ROW)
+        tile_views = _atlas_tile_views(bitmap, int(glyph_width), provider.get("height"), rows)
+        bold_views = embolden_bitmap(tile_views)
 
         with tqdm(enumerate(provider["chars"]), total=len(provider["chars"]),
                   desc=f" → 🔣 {provider['file_name']}", unit="tile",
@@ -208,27 +227,40 @@ def slice_provider_tiles(providers):
                     "output": f"{provider['output']}/tiles/{tile_row:02}_{tile_column:02}_{codepoint:04X}"
                 }
                 tiles.append(tile)
+                bitmap_grids.append(tile_views[tile_row, tile_column])
+                bold_grids.append(bold_views[tile_row, tile_column])
 
-                # Crop tile bitmap from full bitmap
-                tile["bitmap"] = crop_tile(bitmap, tile, save=debug_bmp)
-
-                # Trace contours for regular and bold styles
-                tile["pixels"] = trace_tile_contours(tile)
-
-                # Create svg debug output
-                tile["svg"] = None
-                if debug_svg:
-                    if not debug_bmp:
-                        os.makedirs(tile["output"], exist_ok=True)
-                    svg = {}
-                    if debug_svg_regular:
-                        svg["regular"] = _write_tile_svg(tile["pixels"]["regular"]["grid"], tile["size"], f"{tile['output']}/regular.svg")
-                    if debug_svg_bold:
-                        svg["bold"] = _write_tile_svg(tile["pixels"]["bold"]["grid"], tile["size"], f"{tile['output']}/bold.svg")
-                    tile["svg"] = svg
+                # Crop and save tile bitmap image from full bitmap (bmp debug output only)
+                if debug_bmp:
+                    crop_tile(bitmap, tile)
 
         provider["tiles"] = tiles
 
+    # Trace contours for regular and (already emboldened) bold styles in one batch (in parallel with --jobs)
+    all_tiles = [tile for provider in providers for tile in provider["tiles"]]
+    with tqdm(total=len(all_tiles) * 2, desc=" → 🔣 Tracing", unit="tile",
+              ncols=80, leave=False, file=sys.stdout, disable=is_silent()) as trace_progress:
+        traced = trace_bitmaps(bitmap_grids + bold_grids, False, trace_progress)
+    regular, bold = traced[:len(all_tiles)], traced[len(all_tiles):]
+    flush_trace_cache()
+
+    for tile, regular_pixels, bold_pixels in zip(all_tiles, regular, bold):
+        # Create svg debug output
+        svg = {}
+        if debug_svg:
+            if not debug_bmp:
+                os.makedirs(tile["output"], exist_ok=True)
+            if debug_svg_regular:
+                svg["regular"] = _write_tile_svg(regular_pixels["grid"], tile["size"], f"{tile['output']}/regular.svg")
+            if debug_svg_bold:
+                svg["bold"] = _write_tile_svg(bold_pixels["grid"], tile["size"], f"{tile['output']}/bold.svg")
+
+        # Keep only what scaling and drawing need, the traced grids and bitmaps can be freed
+        tile["glyphs"] = {
+            style: GlyphTile(tile["unicode"], tile["codepoint"], tile["size"], tile["ascent"], "provider", pixel_data, svg.get(style))
+            for style, pixel_data in (("regular", regular_pixels), ("bold", bold_pixels))
+        }
+
     total_tiles = sum(len(p["tiles"]) for p in providers)
     log(f" → 🔢 Sliced {total_tiles} glyphs across {len(providers)} providers...")
 
@@ -270,18 +302,28 @@ def crop_tile(bitmap, tile, save=True):
         bitmap["image"].save(bitmap["file"])
     return bitmap
 
-def trace_tile_contours(tile):
-    """Traces contours from a tile's bitmap for both regular and bold styles."""
-    return {
-        "regular": _trace_tile_style(tile, False),
-        "bold": _trace_tile_style(tile, True)
-    }
-
-def _trace_tile_style(tile, bold: bool = False):
-    """Converts a tile's PIL bitmap image to a binary numpy grid and traces its contours."""
-    bitmap_grid = np.array(tile["bitmap"]["image"].convert("L"), dtype=int)
-    bitmap_grid = (bitmap_grid < 128).astype(np.uint8)
-    return _trace_bitmap_contours2(bitmap_grid, bold)
+def _atlas_tile_views(bitmap, tile_width, tile_height, rows):
+    """Converts a binarized provider bitmap to a binary uint8 grid once (1 = ink) and returns a zero-copy
+    (rows, COLUMNS_PER_ROW, tile_height, tile_width) view of its tiles for tracing.
+    Like PIL crops of the 1-bit image, tiles reaching past the image edge read the missing pixels as ink."""
+    atlas = (np.asarray(bitmap.convert("L")) < 128).astype(np.uint8)
+    atlas_height, atlas_width = rows * tile_height, COLUMNS_PER_ROW * tile_width
+
+    if atlas.shape[0] < atlas_height or atlas.shape[1] < atlas_width:
+        padded = np.ones((max(atlas_height, atlas.shape[0]), max(atlas_width, atlas.shape[1])), dtype=np.uint8)
+        padded[:atlas.shape[0], :atlas.shape[1]] = atlas
+        atlas = padded
+
+    tiles = atlas[:atlas_height, :atlas_width].reshape(rows, tile_height, COLUMNS_PER_ROW, tile_width)
+    return tiles.swapaxes(1, 2)
+
+def embolden_bitmap(bitmap_grid):
+    """Returns the bold variant of a binary bitmap grid, with every ink pixel copied one column to the right.
+    Works on any stack of grids (e.g. a whole atlas of tile views) along its last two axes, one shift-and-OR
+    for all of them; pixels never spill into the next grid and the rightmost column's ink is dropped."""
+    bold_grid = bitmap_grid.copy()
+    bold_grid[..., 1:] |= bitmap_grid[..., :-1]
+    return bold_grid
 
 def _trace_bitmap_contours(bitmap_grid, bold: bool = False):
     """Traces contours from a binary bitmap grid using flood-fill labeling and right-hand edge
@@ -450,8 +492,247 @@ def _trace_bitmap_contours(bitmap_grid, bold: bool = False):
         "holes": {label: get_path_data(pixel_grid, label) for label in hole_labels}
     }
 
+def trace_bitmap_contours(bitmap_grid, bold: bool = False):
+    """Traces contours from a binary bitmap grid, memoized on the bitmap content.
+
+    Identical bitmaps (repeated unifont placeholders, reused accent bases, copied
+    lowercase tiles) are traced once and share the same contour data, so callers
+    must treat the result as read-only. Traces are also kept across runs in the
+    persistent "contours" cache, so only bitmaps whose pixels changed are traced
+    again. Cache hits don't apply the bold shift to bitmap_grid. The result is
+    compacted (see _compact_trace): it has no "bitmap" and its contours only
+    carry "corners".
+    """
+    key = _trace_key(bitmap_grid, bold)
+    pixel_data = _lookup_trace(key)
+    if pixel_data is None:
+        pixel_data = _store_trace(key, _trace_bitmap_contours2(bitmap_grid, bold))
+    return pixel_data
+
+def trace_bitmaps(bitmap_grids, bold: bool = False, progress=None):
+    """Traces a list of bitmap grids, returning their contour data in input order.
+
+    Memoized and cached like trace_bitmap_contours. The bitmaps that still need
+    tracing are deduplicated and, when more than one job is configured (--jobs),
+    sent to the worker process pool in TRACE_CHUNK_SIZE chunks. Results are merged
+    back in input order, so the output matches a serial run exactly. The input
+    grids are never modified. progress (a tqdm bar) is advanced per bitmap.
+    """
+    results = [None] * len(bitmap_grids)
+    pending = OrderedDict() # trace key -> (bitmap_grid, input indices)
+
+    for index, bitmap_grid in enumerate(bitmap_grids):
+        key = _trace_key(bitmap_grid, bold)
+        if key in pending:
+            trace_memo_stats["hits"] += 1
+            pending[key][1].append(index)
+            continue
+
+        pixel_data = _lookup_trace(key)
+        if pixel_data is None:
+            pending[key] = (bitmap_grid, [index])
+        else:
+            results[index] = pixel_data
+            if progress:
+                progress.update(1)
+
+    grids = [bitmap_grid for bitmap_grid, _ in pending.values()]
+    pool = get_process_pool() if len(grids) > TRACE_CHUNK_SIZE else None
+    if pool:
+        chunks = [grids[i:i + TRACE_CHUNK_SIZE] for i in range(0, len(grids), TRACE_CHUNK_SIZE)]
+        traced = (pixel_data for chunk in pool.map(_trace_chunk, chunks, repeat(bold)) for pixel_data in chunk)
+    else:
+        traced = (_trace_bitmap_contours2(bitmap_grid.copy(), bold) for bitmap_grid in grids)
+
+    for (key, (_, indices)), pixel_data in zip(pending.items(), traced):
+        pixel_data = _store_trace(key, pixel_data)
+        for index in indices:
+            results[index] = pixel_data
+        if progress:
+            progress.update(len(indices))
+
+    return results
+
+def _trace_chunk(bitmap_grids, bold):
+    """Traces a chunk of bitmap grids in a worker process (see trace_bitmaps)."""
+    return [_trace_bitmap_contours2(bitmap_grid, bold) for bitmap_grid in bitmap_grids]
+
+def _trace_key(bitmap_grid, bold):
+    """Returns the memo key identifying a trace: bitmap content, shape, dtype, bold flag and tracer version."""
+    return bitmap_grid.tobytes(), bitmap_grid.shape, bitmap_grid.dtype.str, bool(bold), TRACER_VERSION
+
+def _lookup_trace(key):
+    """Returns memoized or persistently cached contour data for a trace key, or None if it must be traced.
+    A cache entry that fails to decode is deleted, so the glyph is traced and stored again."""
+    pixel_data = _trace_memo.get(key)
+    if pixel_data is not None:
+        trace_memo_stats["hits"] += 1
+        return pixel_data
+
+    cache = get_blob_cache("contours")
+    cache_key = hashlib.sha1(repr(key).encode()).hexdigest()
+    cached = cache.get(cache_key) if cache else None
+    if cached is None:
+        return None
+
+    try:
+        pixel_data = _decode_trace(cached)
+    except (zlib.error, ValueError, KeyError):
+        cache.remove(cache_key) # corrupt entry, trace again
+        return None
+
+    trace_memo_stats["cached"] += 1
+    pixel_data = _trace_memo[key] = _compact_trace(pixel_data)
+    return pixel_data
+
+def _store_trace(key, pixel_data):
+    """Records freshly traced contour data in the persistent contour cache and, compacted, in the memo.
+    Returns the compacted contour data."""
+    trace_memo_stats["misses"] += 1
+
+    cache = get_blob_cache("contours")
+    if cache:
+        cache.put(hashlib.sha1(repr(key).encode()).hexdigest(), _encode_trace(pixel_data))
+
+    pixel_data = _trace_memo[key] = _compact_trace(pixel_data)
+    return pixel_data
+
+def _compact_trace(pixel_data):
+    """Drops the tracer output nothing downstream reads (the traced bitmap and each contour's full edge
+    loop), keeping the labeled grid for debug SVGs, the metrics and the contour corners."""
+    def compact_contours(contours):
+        return {label: {"corners": contour["corners"]} for label, contour in contours.items()}
+
+    return {
+        "grid": pixel_data["grid"],
+        "width": pixel_data["width"],
+        "lsb": pixel_data["lsb"],
+        "advance": pixel_data["advance"],
+        "paths": compact_contours(pixel_data["paths"]),
+        "holes": compact_contours(pixel_data["holes"])
+    }
+
+def flush_trace_cache():
+    """Commits pending writes to the persistent contour cache."""
+    cache = get_blob_cache("contours")
+    if cache:
+        cache.flush()
+
+def clear_trace_memo():
+    """Drops all memoized traces and resets the hit/miss counters."""
+    _trace_memo.clear()
+    trace_memo_stats.update(hits=0, cached=0, misses=0)
+
+def _encode_trace(pixel_data):
+    """Serializes tracer output as compressed JSON for the contour cache."""
+    def encode_contours(contours):
+        return [[label, contour["coords"], contour["corners"]] for label, contour in contours.items()]
+
+    return zlib.compress(json.dumps({
+        "bitmap": pixel_data["bitmap"].tobytes().hex(),
+        "bitmap_dtype": pixel_data["bitmap"].dtype.str,
+        "shape": pixel_data["grid"].shape,
+        "grid": pixel_data["grid"].astype("<i2").tobytes().hex(), # labels and the -999 sentinel fit in int16
+        "width": int(pixel_data["width"]),
+        "lsb": int(pixel_data["lsb"]),
+        "advance": int(pixel_data["advance"]),
+        "paths": encode_contours(pixel_data["paths"]),
+        "holes": encode_contours(pixel_data["holes"])
+    }, separators=(",", ":"), default=int).encode())
+
+def _decode_trace(data):
+    """Restores tracer output serialized by _encode_trace."""
+    trace = json.loads(zlib.decompress(data))
+
+    def decode_contours(contours):
+        return {label: {"coords": list(map(tuple, coords)), "corners": list(map(tuple, corners))}
+                for label, coords, corners in contours}
+
+    return {
+        "bitmap": np.frombuffer(bytes.fromhex(trace["bitmap"]), dtype=trace["bitmap_dtype"]).reshape(trace["shape"]).copy(),
+        "grid": np.frombuffer(bytes.fromhex(trace["grid"]), dtype="<i2").reshape(trace["shape"]).astype(int),
+        "width": trace["width"],
+        "lsb": trace["lsb"],
+        "advance": trace["advance"],
+        "paths": decode_contours(trace["paths"]),
+        "holes": decode_contours(trace["holes"])
+    }
+
+def _label_runs(mask, diagonal):
+    """Labels the connected components of a boolean mask using run-length encoding.
+
+    Each row is split into horizontal runs of set pixels, runs on adjacent rows are
+    joined when they touch (diagonally too when diagonal is True), and components are
+    resolved by vectorized min-label propagation over that run graph.
+    Returns (rows, starts, ends, component): runs in raster order with exclusive ends,
+    and each run's component index numbered in raster order of the component's first pixel.
+    """
+    height, width = mask.shape
+    padded = np.zeros((height, width + 2), dtype=np.int8)
+    padded[:, 1:-1] = mask
+    changes = np.diff(padded, axis=1)
+    rows, starts = np.nonzero(changes == 1)
+    _, ends = np.nonzero(changes == -1)
+
+    reach = 1 if diagonal else 0
+    touching = ((rows[:, None] + 1 == rows[None, :])
+                & (starts[:, None] < ends[None, :] + reach)
+                & (starts[None, :] < ends[:, None] + reach))
+    upper, lower = np.nonzero(touching)
+
+    # Each run converges to the lowest run index in its component, which is the component's first run
+    component = np.arange(len(rows))
+    while True:
+        merged = component.copy()
+        np.minimum.at(merged, upper, component[lower])
+        np.minimum.at(merged, lower, component[upper])
+        merged = merged[merged]
+        if np.array_equal(merged, component):
+            break
+        component = merged
+
+    _, component = np.unique(component, return_inverse=True)
+    return rows, starts, ends, component.reshape(-1)
+
+def _paint_runs(pixel_grid, rows, starts, ends, values):
+    """Writes values[i] into every pixel of run i."""
+    lengths = ends - starts
+    if not len(lengths):
+        return
+    first = rows * pixel_grid.shape[1] + starts
+    offsets = np.repeat(first - np.cumsum(lengths) + lengths, lengths) + np.arange(lengths.sum())
+    pixel_grid.flat[offsets] = np.repeat(values, lengths)
+
+def _label_pixel_grid(bitmap_grid):
+    """Labels a binary bitmap for contour tracing.
+
+    Glyph groups are labeled 1 and above (8-connectivity), the outer background
+    (connected to the border) 0 and interior holes -1 and below (4-connectivity).
+    Labels are numbered in raster order of each region's first pixel, and pixels
+    that are neither 0 nor 1 stay -999.
+    Returns (pixel_grid, path_labels, hole_labels).
+    """
+    height, width = bitmap_grid.shape
+    pixel_grid = np.full((height, width), -999, dtype=int)
+
+    rows, starts, ends, component = _label_runs(bitmap_grid == 1, diagonal=True)
+    _paint_runs(pixel_grid, rows, starts, ends, component + 1)
+    path_labels = list(range(1, int(component.max(initial=-1)) + 2))
+
+    rows, starts, ends, component = _label_runs(bitmap_grid == 0, diagonal=False)
+    component_count = int(component.max(initial=-1)) + 1
+    on_border = (rows == 0) | (rows == height - 1) | (starts == 0) | (ends == width)
+    outer = np.zeros(component_count, dtype=bool)
+    outer[component[on_border]] = True
+
+    hole_numbers = np.cumsum(~outer) # holes are numbered in raster order, skipping the background
+    _paint_runs(pixel_grid, rows, starts, ends, np.where(outer, 0, -hole_numbers)[component])
+    hole_labels = list(range(-1, -int(np.count_nonzero(~outer)) - 1, -1))
+
+    return pixel_grid, path_labels, hole_labels
+
 def _trace_bitmap_contours2(bitmap_grid, bold: bool = False):
-    """Traces contours from a binary bitmap grid using flood-fill labeling and multi-loop
+    """Traces contours from a binary bitmap grid using connected-component labeling and multi-loop
     boundary-edge extraction. Unlike _trace_bitmap_contours which uses a single right-hand
     rule traversal per label (capturing only one loop), this function collects ALL boundary
     edges for each labeled region and extracts every closed loop, correctly handling
@@ -469,147 +750,109 @@ def _trace_bitmap_contours2(bitmap_grid, bold: bool = False):
     _trace_bitmap_contours: paths and holes dicts map integer keys to dicts with
     "coords" (full-edge vertex loop) and "corners" (direction-change vertices only).
     """
-    height, width = bitmap_grid.shape
-    pixel_grid = np.full((height, width), -999, dtype=int)
-
     if bold:
-        for i in range(bitmap_grid.shape[0] - 1, -1, -1):
-            for j in range(bitmap_grid.shape[1] - 1, -1, -1):
-                if bitmap_grid[i, j] == 1 and j + 1 < bitmap_grid.shape[1] and bitmap_grid[i, j + 1] == 0:
-                    bitmap_grid[i, j + 1] = 1
-
-    def update_grid(queue, bit_match, next_label, neighbours=None):
-        while queue:
-            cy, cx = queue.popleft()
-            if pixel_grid[cy, cx] == -999:
-                pixel_grid[cy, cx] = next_label
-            for dy, dx in neighbours or [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                ny, nx = cy + dy, cx + dx
-                if 0 <= ny < height and 0 <= nx < width:
-                    if bitmap_grid[ny, nx] == bit_match and pixel_grid[ny, nx] == -999:
-                        pixel_grid[ny, nx] = next_label
-                        queue.append((ny, nx))
+        bitmap_grid[...] = embolden_bitmap(bitmap_grid)
 
-    def label_groups(bit_match, increment, neighbours=None):
-        next_label = 0 + increment
-        labels = []
-        for y in range(height):
-            for x in range(width):
-                if bitmap_grid[y, x] == bit_match and pixel_grid[y, x] == -999:
-                    q = deque()
-                    q.append((y, x))
-                    pixel_grid[y, x] = next_label
-                    labels.append(next_label)
-                    update_grid(q, bit_match, next_label, neighbours)
-                    next_label += increment
-        return labels
-
-    # Label glyph groups as 1 and above (8-connectivity)
-    path_labels = label_groups(1, 1, [(-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)])
-
-    # Flood-fill outer background as 0
-    q = deque()
-    for x in range(width):
-        if bitmap_grid[0, x] == 0: q.append((0, x))
-        if bitmap_grid[height - 1, x] == 0: q.append((height - 1, x))
-    for y in range(height):
-        if bitmap_grid[y, 0] == 0: q.append((y, 0))
-        if bitmap_grid[y, width - 1] == 0: q.append((y, width - 1))
-    update_grid(q, 0, 0)
+    # Label glyph groups as 1 and above, the outer background as 0 and interior holes as -1 and below
+    pixel_grid, path_labels, hole_labels = _label_pixel_grid(bitmap_grid)
 
-    # Label interior holes as -1 and below (4-connectivity)
-    hole_labels = label_groups(0, -1)
+    stride = pixel_grid.shape[1] + 1 # lattice vertex (x, y) has the integer id y * stride + x
 
-    def _get_boundary_edges(pixel_grid, label):
-        """Collects all CW-directed boundary edges for a labeled region.
+    def _get_boundary_edges(pixel_grid):
+        """Collects all CW-directed boundary edges of every labeled region.
 
-        Each pixel contributes 4 edges going CW around its square. Edges shared
-        by two same-label pixels cancel out, leaving only boundary edges.
-        Returns pixel coords list and the set of directed boundary edges.
+        Each pixel contributes 4 edges going CW around its square, and a side is
+        kept only where the neighbouring pixel has a different label (edges shared
+        by two same-label pixels cancel out). Sides are found for all labels at once
+        by comparing the grid against copies of itself shifted by one pixel.
+        Returns {label: (E, 2) array of (start, end) vertex ids sorted by start vertex}.
         """
-        coords = [(int(x), int(y)) for y, x in np.argwhere(pixel_grid == label)]
-        label_set = set(coords)
-
-        def pixel_edges(x, y):
-            return [((x, y), (x + 1, y)),
-                    ((x + 1, y), (x + 1, y + 1)),
-                    ((x + 1, y + 1), (x, y + 1)),
-                    ((x, y + 1), (x, y))]
-
-        edge_count = {}
-        for x, y in label_set:
-            for edge in pixel_edges(x, y):
-                rev = edge[::-1]
-                if rev in edge_count:
-                    edge_count[rev] -= 1
-                else:
-                    edge_count[edge] = edge_count.get(edge, 0) + 1
-
-        boundary = {e for e, count in edge_count.items() if count > 0}
-        return coords, boundary
+        height, width = pixel_grid.shape
+        padded = np.full((height + 2, width + 2), -1000, dtype=pixel_grid.dtype)
+        padded[1:-1, 1:-1] = pixel_grid
+        ys, xs = np.indices((height, width))
+        vertex = ys * stride + xs # top-left vertex of each pixel
+
+        sides = (
+            (padded[:-2, 1:-1], 0, 1),                   # top: (x, y) -> (x + 1, y)
+            (padded[1:-1, 2:], 1, stride + 1),           # right: (x + 1, y) -> (x + 1, y + 1)
+            (padded[2:, 1:-1], stride + 1, stride),      # bottom: (x + 1, y + 1) -> (x, y + 1)
+            (padded[1:-1, :-2], stride, 0),              # left: (x, y + 1) -> (x, y)
+        )
+        labels, starts, ends = [], [], []
+        for neighbour, start_offset, end_offset in sides:
+            boundary = pixel_grid != neighbour
+            labels.append(pixel_grid[boundary])
+            starts.append(vertex[boundary] + start_offset)
+            ends.append(vertex[boundary] + end_offset)
+
+        labels, starts, ends = np.concatenate(labels), np.concatenate(starts), np.concatenate(ends)
+        order = np.lexsort((ends, starts, labels))
+        labels, edges = labels[order], np.stack((starts[order], ends[order]), axis=1)
+
+        unique_labels, first = np.unique(labels, return_index=True)
+        return dict(zip(unique_labels.tolist(), np.split(edges, first[1:])))
+
+    def _get_pixel_coords(pixel_grid, label):
+        """Returns the (x, y) pixel coords of a label, used when no loop can be extracted."""
+        return [(int(x), int(y)) for y, x in np.argwhere(pixel_grid == label)]
+
+    def _edge_tuples(boundary):
+        """Converts an edge array to a set of ((x0, y0), (x1, y1)) vertex tuples."""
+        return {((a % stride, a // stride), (b % stride, b // stride)) for a, b in boundary.tolist()}
+
+    # Outgoing steps to try per arrival step (vertex id delta), tightest CW turn first:
+    # turn, straight on, turn the other way. Reversing is never needed (the reverse of a
+    # boundary edge is never a boundary edge of the same label).
+    turn_order = {
+        1: (-stride, 1, stride),         # arrived moving right: up, right, down
+        stride: (1, stride, -1),         # arrived moving down: right, down, left
+        -1: (stride, -1, -stride),       # arrived moving left: down, left, up
+        -stride: (-1, -stride, 1),       # arrived moving up: left, up, right
+    }
 
     def _extract_all_loops(boundary_edges):
-        """Extracts ALL closed loops from the set of CW boundary edges.
+        """Extracts ALL closed loops from the array of CW boundary edges.
 
-        Builds an adjacency map from edge endpoints, then repeatedly picks an
-        unvisited edge and traces a loop by always taking the tightest CW turn
-        at each vertex (smallest clockwise angle from the reverse of the arrival
-        direction).
+        Unvisited edges are taken in start-vertex order (topmost-leftmost first) and
+        each one starts a loop that always takes the tightest CW turn at each vertex
+        (smallest clockwise angle from the reverse of the arrival direction). On the
+        pixel lattice there are only four directions, so the turn is picked by trying
+        the outgoing steps in turn_order rather than comparing angles.
 
         Only the original CW boundary edges are used (no CCW reverse edges).
         Returns a list of loops, where each loop is a list of vertex coordinates.
         """
-        if not boundary_edges:
+        if not len(boundary_edges):
             return []
 
-        # Build adjacency: vertex -> set of outgoing edge endpoints
-        adj = defaultdict(set)
-        for (a, b) in boundary_edges:
-            adj[a].add(b)
-
-        remaining = set(boundary_edges)
+        # Edges are keyed as start * vertex_count + end, boundary_edges are sorted by (start, end)
+        vertex_count = stride * (pixel_grid.shape[0] + 1)
+        ordered_edges = (boundary_edges[:, 0] * vertex_count + boundary_edges[:, 1]).tolist()
+        remaining = set(ordered_edges)
         loops = []
 
-        while remaining:
-            # Pick the topmost-leftmost starting edge for determinism
-            start_edge = min(remaining, key=lambda e: (e[0][1], e[0][0]))
-            loop = [start_edge[0]]
-            prev, curr = start_edge
+        for start_edge in ordered_edges:
+            if start_edge not in remaining:
+                continue
+
             remaining.discard(start_edge)
+            prev, curr = divmod(start_edge, vertex_count)
+            loop = [prev]
 
-            for _ in range(len(boundary_edges) + 1):
+            for _ in range(len(ordered_edges) + 1):
                 loop.append(curr)
 
-                # Compute arrival direction (reversed) to measure CW turns from
-                arrival_dx = curr[0] - prev[0]
-                arrival_dy = curr[1] - prev[1]
-                reverse_angle = math.atan2(-(-arrival_dy), -arrival_dx)
-
-                # Find all outgoing edges from curr that are still in remaining
-                candidates = [n for n in adj[curr] if (curr, n) in remaining]
-
-                if not candidates:
+                # Take the first remaining outgoing edge in turn order
+                for step in turn_order[curr - prev]:
+                    edge = curr * vertex_count + curr + step
+                    if edge in remaining:
+                        break
+                else:
                     break
 
-                # Pick the tightest CW turn: smallest positive angle difference
-                # from reverse_angle going clockwise
-                best = None
-                best_diff = None
-                for n in candidates:
-                    dx = n[0] - curr[0]
-                    dy = n[1] - curr[1]
-                    out_angle = math.atan2(-dy, dx)
-                    diff = reverse_angle - out_angle
-                    while diff <= 0:
-                        diff += 2 * math.pi
-                    while diff > 2 * math.pi:
-                        diff -= 2 * math.pi
-                    if best_diff is None or diff < best_diff:
-                        best_diff = diff
-                        best = n
-
-                remaining.discard((curr, best))
-                prev, curr = curr, best
+                remaining.discard(edge)
+                prev, curr = curr, curr + step
 
                 if curr == loop[0]:
                     break
@@ -619,7 +862,7 @@ def _trace_bitmap_contours2(bitmap_grid, bold: bool = False):
                 loop.pop()
 
             if len(loop) >= 3:
-                loops.append(loop)
+                loops.append([(v % stride, v // stride) for v in loop])
 
         return loops
 
@@ -727,18 +970,18 @@ def _trace_bitmap_contours2(bitmap_grid, bold: bool = False):
         directly. If multiple loops are found (pinch points), falls back to
         half-edge face traversal to produce the correctly indented boundary.
         """
-        coords, boundary = _get_boundary_edges(pixel_grid, label)
+        boundary = boundaries.get(label, no_edges)
         loops = _extract_all_loops(boundary)
 
         if not loops:
-            return {"coords": coords, "corners": []}
+            return {"coords": _get_pixel_coords(pixel_grid, label), "corners": []}
 
         if len(loops) == 1:
             corners = _extract_corners(loops[0])
             return {"coords": loops[0], "corners": corners}
 
         # Multiple loops: use half-edge merge to get the indented boundary
-        merged = _merge_loops_via_halfedge(boundary)
+        merged = _merge_loops_via_halfedge(_edge_tuples(boundary))
         if merged:
             corners = _extract_corners(merged)
             return {"coords": merged, "corners": corners}
@@ -754,29 +997,31 @@ def _trace_bitmap_contours2(bitmap_grid, bold: bool = False):
     # Hole labels: if multiple loops exist, merge via half-edge to produce
     # the indented boundary that traces around path-pixel islands (e.g. the
     # battlements inside U+26C3's Hole -4). Single-loop holes use the loop directly.
+    boundaries = _get_boundary_edges(pixel_grid)
+    no_edges = np.empty((0, 2), dtype=int)
+
     paths = {}
     for label in path_labels:
-        coords, boundary = _get_boundary_edges(pixel_grid, label)
-        loops = _extract_all_loops(boundary)
+        loops = _extract_all_loops(boundaries.get(label, no_edges))
         if loops:
             loops.sort(key=_loop_area, reverse=True)
             corners = _extract_corners(loops[0])
             paths[label] = {"coords": loops[0], "corners": corners}
         else:
-            paths[label] = {"coords": coords, "corners": []}
+            paths[label] = {"coords": _get_pixel_coords(pixel_grid, label), "corners": []}
 
     holes = {}
     for label in hole_labels:
-        coords, boundary = _get_boundary_edges(pixel_grid, label)
+        boundary = boundaries.get(label, no_edges)
         loops = _extract_all_loops(boundary)
         if not loops:
-            holes[label] = {"coords": coords, "corners": []}
+            holes[label] = {"coords": _get_pixel_coords(pixel_grid, label), "corners": []}
         elif len(loops) == 1:
             corners = _extract_corners(loops[0])
             holes[label] = {"coords": loops[0], "corners": corners}
         else:
             # Multiple loops: merge via half-edge to get indented boundary
-            merged = _merge_loops_via_halfedge(boundary)
+            merged = _merge_loops_via_halfedge(_edge_tuples(boundary))
             if merged:
                 corners = _extract_corners(merged)
                 holes[label] = {"coords": merged, "corners": corners}
@@ -831,105 +1076,152 @@ def _write_tile_svg(grid, size, output_file):
 
 
 # ==========================================
-# === Stage 3: Build unified glyph map
+# === Stage 3: Build (or stream) unified glyph map
 # ==========================================
 
-def build_glyph_map(providers, unifont_glyphs):
-    """Builds a unified glyph map merging provider glyphs (priority) with unifont fallbacks and alternate fonts."""
+def build_glyph_map(providers, unifont_glyphs, alternates=None):
+    """Builds a unified glyph map merging provider glyphs (priority) with unifont fallbacks and alternate fonts.
+    Alternate font tiles are traced here unless already traced by parse_alternate_fonts.
+    Returns {pixel style: OrderedDict(codepoint: tile)}, every tile scaled (see GlyphMapStream)."""
     log(f"🧩 Building unified glyph map...")
-    glyph_map = {"Regular": OrderedDict(), "Bold": OrderedDict()}
-
-    # 1. Add provider glyphs (priority - added first)
-    for provider in providers:
-        for tile in provider["tiles"]:
-            cp = tile["codepoint"]
-            for style_key in ("Regular", "Bold"):
-                style = style_key.lower()
-                flat_tile = {
-                    "unicode": tile["unicode"],
-                    "codepoint": cp,
-                    "size": tile["size"],
-                    "ascent": tile["ascent"],
-                    "pixels": tile["pixels"][style],
-                    "svg": tile["svg"].get(style) if tile.get("svg") else None,
-                    "source": "provider"
-                }
-                glyph_map[style_key][cp] = flat_tile
-
-    provider_count = len(glyph_map["Regular"])
-    log(f"→ 🔣 {provider_count} provider glyphs (priority)")
-
-    # 2. Add unifont glyphs (fallback - skip if codepoint exists)
-    if unifont_glyphs:
-        log(f"→ 🔣 Processing unifont fallback glyphs...")
-        for style_key, bold in [("Regular", False), ("Bold", True)]:
-            unifont_tiles = trace_unifont_tiles(unifont_glyphs, bold)
-            for cp, tile in unifont_tiles.items():
-                if cp not in glyph_map[style_key]:
-                    glyph_map[style_key][cp] = tile
+    stream = GlyphMapStream(providers, unifont_glyphs, alternates, chunk_size=None)
+    glyph_map = {style_key: OrderedDict() for style_key in stream.styles}
+    for chunk in stream:
+        for style_key, tiles in chunk.items():
+            glyph_map[style_key].update(tiles)
 
-    # 3. Sort by codepoint
-    for key in glyph_map:
-        glyph_map[key] = OrderedDict(sorted(glyph_map[key].items()))
-
-    # 4. Process alternate fonts (Galactic, Illageralt)
-    for style in FONT_STYLES:
-        if "json_file" not in style or not style["enabled"]:
-            continue
-        overlay = _process_alternate_font(style, glyph_map["Regular"])
-        if overlay is not None:
-            glyph_map[style["name"]] = overlay
+    return glyph_map
 
-    # 5. Print summary
-    unifont_count = sum(1 for t in glyph_map["Regular"].values() if t["source"] == "unifont")
-    total = len(glyph_map["Regular"])
-    log(f"→ 🔢 Prepared {total} glyphs ({provider_count} provider, {unifont_count} unifont)")
+class GlyphMapStream:
+    """The unified glyph map, produced lazily in codepoint order for streaming into the font files (--stream).
 
-    # 6. Pre-compute scaling
-    precompute_glyph_scaling(glyph_map)
+    Provider glyphs take priority, unifont glyphs fill in the remaining codepoints
+    and alternate fonts (Galactic, Illageralt) overlay the Regular style. Iterating
+    yields chunks of up to chunk_size consecutive codepoints shaped like a glyph map,
+    {pixel style: OrderedDict(codepoint: tile)}. The unifont fallbacks of each chunk
+    are traced and every tile scaled only when the chunk is reached, and the trace
+    memo is dropped after it, so at most one chunk of traced, scaled tiles is held
+    at a time. A chunk_size of None yields the whole map as one chunk.
+    """
 
-    return glyph_map
+    def __init__(self, providers, unifont_glyphs, alternates=None, chunk_size=STREAM_CHUNK_SIZE):
+        """Plans the glyph map from sliced providers, parsed unifont glyphs and traced alternate fonts
+        (traced here if None). Provider tiles must already be traced (slice_provider_tiles)."""
+        if alternates is None:
+            alternates = parse_alternate_fonts()
+        self.alternates = alternates
+        self.chunk_size = chunk_size
+        self.styles = ["Regular", "Bold"] + list(alternates)
+
+        # 1. Provider glyphs (priority, later providers override earlier ones)
+        self.provider_tiles = {}
+        for provider in providers:
+            for tile in provider["tiles"]:
+                self.provider_tiles[tile["codepoint"]] = tile["glyphs"]
+        log(f"→ 🔣 {len(self.provider_tiles)} provider glyphs (priority)")
+
+        # 2. Unifont glyphs (fallback for codepoints without a provider glyph)
+        self.unifont_glyphs = unifont_glyphs if unifont_glyphs else UnifontGlyphs()
+        provider_codepoints = np.fromiter(self.provider_tiles, dtype=np.int64, count=len(self.provider_tiles))
+        self.fallback_indices = np.flatnonzero(~np.isin(self.unifont_glyphs.codepoints, provider_codepoints))
+        self.fallback_codepoints = self.unifont_glyphs.codepoints[self.fallback_indices]
+        self.codepoints = sorted(set(self.provider_tiles).union(self.fallback_codepoints.tolist()))
+
+        # 3. Alternate fonts (Galactic, Illageralt) overlay the codepoints of Regular
+        codepoints = set(self.codepoints)
+        for name, alt_tiles in alternates.items():
+            override_count = sum(1 for cp in alt_tiles if cp in codepoints)
+            log(f"→ 🔣 {name}: {len(alt_tiles)} alternate glyphs ({override_count} overriding Regular)")
+
+        log(f"→ 🔢 Prepared {len(self.codepoints)} glyphs ({len(self.provider_tiles)} provider, {len(self.fallback_codepoints)} unifont)")
+
+    def __len__(self):
+        """Returns the number of codepoints, i.e. glyphs per pixel style."""
+        return len(self.codepoints)
+
+    def __iter__(self):
+        """Traces, merges and scales the glyph map chunk by chunk (see class docstring)."""
+        log(f"→ ✖️ Pre-scaling {len(self)} glyphs ({len(self.styles)} styles)...")
+        chunk_size = self.chunk_size or max(1, len(self.codepoints))
+        for start in range(0, len(self.codepoints), chunk_size):
+            yield self._build_chunk(self.codepoints[start:start + chunk_size])
+
+        log(f"→ ♻️ Traced {trace_memo_stats['misses']} unique bitmaps ({trace_memo_stats['cached']} from cache, {trace_memo_stats['hits']} duplicates reused)")
+        clear_trace_memo()
+
+    def _build_chunk(self, codepoints):
+        """Builds the glyph map for a run of ascending codepoints, tracing its unifont fallbacks."""
+        first = np.searchsorted(self.fallback_codepoints, codepoints[0], side="left")
+        last = np.searchsorted(self.fallback_codepoints, codepoints[-1], side="right")
+        unifont = {}
+        if last > first:
+            fallback_glyphs = self.unifont_glyphs.take(self.fallback_indices[first:last])
+            unifont = {style_key: trace_unifont_tiles(fallback_glyphs, bold) for style_key, bold in [("Regular", False), ("Bold", True)]}
+
+        chunk = {style_key: OrderedDict() for style_key in self.styles}
+        for cp in codepoints:
+            tiles = self.provider_tiles.get(cp)
+            regular = tiles["regular"] if tiles else unifont["Regular"][cp]
+            chunk["Regular"][cp] = regular
+            chunk["Bold"][cp] = tiles["bold"] if tiles else unifont["Bold"][cp]
+            for name, alt_tiles in self.alternates.items():
+                chunk[name][cp] = alt_tiles.get(cp, regular)
+
+        # Traces now live on as GlyphTiles, drop the memoized tracer output
+        _trace_memo.clear()
+
+        precompute_glyph_scaling(chunk)
+        return chunk
 
 def trace_unifont_tiles(unifont_glyphs, bold=False):
-    """Traces contours from parsed unifont hex bitmap data into tile dicts."""
+    """Traces contours from parsed unifont hex bitmap data into GlyphTiles. Bold bitmaps are produced
+    for the whole glyph array at once (UnifontGlyphs.emboldened) before tracing."""
     tiles = {}
     style_label = "Bold" if bold else "Regular"
+    if bold:
+        unifont_glyphs = unifont_glyphs.emboldened()
     debug_unifont = any(s.get("debug", {}).get("unifont") for s in FONT_STYLES if s["pixel_style"] == style_label)
 
-    with tqdm(unifont_glyphs.items(), total=len(unifont_glyphs),
-              desc=f" → 🔣 {style_label}", unit="glyph",
+    codepoints = list(unifont_glyphs)
+    bitmap_grids = [bitmap_grid for _, bitmap_grid in unifont_glyphs.items()]
+    with tqdm(total=len(bitmap_grids), desc=f" → 🔣 {style_label}", unit="glyph",
               ncols=80, leave=False, file=sys.stdout, disable=is_silent()) as progress:
-        for codepoint, bitmap_rows in progress:
-            bitmap_grid = np.array(bitmap_rows, dtype=np.uint8)
-            pixel_data = _trace_bitmap_contours2(bitmap_grid, bold)
-            width = len(bitmap_rows[0]) if bitmap_rows else 8
-
-            svg = None
-            if debug_unifont:
-                output = f"{WORK_DIR}/glyphs/unifont/{style_label.lower()}/{codepoint:04X}"
-                os.makedirs(output, exist_ok=True)
-                svg = _write_tile_svg(pixel_data["grid"], (width, 16), f"{output}/{style_label.lower()}.svg")
-
-            tiles[codepoint] = {
-                "unicode": chr(codepoint),
-                "codepoint": codepoint,
-                "size": (width, 16),
-                "ascent": 15,
-                "pixels": pixel_data,
-                "svg": svg,
-                "source": "unifont"
-            }
+        traced = trace_bitmaps(bitmap_grids, False, progress)
+    flush_trace_cache()
+
+    for codepoint, bitmap_grid, pixel_data in zip(codepoints, bitmap_grids, traced):
+        width = bitmap_grid.shape[1]
+
+        svg = None
+        if debug_unifont:
+            output = f"{WORK_DIR}/glyphs/unifont/{style_label.lower()}/{codepoint:04X}"
+            os.makedirs(output, exist_ok=True)
+            svg = _write_tile_svg(pixel_data["grid"], (width, 16), f"{output}/{style_label.lower()}.svg")
+
+        tiles[codepoint] = GlyphTile(chr(codepoint), codepoint, (width, 16), 15, "unifont", pixel_data, svg)
 
     return tiles
 
-def _process_alternate_font(alt_config, regular_map):
-    """Processes an alternate font by cloning Regular and overlaying alternate glyphs.
+def parse_alternate_fonts():
+    """Traces the glyph tiles of every enabled alternate font (Galactic, Illageralt).
+    Only needs the extracted JAR assets. Returns {style name: {codepoint: tile}}."""
+    alternates = {}
+    for style in FONT_STYLES:
+        if "json_file" not in style or not style["enabled"]:
+            continue
+        alt_tiles = _trace_alternate_font(style)
+        if alt_tiles is not None:
+            alternates[style["name"]] = alt_tiles
+
+    flush_trace_cache()
+    return alternates
 
-    Reads the alternate font's JSON provider file to get char mappings, processes
-    its bitmap PNG into tiles, then overlays those tiles onto a copy of the Regular
-    glyph map. Returns the overlay map, or None if the assets are missing.
+def _trace_alternate_font(alt_config):
+    """Traces an alternate font's glyph tiles.
+
+    Reads the alternate font's JSON provider file to get char mappings and processes
+    its bitmap PNG into tiles. Returns {codepoint: tile}, or None if the assets are missing.
     """
-    name = alt_config["name"]
     json_file = alt_config["json_file"]
     map_lowercase = alt_config.get("map_lowercase", False)
 
@@ -984,18 +1276,9 @@ def _process_alternate_font(alt_config, regular_map):
 
         bitmap_grid = np.array(tile_img.convert("L"), dtype=int)
         bitmap_grid = (bitmap_grid < 128).astype(np.uint8)
-        pixel_data = _trace_bitmap_contours2(bitmap_grid, bold=False)
-
-        tile = {
-            "unicode": unicode_char,
-            "codepoint": codepoint,
-            "size": (glyph_width, height),
-            "ascent": ascent,
-            "pixels": pixel_data,
-            "svg": None,
-            "source": "alternate"
-        }
-        alt_tiles[codepoint] = tile
+        pixel_data = trace_bitmap_contours(bitmap_grid, bold=False)
+
+        alt_tiles[codepoint] = GlyphTile(unicode_char, codepoint, (glyph_width, height), ascent, "alternate", pixel_data)
 
     if not alt_tiles:
         return None
@@ -1006,116 +1289,124 @@ def _process_alternate_font(alt_config, regular_map):
             if 0x41 <= cp <= 0x5A:  # A-Z
                 lower_cp = cp + 0x20  # a-z
                 if lower_cp not in alt_tiles:
-                    lower_tile = dict(alt_tiles[cp])
-                    lower_tile["unicode"] = chr(lower_cp)
-                    lower_tile["codepoint"] = lower_cp
-                    alt_tiles[lower_cp] = lower_tile
-
-    # Clone Regular and overlay alternate tiles
-    overlay_map = OrderedDict()
-    for cp, tile in regular_map.items():
-        if cp in alt_tiles:
-            overlay_map[cp] = alt_tiles[cp]
-        else:
-            overlay_map[cp] = tile
-
-    override_count = sum(1 for cp in alt_tiles if cp in regular_map)
-    log(f"→ 🔣 {name}: {len(alt_tiles)} alternate glyphs ({override_count} overriding Regular)")
+                    alt_tiles[lower_cp] = alt_tiles[cp].copy(unicode=chr(lower_cp), codepoint=lower_cp)
 
-    return overlay_map
+    return alt_tiles
 
 def precompute_glyph_scaling(glyph_map):
-    """Scales glyph coordinates from pixel space to font units, splits self-touching contours, and insets shared vertices."""
-    styles = len(glyph_map)
-    per_style = len(next(iter(glyph_map.values())))
-    total = per_style * styles
-    log(f"→ ✖️ Pre-scaling {per_style} glyphs ({styles} styles)...")
+    """Scales glyph coordinates from pixel space to font units, splits self-touching contours, and insets shared vertices.
 
-    with tqdm(total=total, desc=" → 🔣 Scaling", unit="glyph",
+    Tiles shared between styles (the Regular tiles reused by the Galactic and
+    Illageralt overlays) are scaled once. The contour points of all tiles are
+    packed into one flat array and transformed in a single NumPy pass.
+    """
+    tiles = list({id(tile): tile for style_tiles in glyph_map.values() for tile in style_tiles.values()}.values())
+
+    # Pack the contours of every tile into one flat (points, 2) array
+    contours = [] # outer paths then hole paths, tile by tile
+    outer_counts, contour_counts = [], []
+    glyph_scales, glyph_offsets = [], []
+    for tile in tiles:
+        # Compute scale factor.
+        # Provider glyphs use a uniform pixel scale (UNITS_PER_EM /
+        # DEFAULT_GLYPH_SIZE = 128) so that 1 Minecraft pixel = 1 font
+        # unit regardless of provider height.  This keeps the base
+        # character of accented glyphs (height=12) the same size as the
+        # equivalent standard glyph (height=8), with accents extending
+        # above the normal ascent line.
+        # Unifont fallback glyphs use ASCENT / ascent to compress 16px
+        # rows into the same visual space as 8px provider rows.
+        ascent = tile.ascent
+        if tile.source == "unifont" and ascent > 0:
+            scale = ASCENT / ascent
+        else:
+            scale = UNITS_PER_EM / DEFAULT_GLYPH_SIZE
+        tile.units_per_pixel = scale
+
+        outer_paths = [path for path in tile.paths if len(path) >= 3]
+        hole_paths = [path for path in tile.holes if len(path) >= 3]
+        contours += outer_paths
+        contours += hole_paths
+        outer_counts.append(len(outer_paths))
+        contour_counts.append(len(outer_paths) + len(hole_paths))
+        glyph_scales.append(scale)
+        glyph_offsets.append(ascent if ascent > 0 else ASCENT / scale) # descender offset
+
+    contour_lengths = np.fromiter(map(len, contours), dtype=np.intp, count=len(contours))
+    contour_ends = np.cumsum(contour_lengths)
+    points = np.array([pt for contour in contours for pt in contour], dtype=np.float64).reshape(-1, 2)
+
+    # Per-glyph point ranges; glyphs without contours get an empty range
+    glyph_contour_ends = np.cumsum(contour_counts, dtype=np.intp)
+    glyph_point_ends = np.concatenate(([0], contour_ends))[glyph_contour_ends]
+    glyph_point_counts = np.diff(glyph_point_ends, prepend=0)
+
+    # Shift to min x, flip around the descender offset and scale: ((x - min_x) * s, (offset - y) * s)
+    has_points = glyph_point_counts > 0
+    min_x = np.zeros(len(tiles))
+    if points.size:
+        min_x[has_points] = np.minimum.reduceat(points[:, 0], (glyph_point_ends - glyph_point_counts)[has_points])
+    point_scales = np.repeat(np.asarray(glyph_scales, dtype=np.float64), glyph_point_counts)
+    scaled_x = (points[:, 0] - np.repeat(min_x, glyph_point_counts)) * point_scales
+    scaled_y = (np.repeat(np.asarray(glyph_offsets, dtype=np.float64), glyph_point_counts) - points[:, 1]) * point_scales
+    scaled_points = list(zip(scaled_x.tolist(), scaled_y.tolist()))
+
+    with tqdm(total=len(tiles), desc=" → 🔣 Scaling", unit="glyph",
               ncols=80, leave=False, file=sys.stdout, disable=is_silent()) as progress:
-        for style_key in glyph_map:
-            for cp, tile in glyph_map[style_key].items():
-                progress.update(1)
-
-                # Compute scale factor.
-                # Provider glyphs use a uniform pixel scale (UNITS_PER_EM /
-                # DEFAULT_GLYPH_SIZE = 128) so that 1 Minecraft pixel = 1 font
-                # unit regardless of provider height.  This keeps the base
-                # character of accented glyphs (height=12) the same size as the
-                # equivalent standard glyph (height=8), with accents extending
-                # above the normal ascent line.
-                # Unifont fallback glyphs use ASCENT / ascent to compress 16px
-                # rows into the same visual space as 8px provider rows.
-                width, height = tile["size"]
-                ascent = tile.get("ascent", 0)
-                if tile.get("source") == "unifont" and ascent > 0:
-                    scale = ASCENT / ascent
-                else:
-                    scale = UNITS_PER_EM / DEFAULT_GLYPH_SIZE
-                tile["units_per_pixel"] = scale
-
-                pixels = tile.get("pixels")
-                if not pixels:
-                    tile["scaled"] = {"outer": [], "holes": []}
-                    continue
-
-                paths = pixels.get("paths", {})
-                holes = pixels.get("holes", {})
-
-                outer_paths = [p["corners"] for p in paths.values() if len(p.get("corners", [])) >= 3]
-                hole_paths = [h["corners"] for h in holes.values() if len(h.get("corners", [])) >= 3]
-
-                all_points = [pt for path in outer_paths + hole_paths for pt in path]
-                if not all_points:
-                    tile["scaled"] = {"outer": [], "holes": []}
-                    continue
-
-                min_x = min(x for x, y in all_points)
-                descender_offset = ascent if ascent > 0 else ASCENT / scale
-
-                def transform(pt, _min_x=min_x, _s=scale, _do=descender_offset):
-                    x, y = pt
-                    return ((x - _min_x) * _s, (_do - y) * _s)
+        contour_index = 0
+        contour_starts, contour_ends = (contour_ends - contour_lengths).tolist(), contour_ends.tolist()
+        for tile, outer_count, contour_count in zip(tiles, outer_counts, contour_counts):
+            progress.update(1)
+            if not contour_count:
+                tile.scaled = {"outer": [], "holes": []}
+                continue
 
-                scaled_outer = [[transform(pt) for pt in path] for path in outer_paths]
-                scaled_holes = [[transform(pt) for pt in path] for path in hole_paths]
+            scaled = [scaled_points[contour_starts[index]:contour_ends[index]]
+                      for index in range(contour_index, contour_index + contour_count)]
+            contour_index += contour_count
 
-                scaled_outer = _split_self_touching(scaled_outer)
-                scaled_holes = _split_self_touching(scaled_holes)
-                scaled_outer, scaled_holes = _inset_shared_vertices(scaled_outer, scaled_holes)
+            scaled_outer = _split_self_touching(scaled[:outer_count])
+            scaled_holes = _split_self_touching(scaled[outer_count:])
+            scaled_outer, scaled_holes = _inset_shared_vertices(scaled_outer, scaled_holes)
+            depths, ccw = _contour_nesting(scaled_outer + scaled_holes)
 
-                tile["scaled"] = {
-                    "outer": scaled_outer,
-                    "holes": scaled_holes
-                }
+            tile.scaled = {
+                "outer": scaled_outer,
+                "holes": scaled_holes,
+                "depths": depths,
+                "ccw": ccw
+            }
 
 def _split_self_touching(contours):
     """Splits self-touching contours at duplicate vertices.
 
     Pixel contour tracing can produce figure-eight paths that revisit the
     same vertex at pinch points. Each loop becomes its own contour.
+
+    Every contour is walked once, keeping the points since the last split on a
+    stack along with the stack position of each rounded vertex. When a vertex
+    repeats, the points from its first occurrence up to here close a loop and
+    are popped off as their own contour; whatever is left on the stack at the
+    end is the remaining outline. Loops shorter than 3 points are dropped.
     """
     result = []
     for contour in contours:
-        pending = [contour]
-        while pending:
-            c = pending.pop()
-            seen = {}
-            split = False
-            for i, pt in enumerate(c):
-                key = (round(pt[0]), round(pt[1]))
-                if key in seen:
-                    loop = c[seen[key]:i]
-                    rest = c[:seen[key]] + c[i:]
-                    if len(loop) >= 3:
-                        result.append(loop)
-                    if len(rest) >= 3:
-                        pending.append(rest)
-                    split = True
-                    break
-                seen[key] = i
-            if not split and len(c) >= 3:
-                result.append(c)
+        stack, keys = [], []
+        positions = {} # rounded vertex -> index on the stack
+        for pt in contour:
+            key = (round(pt[0]), round(pt[1]))
+            start = positions.get(key)
+            if start is not None:
+                if len(stack) - start >= 3:
+                    result.append(stack[start:])
+                for popped in keys[start:]:
+                    del positions[popped]
+                del stack[start:], keys[start:]
+            positions[key] = len(stack)
+            stack.append(pt)
+            keys.append(key)
+        if len(stack) >= 3:
+            result.append(stack)
 
     return result
 
@@ -1129,22 +1420,25 @@ def _inset_shared_vertices(scaled_outer, scaled_holes):
     if len(all_contours) <= 1:
         return scaled_outer, scaled_holes
 
-    shared_pts = set()
-    for i, ci in enumerate(all_contours):
-        si = {(round(x), round(y)) for x, y in ci}
-        for j, cj in enumerate(all_contours):
-            if i < j:
-                sj = {(round(x), round(y)) for x, y in cj}
-                shared_pts |= si & sj
+    # Index how many contours each rounded vertex appears in (repeats within one contour count once)
+    rounded = [[(round(x), round(y)) for x, y in contour] for contour in all_contours]
+    contour_counts = defaultdict(int)
+    for keys in rounded:
+        for key in set(keys):
+            contour_counts[key] += 1
+    shared_pts = {key for key, count in contour_counts.items() if count > 1}
 
     if not shared_pts:
         return scaled_outer, scaled_holes
 
     for i, contour in enumerate(all_contours):
+        if shared_pts.isdisjoint(rounded[i]):
+            continue
+
         inset = []
         n = len(contour)
         for k, (x, y) in enumerate(contour):
-            if (round(x), round(y)) in shared_pts:
+            if rounded[i][k] in shared_pts:
                 px, py = contour[(k - 1) % n]
                 nx, ny = contour[(k + 1) % n]
                 dx = (px - x) + (nx - x)
@@ -1158,3 +1452,106 @@ def _inset_shared_vertices(scaled_outer, scaled_holes):
 
     outer_count = len(scaled_outer)
     return all_contours[:outer_count], all_contours[outer_count:]
+
+def _contour_nesting(contours):
+    """Returns (depths, ccw) for a glyph's final contours (outer paths then holes).
+
+    A contour's nesting depth is the number of other contours containing its
+    interior point (even = filled, odd = hole), ccw tells whether it currently
+    winds counter-clockwise. Glyph.draw orients each contour from these, so
+    they're computed once per tile rather than per font style: italic shear
+    preserves both. Contours whose bounding box misses the interior point are
+    skipped without a point-in-polygon test.
+    """
+    boxes = []
+    for contour in contours:
+        xs = [x for x, y in contour]
+        ys = [y for x, y in contour]
+        boxes.append((min(xs), min(ys), max(xs), max(ys)) if contour else None)
+
+    depths, ccw = [], []
+    for index, contour in enumerate(contours):
+        if len(contour) < 3:
+            depths.append(0)
+            ccw.append(False)
+            continue
+
+        ix, iy = _interior_point(contour)
+        depth = 0
+        for other_index, other in enumerate(contours):
+            if other_index == index or boxes[other_index] is None:
+                continue
+            min_x, min_y, max_x, max_y = boxes[other_index]
+            if min_x <= ix <= max_x and min_y <= iy <= max_y and _point_in_polygon(ix, iy, other):
+                depth += 1
+        depths.append(depth)
+        ccw.append(_signed_area(contour) > 0)
+
+    return depths, ccw
+
+def _interior_point(contour):
+    """Returns a point guaranteed to be inside the contour.
+
+    Needed because the naive approach (centroid) fails for non-convex
+    shapes like C or L, where the centroid can land outside the contour
+    or inside a nested hole.
+
+    Walks each edge, takes its midpoint, and offsets it a tiny amount
+    perpendicular to the edge in both directions. Since edges lie on the
+    boundary, one direction is always interior. Returns the first offset
+    point that _point_in_polygon confirms is inside. Falls back to an
+    epsilon-offset centroid for degenerate polygons.
+    """
+    eps = 0.01
+    for idx in range(len(contour)):
+        p0 = contour[idx]
+        p1 = contour[(idx + 1) % len(contour)]
+        mx = (p0[0] + p1[0]) / 2
+        my = (p0[1] + p1[1]) / 2
+        dx, dy = p1[0] - p0[0], p1[1] - p0[1]
+        if dx == 0 and dy == 0:
+            continue
+        for sign in (1, -1):
+            px = mx + sign * (-dy) * eps
+            py = my + sign * dx * eps
+            if _point_in_polygon(px, py, contour):
+                return px, py
+    cx = sum(x for x, y in contour) / len(contour) + eps
+    cy = sum(y for x, y in contour) / len(contour) + eps
+    return cx, cy
+
+def _signed_area(pts):
+    """Returns the signed area of a polygon via the shoelace formula.
+
+    The sign encodes winding direction: positive = CCW, negative = CW
+    in Y-up coordinates. Used by _contour_nesting to record each contour's
+    current winding, which Glyph.draw matches against its nesting depth.
+
+    https://en.wikipedia.org/wiki/Shoelace_formula
+    """
+    n = len(pts)
+    return sum(
+        pts[i][0] * pts[(i + 1) % n][1] - pts[(i + 1) % n][0] * pts[i][1]
+        for i in range(n)
+    ) / 2
+
+def _point_in_polygon(px, py, polygon):
+    """Ray casting point-in-polygon test.
+
+    Shoots a horizontal ray rightward from (px, py) and counts edge
+    crossings: odd = inside, even = outside. Used by _contour_nesting to
+    compute nesting depth (how many other contours contain a given
+    contour's interior point).
+
+    https://en.wikipedia.org/wiki/Point_in_polygon#Ray_casting_algorithm
+    """
+    n = len(polygon)
+    inside = False
+    j = n - 1
+    for i in range(n):
+        xi, yi = polygon[i]
+        xj, yj = polygon[j]
+        if ((yi > py) != (yj > py)) and (px < (xj - xi) * (py - yi) / (yj - yi) + xi):
+            inside = not inside
+        j = i
+    return inside
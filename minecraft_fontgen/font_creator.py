@@ -18,7 +18,8 @@ from minecraft_fontgen.table.postscript import create_font_pscript_table
 from minecraft_fontgen.table.truetype import create_tt_font_tables
 
 def create_font_files(glyph_map, use_cff, output_fonts, output_dir, output_font_name, output_file_ext):
-    """Creates all enabled font files in batch: initializes tables, converts glyphs, saves. Returns output file paths."""
+    """Creates all enabled font files in batch: initializes tables, converts glyphs, saves. Returns output file paths.
+    glyph_map is either a built glyph map or a GlyphMapStream, whose chunks are traced and scaled as they're drawn."""
     font_icon = "🅾️" if use_cff else "🆎"
     font_type = "OpenType" if use_cff else "TrueType"
     enabled_fonts = [f for f in output_fonts if f["enabled"]]
@@ -50,21 +51,30 @@ def create_font_files(glyph_map, use_cff, output_fonts, output_dir, output_font_
 
         storages[style["name"]] = (GlyphStorage(font, use_cff), style)
 
+    # A built glyph map is drawn as a single chunk, a stream chunk by chunk (--stream)
+    if isinstance(glyph_map, dict):
+        pixel_styles, chunks = list(glyph_map), [glyph_map]
+    else:
+        pixel_styles, chunks = glyph_map.styles, glyph_map
+
     # Filter out fonts whose pixel style isn't in the glyph map (e.g. Galactic when alt.json is missing)
-    available_fonts = [f for f in enabled_fonts if f["pixel_style"] in glyph_map]
+    available_fonts = [f for f in enabled_fonts if f["pixel_style"] in pixel_styles]
     for f in enabled_fonts:
-        if f["pixel_style"] not in glyph_map:
+        if f["pixel_style"] not in pixel_styles:
             log(f"→ ⚠️ Skipping {f['name']} (alternate font assets not found in this version)")
 
     # Convert glyphs for all styles in a single pass
-    total = sum(len(glyph_map[f["pixel_style"]]) for f in available_fonts)
+    if isinstance(glyph_map, dict):
+        total = sum(len(glyph_map[f["pixel_style"]]) for f in available_fonts)
+    else:
+        total = len(glyph_map) * len(available_fonts)
     log(f"→ 🔣 Drawing glyphs ({len(available_fonts)} styles)...")
 
     with tqdm(total=total, desc=f" → 🔣 {available_fonts[0]['name']}", unit="glyph",
               ncols=80, leave=False, file=sys.stdout, disable=is_silent()) as progress:
-        for style in available_fonts:
+        for chunk, style in ((chunk, style) for chunk in chunks for style in available_fonts):
             progress.set_description(f" → 🔣 {style['name']}")
-            tiles = glyph_map[style["pixel_style"]]
+            tiles = chunk[style["pixel_style"]]
             storage = storages[style["name"]][0]
 
             for tile in tiles.values():
@@ -74,7 +84,7 @@ def create_font_files(glyph_map, use_cff, output_fonts, output_dir, output_font_
                 if not glyph.is_valid():
                     continue
 
-                if tile.get("svg") and not style["italic"]:
+                if tile.svg and not style["italic"]:
                     glyph.write_svg_paths()
 
                 glyph.scale(italic=style["italic"])
@@ -85,7 +95,7 @@ def create_font_files(glyph_map, use_cff, output_fonts, output_dir, output_font_
     log(f"💾 Saving font files...", flush=True)
     output_files = []
     for font_name, (storage, style) in storages.items():
-        if style["pixel_style"] not in glyph_map:
+        if style["pixel_style"] not in pixel_styles:
             continue
 
         output_file = f"{output_font_name}-{font_name}.{output_file_ext}"
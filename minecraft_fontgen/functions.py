@@ -1,16 +1,42 @@
+import bisect
+import hashlib
 import json
+import multiprocessing
 import os
 import re
 import requests
 import subprocess
 import sys
+import threading
+import time
 
+import numpy as np
 import minecraft_fontgen.config as config
 
+from concurrent.futures import ProcessPoolExecutor
+from requests.adapters import HTTPAdapter, Retry
+from minecraft_fontgen.cache import get_cache
+
+_session = None
+_session_lock = threading.Lock()
+_process_pool = None
+_unifont_index = None
+
 def set_silent(value):
     """Sets the global silent mode flag."""
     config.SILENT_LOG = value
 
+def set_cache(cache_dir, max_size=None):
+    """Sets the persistent cache directory (None disables caching) and optional size cap in bytes."""
+    config.CACHE_DIR = cache_dir
+    if max_size is not None:
+        config.CACHE_MAX_SIZE = max_size
+
+def set_local_sources(minecraft_dir, offline=False):
+    """Sets the local .minecraft installation / asset mirror directory and whether the network may be used."""
+    config.MINECRAFT_DIR = minecraft_dir
+    config.OFFLINE = offline
+
 def is_silent():
     """Returns True if silent mode is enabled."""
     return config.SILENT_LOG
@@ -41,35 +67,226 @@ def parse_json(text):
     cleaned = re.sub(r',\s*([}\]])', r'\1', text)
     return json.loads(cleaned)
 
+def get_unifont_index():
+    """Returns the enabled UNIFONT_RANGES merged into sorted, disjoint (starts, ends) lists, built on first use."""
+    global _unifont_index
+    if _unifont_index is None:
+        starts, ends = [], []
+        for start, end in sorted((start, end) for start, end, enabled in config.UNIFONT_RANGES if enabled):
+            if starts and start <= ends[-1] + 1:
+                ends[-1] = max(ends[-1], end)
+            else:
+                starts.append(start)
+                ends.append(end)
+        _unifont_index = (starts, ends)
+    return _unifont_index
+
+def get_unifont_ranges_fingerprint():
+    """Returns a short hash of the enabled UNIFONT_RANGES, used to key caches of range-filtered data."""
+    starts, ends = get_unifont_index()
+    return hashlib.sha1(repr(list(zip(starts, ends))).encode()).hexdigest()[:16]
+
 def in_unifont_ranges(codepoint):
     """Returns True if the codepoint falls within any enabled UNIFONT_RANGES entry."""
-    for start, end, enabled in config.UNIFONT_RANGES:
-        if enabled and start <= codepoint <= end:
-            return True
-    return False
+    starts, ends = get_unifont_index()
+    index = bisect.bisect_right(starts, codepoint) - 1
+    return index >= 0 and codepoint <= ends[index]
+
+def filter_unifont_ranges(codepoints):
+    """Returns a boolean mask over an array of codepoints, True where they fall within an enabled UNIFONT_RANGES entry."""
+    starts, ends = get_unifont_index()
+    codepoints = np.asarray(codepoints, dtype=np.int64)
+    if not starts:
+        return np.zeros(codepoints.shape, dtype=bool)
+
+    index = np.searchsorted(np.array(starts, dtype=np.int64), codepoints, side="right") - 1
+    return (index >= 0) & (codepoints <= np.array(ends, dtype=np.int64)[np.maximum(index, 0)])
+
+def set_jobs(jobs):
+    """Sets the number of worker processes used for tracing (0 uses every CPU core)."""
+    config.TRACE_JOBS = jobs or os.cpu_count() or 1
+
+def get_process_pool():
+    """Returns the shared tracing process pool, creating it on first use, or None when tracing in-process (TRACE_JOBS <= 1).
+    Workers are spawned rather than forked, since downloads may be running on other threads."""
+    global _process_pool
+    if config.TRACE_JOBS <= 1:
+        return None
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(max_workers=config.TRACE_JOBS, mp_context=multiprocessing.get_context("spawn"))
+    return _process_pool
+
+def shutdown_process_pool():
+    """Shuts down the tracing process pool if one was started."""
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown()
+        _process_pool = None
+
+def get_session():
+    """Returns the shared HTTP session (keep-alive connection pool with retries), creating it on first use."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            retry = Retry(total=config.HTTP_RETRIES, backoff_factor=0.5,
+                          status_forcelist=[429, 500, 502, 503, 504], allowed_methods=["GET", "HEAD"])
+            adapter = HTTPAdapter(pool_connections=config.DOWNLOAD_WORKERS, pool_maxsize=config.DOWNLOAD_WORKERS * 2, max_retries=retry)
+            _session = requests.Session()
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+        return _session
+
+def http_get(url, label=None, **kwargs):
+    """Issues a GET through the shared session. Raises RuntimeError instead when offline mode is enabled."""
+    if config.OFFLINE:
+        raise RuntimeError(f"→ ❌ Offline mode: {label or url} is not available locally.")
+    kwargs.setdefault("timeout", 30)
+    return get_session().get(url, **kwargs)
+
+def find_local_file(relative_path, sha1=None):
+    """Returns the path of a file inside the local .minecraft / mirror directory (e.g. versions/1.21.4/1.21.4.jar),
+    or None if there is no such directory or file. Files that don't match sha1 (when given) are ignored."""
+    if not config.MINECRAFT_DIR:
+        return None
+
+    path = os.path.join(config.MINECRAFT_DIR, *relative_path.split("/"))
+    if not os.path.isfile(path):
+        return None
+
+    if sha1:
+        digest = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(config.DOWNLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        if digest.hexdigest() != sha1:
+            log(f"→ ⚠️ Ignoring local {relative_path} (SHA-1 mismatch)...")
+            return None
+
+    return path
 
 def fetch_bytes(url, label=None):
     """Downloads raw bytes from a URL and returns the response content."""
     log(f"→ 🌐 Downloading {label or url}...")
-    request = requests.get(url, timeout=30)
+    request = http_get(url, label=label)
     request.raise_for_status()
     return request.content
 
+def fetch_to_file(url, file, sha1=None, size=None, label=None):
+    """Streams a download into an open binary file in chunks, hashing as it goes so the full body is
+    never held in memory. Verifies the published size and SHA-1 when given, then rewinds the file."""
+    log(f"→ 🌐 Downloading {label or url}...")
+    digest = hashlib.sha1()
+    received = 0
+
+    with http_get(url, label=label, stream=True) as request:
+        request.raise_for_status()
+        for chunk in request.iter_content(chunk_size=config.DOWNLOAD_CHUNK_SIZE):
+            digest.update(chunk)
+            file.write(chunk)
+            received += len(chunk)
+
+    if size is not None and received != size:
+        raise RuntimeError(f"→ ❌ Size mismatch for {label or url} ({received} of {size} bytes).")
+    if sha1 and digest.hexdigest() != sha1:
+        raise RuntimeError(f"→ ❌ SHA-1 mismatch for {label or url}.")
+
+    file.seek(0)
+    return file
+
 def fetch_json(url, label=None):
     """Downloads and parses JSON from a URL, tolerating trailing commas."""
     log(f"→ 🌐 Downloading {label or url}...")
-    request = requests.get(url, timeout=30)
+    request = http_get(url, label=label)
     request.raise_for_status()
     return parse_json(request.text)
 
+def fetch_cached_json(url, max_age=None, label=None):
+    """Downloads and parses JSON from a mutable URL (e.g. the version manifest) through the HTTP cache.
+
+    A cached copy younger than max_age seconds (or of any age when max_age is None) is used without
+    contacting the server. Older copies are revalidated with If-None-Match / If-Modified-Since, so an
+    unchanged document costs a single 304. A stale copy is used if the server can't be reached
+    or offline mode is enabled.
+    """
+    cache = get_cache("http")
+    if not cache:
+        return fetch_json(url, label=label)
+
+    key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+    try:
+        entry = json.loads(cache.get(key) or "null")
+    except ValueError:
+        entry = None
+
+    if entry and (max_age is None or config.OFFLINE or time.time() - entry["fetched"] < max_age):
+        log(f"→ 💾 Using cached {label or url}...")
+        return parse_json(entry["body"])
+
+    headers = {}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+    if entry and entry.get("last_modified"):
+        headers["If-Modified-Since"] = entry["last_modified"]
+
+    log(f"→ 🌐 {'Revalidating' if entry else 'Downloading'} {label or url}...")
+    try:
+        request = http_get(url, label=label, headers=headers)
+        request.raise_for_status()
+    except requests.RequestException:
+        if not entry:
+            raise
+        log(f"→ ⚠️ Could not reach server, using cached {label or url}...")
+        return parse_json(entry["body"])
+
+    if request.status_code != 304 or not entry:
+        entry = {
+            "etag": request.headers.get("ETag"),
+            "last_modified": request.headers.get("Last-Modified"),
+            "body": request.text
+        }
+    entry["fetched"] = time.time()
+    cache.put(key, json.dumps(entry).encode("utf-8"))
+    return parse_json(entry["body"])
+
+def fetch_object_bytes(url, sha1, label=None, local_path=None):
+    """Downloads an immutable object identified by its SHA-1, serving it from the local .minecraft / mirror
+    directory (local_path) or the object cache when possible. Downloaded content is verified against the
+    SHA-1 before it is cached."""
+    path = find_local_file(local_path, sha1) if local_path else None
+    if path:
+        log(f"→ 📁 Using local {label or local_path}...")
+        with open(path, "rb") as f:
+            return f.read()
+
+    cache = get_cache("objects") if sha1 else None
+    if cache:
+        data = cache.get(sha1, verify=True)
+        if data is not None:
+            log(f"→ 💾 Using cached {label or url}...")
+            return data
+
+    data = fetch_bytes(url, label=label)
+    if sha1 and hashlib.sha1(data).hexdigest() != sha1:
+        raise RuntimeError(f"→ ❌ SHA-1 mismatch for {label or url}.")
+
+    if cache:
+        cache.put(sha1, data)
+    return data
+
+def fetch_object_json(url, sha1, label=None, local_path=None):
+    """Downloads and parses an immutable JSON object identified by its SHA-1 (see fetch_object_bytes)."""
+    return parse_json(fetch_object_bytes(url, sha1, label=label, local_path=local_path).decode("utf-8"))
+
 def fetch_minecraft_resource(sha1, label=None):
     """Fetches a JSON resource from the Mojang CDN by its SHA-1 hash.
     (resources.download.minecraft.net/<first2>/<sha1>)"""
-    return fetch_json(f"{config.MINECRAFT_RESOURCE_URL}/{sha1[:2]}/{sha1}", label=label)
+    return fetch_object_json(f"{config.MINECRAFT_RESOURCE_URL}/{sha1[:2]}/{sha1}", sha1, label=label,
+                             local_path=f"assets/objects/{sha1[:2]}/{sha1}")
 
 def fetch_minecraft_resource_bytes(sha1, label=None):
     """Fetches raw bytes from the Mojang CDN by its SHA-1 hash."""
-    return fetch_bytes(f"{config.MINECRAFT_RESOURCE_URL}/{sha1[:2]}/{sha1}", label=label)
+    return fetch_object_bytes(f"{config.MINECRAFT_RESOURCE_URL}/{sha1[:2]}/{sha1}", sha1, label=label,
+                              local_path=f"assets/objects/{sha1[:2]}/{sha1}")
 
 def validate_fonts(font_files):
     """Runs FontForge validation on generated font files via subprocess."""
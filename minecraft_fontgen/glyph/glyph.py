@@ -2,41 +2,38 @@ import os
 import sys
 
 from collections import defaultdict
-from fontTools.pens.t2CharStringPen import T2CharStringPen
-from fontTools.pens.ttGlyphPen import TTGlyphPen
-
 from minecraft_fontgen.config import UNITS_PER_EM, DEFAULT_GLYPH_SIZE, NOTDEF, NOTDEF_GLYPH, ITALIC_SHEAR_FACTOR
 from minecraft_fontgen.functions import get_unicode_codepoint
+from minecraft_fontgen.glyph.outline_encoder import encode_charstring, encode_glyf
 
 class Glyph:
-    """Represents a single font glyph with pixel data, scaling, and pen drawing capabilities."""
+    """Represents a single font glyph with pixel data, scaling, and outline drawing capabilities."""
 
     def __init__(self, tile, use_cff: bool = True):
-        """Initializes a glyph from tile data, creating a drawing pen and handling .notdef."""
-        self.unicode = tile["unicode"]
-        self.codepoint = self._get_codepoint() if "codepoint" not in tile else tile["codepoint"]
+        """Initializes a glyph from a GlyphTile, handling .notdef."""
+        self.unicode = tile.unicode
+        self.codepoint = self._get_codepoint() if tile.codepoint is None else tile.codepoint
         self.use_cff = use_cff
         self.name = self._get_name()
-        self.svg = tile["svg"] if "svg" in tile else None
-        self.size = tile["size"] or (DEFAULT_GLYPH_SIZE, DEFAULT_GLYPH_SIZE)
-        self.ascent = tile["ascent"] if "ascent" in tile else 0
+        self.svg = tile.svg
+        self.size = tile.size or (DEFAULT_GLYPH_SIZE, DEFAULT_GLYPH_SIZE)
+        self.ascent = tile.ascent
 
         # Pixels
-        self.pixels = tile["pixels"] if "pixels" in tile else []
-        self.width = self.pixels["width"] if "width" in self.pixels else DEFAULT_GLYPH_SIZE
-        self.advance = self.pixels["advance"] if "advance" in self.pixels else DEFAULT_GLYPH_SIZE
-        self.lsb = self.pixels["lsb"] if "lsb" in self.pixels else 0
-        self.outer = self.pixels["paths"] if "paths" in self.pixels else {}
-        self.holes = self.pixels["holes"] if "holes" in self.pixels else {}
+        self.width = tile.width
+        self.advance = tile.advance
+        self.lsb = tile.lsb
+        self.outer = tile.paths
+        self.holes = tile.holes
 
         # Pre-computed scaled coordinates (set during glyph map building)
-        self.scaled = tile.get("scaled", None)
-        self.units_per_pixel = tile.get("units_per_pixel", UNITS_PER_EM / self.size[1])
+        self.scaled = tile.scaled
+        self.units_per_pixel = tile.units_per_pixel or UNITS_PER_EM / self.size[1]
         self.outer_scaled = []
         self.holes_scaled = []
 
-        # Create pen
-        self.pen = self._new_pen()
+        # Oriented contours to encode (see draw and build)
+        self.contours = []
 
         # TODO: Reverse-engineer unscaled coordinates,
         #       pass the pixels and paths data for .notdef,
@@ -46,16 +43,10 @@ class Glyph:
         if self.codepoint == 0x0000:
             def draw_rect(rect, ccw):
                 x1, y1, x2, y2 = rect
-                self.pen.moveTo((x1, y1))
                 if ccw:
-                    self.pen.lineTo((x2, y1))
-                    self.pen.lineTo((x2, y2))
-                    self.pen.lineTo((x1, y2))
+                    self.contours.append([(x1, y1), (x2, y1), (x2, y2), (x1, y2)])
                 else:
-                    self.pen.lineTo((x1, y2))
-                    self.pen.lineTo((x2, y2))
-                    self.pen.lineTo((x2, y1))
-                self.pen.closePath()
+                    self.contours.append([(x1, y1), (x1, y2), (x2, y2), (x2, y1)])
 
             # CFF: outer=CCW, hole=CW; TrueType: outer=CW, hole=CCW
             draw_rect(NOTDEF_GLYPH[0], ccw=self.use_cff)
@@ -74,16 +65,11 @@ class Glyph:
         else:
             return f"u{self.codepoint:06X}"
 
-    def _new_pen(self):
-        """Creates a new fontTools drawing pen (T2CharStringPen for CFF, TTGlyphPen for TrueType)."""
-        if self.use_cff:
-            if self.codepoint == 0x0020:
-                advance_width = UNITS_PER_EM // 2
-            else:
-                advance_width = round((self.width + 1) * self.units_per_pixel)
-            return T2CharStringPen(advance_width, None)
-        else:
-            return TTGlyphPen(None)
+    def _get_charstring_width(self):
+        """Returns the advance width encoded in the CFF charstring."""
+        if self.codepoint == 0x0020:
+            return UNITS_PER_EM // 2
+        return round((self.width + 1) * self.units_per_pixel)
 
     def is_valid(self):
         """Returns True if this glyph has a valid, non-null, non-.notdef codepoint."""
@@ -110,17 +96,9 @@ class Glyph:
          shape-rendering="crispEdges">
     <g stroke-width="0.05">'''
 
-        def extract_corners(source):
-            if isinstance(source, dict):
-                return [p["corners"] for p in source.values() if "corners" in p]
-            elif isinstance(source, list):
-                return [p for p in source if isinstance(p, list) and len(p) >= 3]
-            else:
-                return []
-
         # Collect paths
-        outer_paths = extract_corners(self.outer)
-        hole_paths = extract_corners(self.holes)
+        outer_paths = [path for path in self.outer if len(path) >= 3]
+        hole_paths = [path for path in self.holes if len(path) >= 3]
         all_paths = outer_paths + hole_paths
         svg_paths = []
 
@@ -171,113 +149,29 @@ class Glyph:
             self.holes_scaled = holes
 
     def draw(self):
-        """Draws contours with winding based on geometric nesting depth."""
+        """Draws contours with winding based on the nesting depth pre-computed for each (see precompute_glyph_scaling).
+        Italic shear changes neither containment nor the sign of a contour's area, so the same depths apply."""
         if not self.outer_scaled and not self.holes_scaled:
             return
 
         all_contours = list(self.outer_scaled) + list(self.holes_scaled)
 
-        for contour in all_contours:
+        for contour, depth, is_ccw in zip(all_contours, self.scaled["depths"], self.scaled["ccw"]):
             if len(contour) < 3:
                 continue
 
-            ix, iy = self._interior_point(contour)
-            depth = sum(
-                1 for other in all_contours
-                if other is not contour and self._point_in_polygon(ix, iy, other)
-            )
-
             # CFF: even depth = CCW, odd depth = CW
             # TT: even depth = CW, odd depth = CCW
             want_ccw = (depth % 2 == 0) == self.use_cff
-            sa = self._signed_area(contour)
-            is_ccw = sa > 0
-
-            pts = list(reversed(contour)) if want_ccw != is_ccw else contour
-            self.pen.moveTo(pts[0])
-            for pt in pts[1:]:
-                self.pen.lineTo(pt)
-            self.pen.closePath()
-
-    @staticmethod
-    def _interior_point(contour):
-        """Returns a point guaranteed to be inside the contour.
-
-        Needed because the naive approach (centroid) fails for non-convex
-        shapes like C or L, where the centroid can land outside the contour
-        or inside a nested hole.
-
-        Walks each edge, takes its midpoint, and offsets it a tiny amount
-        perpendicular to the edge in both directions. Since edges lie on the
-        boundary, one direction is always interior. Returns the first offset
-        point that _point_in_polygon confirms is inside. Falls back to an
-        epsilon-offset centroid for degenerate polygons.
-        """
-        pip = Glyph._point_in_polygon
-        eps = 0.01
-        for idx in range(len(contour)):
-            p0 = contour[idx]
-            p1 = contour[(idx + 1) % len(contour)]
-            mx = (p0[0] + p1[0]) / 2
-            my = (p0[1] + p1[1]) / 2
-            dx, dy = p1[0] - p0[0], p1[1] - p0[1]
-            if dx == 0 and dy == 0:
-                continue
-            for sign in (1, -1):
-                px = mx + sign * (-dy) * eps
-                py = my + sign * dx * eps
-                if pip(px, py, contour):
-                    return px, py
-        cx = sum(x for x, y in contour) / len(contour) + eps
-        cy = sum(y for x, y in contour) / len(contour) + eps
-        return cx, cy
-
-    @staticmethod
-    def _signed_area(pts):
-        """Returns the signed area of a polygon via the shoelace formula.
-
-        The sign encodes winding direction: positive = CCW, negative = CW
-        in Y-up coordinates. Used by draw() to check whether a contour's
-        current winding matches what FontForge expects for its nesting depth.
-
-        https://en.wikipedia.org/wiki/Shoelace_formula
-        """
-        n = len(pts)
-        return sum(
-            pts[i][0] * pts[(i + 1) % n][1] - pts[(i + 1) % n][0] * pts[i][1]
-            for i in range(n)
-        ) / 2
-
-    @staticmethod
-    def _point_in_polygon(px, py, polygon):
-        """Ray casting point-in-polygon test.
-
-        Shoots a horizontal ray rightward from (px, py) and counts edge
-        crossings: odd = inside, even = outside. Used by draw() to compute
-        nesting depth (how many other contours contain a given contour's
-        interior point).
-
-        https://en.wikipedia.org/wiki/Point_in_polygon#Ray_casting_algorithm
-        """
-        n = len(polygon)
-        inside = False
-        j = n - 1
-        for i in range(n):
-            xi, yi = polygon[i]
-            xj, yj = polygon[j]
-            if ((yi > py) != (yj > py)) and (px < (xj - xi) * (py - yi) / (yj - yi) + xi):
-                inside = not inside
-            j = i
-        return inside
+
+            self.contours.append(contour[::-1] if want_ccw != is_ccw else contour)
 
     def build(self):
-        """Returns the finalized font glyph object (T2CharString for CFF, TTGlyph for TrueType)."""
+        """Returns the finalized font glyph object (T2CharString for CFF, TTGlyph for TrueType),
+        encoded straight from the drawn contours (see outline_encoder)."""
         if self.use_cff:
-            glyph = self.pen.getCharString()
-        else:
-            glyph = self.pen.glyph()
-
-        return glyph
+            return encode_charstring(self.contours, self._get_charstring_width())
+        return encode_glyf(self.contours)
 
     def is_debug_codepoint(self):
         """Returns True if this glyph is one of a set of debug-tracked codepoints."""
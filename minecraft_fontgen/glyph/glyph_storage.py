@@ -2,6 +2,7 @@ from collections import OrderedDict
 from math import ceil, floor
 
 from minecraft_fontgen.glyph.glyph import Glyph
+from minecraft_fontgen.glyph.glyph_tile import GlyphTile
 from minecraft_fontgen.config import NOTDEF, DEFAULT_GLYPH_SIZE, UNITS_PER_EM
 
 class GlyphStorage:
@@ -26,7 +27,7 @@ class GlyphStorage:
             self.glyf = font["glyf"]
 
     def create_glyph(self, tile):
-        """Creates a new Glyph instance from tile data using this storage's font format."""
+        """Creates a new Glyph instance from a GlyphTile using this storage's font format."""
         return Glyph(tile, self.use_cff)
 
     def add(self, glyph: Glyph):
@@ -74,13 +75,7 @@ class GlyphStorage:
 
     def add_notdef(self):
         """Creates and adds the .notdef placeholder glyph."""
-        self.add(Glyph({
-            "unicode": None,
-            "codepoint": 0x0000,
-            "size": (DEFAULT_GLYPH_SIZE, DEFAULT_GLYPH_SIZE),
-            "location": (0, 0),
-            "output": None
-        }, self.use_cff))
+        self.add(Glyph(GlyphTile(None, 0x0000, (DEFAULT_GLYPH_SIZE, DEFAULT_GLYPH_SIZE)), self.use_cff))
 
     def finalize(self):
         """Finalizes the font by setting glyph order, charstrings/glyf entries, and metrics."""
@@ -0,0 +1,48 @@
+from minecraft_fontgen.config import DEFAULT_GLYPH_SIZE
+
+class GlyphTile:
+    """A traced glyph as consumed by precompute_glyph_scaling and Glyph.
+
+    Keeps only what those need: identity, tile size and ascent, source, debug SVG,
+    the traced metrics and the corner loops of the paths and holes. Tracing
+    intermediates (bitmaps, labeled grids, full edge loops, PIL crops) are not
+    referenced, so they can be freed once tracing finishes. Slotted, since a full
+    build holds one per glyph and style.
+    """
+
+    __slots__ = ("unicode", "codepoint", "size", "ascent", "source", "svg",
+                 "width", "lsb", "advance", "paths", "holes", "units_per_pixel", "scaled")
+
+    def __init__(self, unicode, codepoint, size, ascent=0, source=None, pixel_data=None, svg=None):
+        """Initializes from tracer output (see trace_bitmap_contours), keeping the corners of each contour.
+        Without pixel_data the glyph is empty with default metrics (e.g. .notdef)."""
+        self.unicode = unicode
+        self.codepoint = codepoint
+        self.size = size
+        self.ascent = ascent
+        self.source = source
+        self.svg = svg
+
+        if pixel_data is not None:
+            self.width = pixel_data["width"]
+            self.lsb = pixel_data["lsb"]
+            self.advance = pixel_data["advance"]
+            self.paths = [contour["corners"] for contour in pixel_data["paths"].values()]
+            self.holes = [contour["corners"] for contour in pixel_data["holes"].values()]
+        else:
+            self.width = DEFAULT_GLYPH_SIZE
+            self.lsb = 0
+            self.advance = DEFAULT_GLYPH_SIZE
+            self.paths = []
+            self.holes = []
+
+        # Set by precompute_glyph_scaling
+        self.units_per_pixel = None
+        self.scaled = None
+
+    def copy(self, **changes):
+        """Returns a shallow copy with the given fields replaced (e.g. unicode and codepoint)."""
+        tile = GlyphTile.__new__(GlyphTile)
+        for name in GlyphTile.__slots__:
+            setattr(tile, name, changes[name] if name in changes else getattr(self, name))
+        return tile
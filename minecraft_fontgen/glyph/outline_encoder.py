@@ -0,0 +1,133 @@
+from array import array
+from math import floor
+
+from fontTools.misc.psCharStrings import T2CharString
+from fontTools.ttLib.tables import ttProgram
+from fontTools.ttLib.tables._g_l_y_f import Glyph as TTGlyph, GlyphCoordinates
+
+# Type 2 operand stack limit used by fontTools' specializer (one slot kept free for subroutine calls)
+CHARSTRING_MAX_STACK = 48
+
+def encode_charstring(contours, width):
+    """Returns a T2CharString drawing the given closed polygons, with width encoded up front.
+
+    Equivalent to drawing each contour through a T2CharStringPen (moveTo, lineTo...,
+    closePath) and calling getCharString(), but built in one pass over the points:
+    coordinates are rounded to integers, consecutive zero-length lines dropped,
+    runs of same-direction horizontal/vertical lines summed, and alternating
+    hlineto/vlineto and rlineto runs combined up to the operand stack limit.
+    Pixel outlines are made of orthogonal (or, in italics, sheared) lines, so
+    most of a glyph ends up as a few long hlineto/vlineto runs.
+    """
+    ops = []
+    args = []
+    move = None # pending moveto, successive moves (lone-point contours) add up
+    last_op = None # raw category of the previous line, before zero-length lines are dropped
+    x0 = y0 = 0
+
+    for contour in contours:
+        for index, (x, y) in enumerate(contour):
+            x = floor(x + 0.5)
+            y = floor(y + 0.5)
+            dx = x - x0
+            dy = y - y0
+            x0 = x
+            y0 = y
+
+            if not index:
+                move = [move[0] + dx, move[1] + dy] if move else [dx, dy]
+                continue
+            if move:
+                _append_moveto(ops, args, move)
+                move = None
+                last_op = None
+
+            if dx and dy:
+                ops.append("rlineto")
+                args.append([dx, dy])
+                last_op = "rlineto"
+            elif dx or dy:
+                op = "hlineto" if dx else "vlineto"
+                if op == last_op:
+                    args[-1][0] += dx or dy
+                else:
+                    ops.append(op)
+                    args.append([dx or dy])
+                last_op = op
+            else:
+                last_op = "0lineto"
+
+    if move:
+        _append_moveto(ops, args, move)
+
+    # A horizontal/vertical line between two rlineto's is cheaper as an rlineto
+    for i in range(1, len(ops) - 1):
+        op = ops[i]
+        if (op == "hlineto" or op == "vlineto") and ops[i - 1] == ops[i + 1] == "rlineto":
+            ops[i] = "rlineto"
+            args[i] = [0, args[i][0]] if op == "vlineto" else [args[i][0], 0]
+
+    # Combine runs back to front, keeping the stack depth below the limit
+    program = []
+    if ops:
+        merged_ops = [ops[-1]]
+        merged_args = [args[-1]]
+        stack_use = len(args[-1])
+        for i in range(len(ops) - 2, -1, -1):
+            op = ops[i]
+            next_op = merged_ops[-1]
+            if ((op == next_op == "rlineto") or (op != next_op and op in ("hlineto", "vlineto") and next_op in ("hlineto", "vlineto"))) \
+                    and len(args[i]) + stack_use < CHARSTRING_MAX_STACK:
+                merged_ops[-1] = op
+                merged_args[-1] = args[i] + merged_args[-1]
+                stack_use += len(args[i])
+            else:
+                merged_ops.append(op)
+                merged_args.append(args[i])
+                stack_use = len(args[i])
+
+        for op, op_args in zip(reversed(merged_ops), reversed(merged_args)):
+            program.extend(op_args)
+            program.append(op)
+
+    program.insert(0, floor(width + 0.5))
+    program.append("endchar")
+    return T2CharString(program=program)
+
+def _append_moveto(ops, args, move):
+    """Appends a moveto by (dx, dy) as hmoveto/vmoveto when one component is zero."""
+    dx, dy = move
+    if dx and dy:
+        ops.append("rmoveto")
+        args.append(move)
+    elif dy:
+        ops.append("vmoveto")
+        args.append([dy])
+    else:
+        ops.append("hmoveto")
+        args.append([dx])
+
+def encode_glyf(contours):
+    """Returns a TrueType glyph holding the given closed polygons as on-curve points.
+
+    Equivalent to drawing each contour through a TTGlyphPen and calling glyph():
+    single-point contours are dropped, a closing point equal to the first is
+    removed, and coordinates are rounded to integers.
+    """
+    coordinates = []
+    end_points = []
+    for contour in contours:
+        if len(contour) < 2:
+            continue
+        points = contour[:-1] if contour[0] == contour[-1] else contour
+        coordinates.extend((floor(x + 0.5), floor(y + 0.5)) for x, y in points)
+        end_points.append(len(coordinates) - 1)
+
+    glyph = TTGlyph()
+    glyph.coordinates = GlyphCoordinates(coordinates)
+    glyph.endPtsOfContours = end_points
+    glyph.flags = array("B", [1]) * len(coordinates) # all on-curve
+    glyph.numberOfContours = len(end_points)
+    glyph.program = ttProgram.Program()
+    glyph.program.fromBytecode(b"")
+    return glyph
@@ -1,12 +1,13 @@
 import sys
 import io
 
+from concurrent.futures import ThreadPoolExecutor
 from minecraft_fontgen.cli import parse_args
-from minecraft_fontgen.piston import download_minecraft_assets
-from minecraft_fontgen.file_io import clean_directories, parse_provider_file, build_glyph_map
+from minecraft_fontgen.piston import start_minecraft_downloads
+from minecraft_fontgen.file_io import clean_directories, parse_provider_file, parse_alternate_fonts, build_glyph_map, GlyphMapStream
 from minecraft_fontgen.font_creator import create_font_files
 from minecraft_fontgen.config import OUTPUT_FONT_NAME
-from minecraft_fontgen.functions import set_silent, log, validate_fonts
+from minecraft_fontgen.functions import set_silent, set_cache, set_local_sources, set_jobs, shutdown_process_pool, log, validate_fonts
 from minecraft_fontgen.preview_font import write_preview_image, write_render_image
 
 # Force UTF-8 output to handle emoji in print statements
@@ -16,23 +17,44 @@ sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8", errors="repla
 def main():
     """Runs the font generation pipeline: download, parse, build glyph map, create fonts."""
     # Parse user provided arguments
-    silent, output_dir, output_fonts, mc_version, use_cff, output_ext, validate = parse_args()
+    silent, output_dir, output_fonts, mc_version, use_cff, output_ext, validate, cache_dir, cache_size, minecraft_dir, offline, jobs, stream = parse_args()
     set_silent(silent)
+    set_cache(cache_dir, cache_size)
+    set_local_sources(minecraft_dir, offline)
+    set_jobs(jobs)
 
     # Clean work and output directories
     clean_directories(output_dir)
 
-    # Download MC version, extract unifont + JAR assets
-    matched_file, matched_format, unifont_glyphs = download_minecraft_assets(mc_version)
+    try:
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            # Download MC version, extract unifont + JAR assets (in the background)
+            jar_future, unifont_future = start_minecraft_downloads(executor, mc_version)
 
-    # Parse provider glyphs from JAR bitmap PNGs (includes slicing)
-    providers = parse_provider_file(matched_file, matched_format)
+            # Parse provider and alternate font glyphs from JAR bitmap PNGs (includes slicing) as soon as
+            # the JAR is extracted, while unifont is still downloading
+            matched_file, matched_format = jar_future.result()
+            providers = parse_provider_file(matched_file, matched_format)
+            alternates = parse_alternate_fonts()
 
-    # Build unified glyph map with pre-computed scaling
-    glyph_map = build_glyph_map(providers, unifont_glyphs)
+            # Build unified glyph map with pre-computed scaling (the first step that needs unifont),
+            # or stream it into the font files chunk by chunk (--stream)
+            if stream:
+                glyph_map = GlyphMapStream(providers, unifont_future.result(), alternates)
+            else:
+                glyph_map = build_glyph_map(providers, unifont_future.result(), alternates)
+        except BaseException:
+            # Fail fast: don't wait for the other download when the JAR (or parsing it) failed
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
+        executor.shutdown()
 
-    # Generate all font files
-    font_files = create_font_files(glyph_map, use_cff, output_fonts, output_dir, OUTPUT_FONT_NAME, output_ext)
+        # Generate all font files
+        font_files = create_font_files(glyph_map, use_cff, output_fonts, output_dir, OUTPUT_FONT_NAME, output_ext)
+    finally:
+        # Stop the tracing worker processes (--jobs)
+        shutdown_process_pool()
 
     if validate and font_files:
         # Validate with FontForge (development only: --validate or FONTGEN_VALIDATE=1)
@@ -1,31 +1,83 @@
 import binascii
 import io
 import os
+import shutil
+import tempfile
 import zipfile
 
-from io import BytesIO
+import numpy as np
 
-from minecraft_fontgen.config import MINECRAFT_MANIFEST_URL, MINECRAFT_BIN_FILE, MINECRAFT_JSON_FILE, WORK_DIR, UNIFONT_PATH
-from minecraft_fontgen.functions import fetch_bytes, fetch_json, fetch_minecraft_resource, fetch_minecraft_resource_bytes, in_unifont_ranges, log
+from concurrent.futures import ThreadPoolExecutor
+from minecraft_fontgen.config import MINECRAFT_MANIFEST_URL, MINECRAFT_BIN_FILE, MINECRAFT_JSON_FILE, WORK_DIR, UNIFONT_PATH, MANIFEST_TTL, PARTIAL_JAR_DOWNLOAD, RANGE_TAIL_SIZE, DOWNLOAD_WORKERS
+from minecraft_fontgen.cache import get_cache
+from minecraft_fontgen.range_file import RangeFile, open_range_file
+from minecraft_fontgen.unifont_glyphs import UnifontGlyphs
+from minecraft_fontgen.functions import fetch_cached_json, fetch_to_file, fetch_object_json, find_local_file, parse_json, fetch_minecraft_resource, fetch_minecraft_resource_bytes, filter_unifont_ranges, get_unifont_ranges_fingerprint, log
 
 
 # ==========================================
 # === Entry point: download + extract
 # ==========================================
 
-def download_minecraft_assets(mc_version=None):
-    """Downloads and extracts Minecraft font assets and unifont fallbacks via the Piston API."""
+def start_minecraft_downloads(executor, mc_version=None):
+    """Resolves the version metadata, then schedules the client JAR and the unifont chain (asset index,
+    include file, ZIPs) on the executor, since they don't depend on each other.
+
+    Returns (jar_future, unifont_future), resolving to (matched_file, matched_format) and unifont_glyphs,
+    so callers can start work on the JAR assets while unifont is still downloading.
+    """
     log(f"🧩 Processing minecraft piston data...")
-    version_json = select_minecraft_version(mc_version)
-    version_data = fetch_json(version_json["url"], label="version metadata")
+    version_data = find_local_version(mc_version)
+    if version_data is None:
+        version_json = select_minecraft_version(mc_version)
+        version_id = version_json["id"]
+        version_data = fetch_object_json(version_json["url"], version_json.get("sha1"), label="version metadata",
+                                         local_path=f"versions/{version_id}/{version_id}.json")
 
     if "assetIndex" not in version_data:
         raise RuntimeError("→ ❌ Missing asset index in version data.")
 
-    # Download and extract client JAR
-    jar_data = BytesIO(fetch_bytes(version_data["downloads"]["client"]["url"], label="client.jar"))
-    #save_jar_to_disk(jar_data, WORK_DIR)
-    files = extract_font_assets(jar_data, WORK_DIR)
+    jar_future = executor.submit(download_client_jar, version_data["downloads"]["client"], version_data["id"])
+    unifont_future = executor.submit(download_unifont, version_data["assetIndex"])
+    return jar_future, unifont_future
+
+def download_client_jar(client, version_id):
+    """Extracts font assets from the client JAR and detects the font provider format.
+    Returns (matched_file, matched_format).
+
+    The JAR is read from the local .minecraft / mirror directory when available, then from the font
+    entries cached by an earlier run. Otherwise only the font entries are fetched when the server
+    supports range requests, or the JAR is streamed to a temporary file and verified against the
+    published SHA-1. Downloaded font entries are cached, so warm runs (and --offline) skip the JAR.
+    """
+    jar_data = None
+    downloaded = False
+    local_jar = find_local_file(f"versions/{version_id}/{version_id}.jar", sha1=client.get("sha1"))
+    if local_jar:
+        log(f"→ 📁 Using local {version_id}.jar...")
+        jar_data = open(local_jar, "rb")
+    else:
+        jar_data = load_cached_font_assets(client)
+        if jar_data is not None:
+            log(f"→ 💾 Using cached {version_id}.jar font assets...")
+
+    if jar_data is None and PARTIAL_JAR_DOWNLOAD:
+        downloaded = True
+        jar_data = open_range_file(client["url"], RANGE_TAIL_SIZE, label="client.jar")
+        if jar_data is not None and client.get("size") is not None and jar_data.size != client["size"]:
+            raise RuntimeError(f"→ ❌ client.jar size mismatch ({jar_data.size} of {client['size']} bytes).")
+
+    if jar_data is None:
+        downloaded = True
+        jar_data = fetch_to_file(client["url"], tempfile.TemporaryFile(dir=WORK_DIR),
+                                 sha1=client.get("sha1"), size=client.get("size"), label="client.jar")
+
+    with jar_data:
+        #save_jar_to_disk(jar_data, WORK_DIR)
+        files = extract_font_assets(jar_data, WORK_DIR)
+
+    if downloaded:
+        store_font_assets(client, files, WORK_DIR)
 
     matched_file = None
     matched_format = None
@@ -44,25 +96,48 @@ def download_minecraft_assets(mc_version=None):
     if not matched_file:
         log("→ ❌ Could not detect font assets format.")
 
-    # Download unifont fallback glyphs (not available in older versions)
-    unifont_glyphs = None
-    try:
-        asset_index = fetch_json(version_data["assetIndex"]["url"], label="asset index")
-        unifont_objects, size_overrides = find_unifont_objects(asset_index)
-        unifont_glyphs = download_unifont_glyphs(unifont_objects)
-    except RuntimeError:
+    return matched_file, matched_format
+
+def download_unifont(asset_index_json):
+    """Downloads unifont fallback glyphs via the asset index. Returns None when the version has no unifont.
+    Download, offline and verification failures propagate, so a broken mirror or cache isn't mistaken for it."""
+    asset_index = fetch_object_json(asset_index_json["url"], asset_index_json.get("sha1"), label="asset index",
+                                    local_path=f"assets/indexes/{asset_index_json.get('id')}.json")
+    found = find_unifont_objects(asset_index)
+    if found is None:
         log("→ ⚠️ Unifont not available for this version, skipping...")
+        return None
 
-    return matched_file, matched_format, unifont_glyphs
+    unifont_objects, size_overrides = found
+    return download_unifont_glyphs(unifont_objects)
 
 
 # ==========================================
 # === Version selection
 # ==========================================
 
+def find_local_version(mc_version):
+    """Reads a pinned version's JSON from the local .minecraft / mirror directory, skipping the manifest.
+    Returns None for latest/latest-snapshot, interactive selection, or versions not available locally."""
+    if not mc_version or mc_version in ("latest", "latest-snapshot"):
+        return None
+
+    path = find_local_file(f"versions/{mc_version}/{mc_version}.json")
+    if not path:
+        return None
+
+    log(f"→ 📁 Using local version {mc_version}")
+    with open(path, encoding="utf-8") as f:
+        return parse_json(f.read())
+
 def select_minecraft_version(mc_version=None):
-    """Selects a Minecraft version. Uses mc_version directly if provided, otherwise prompts interactively."""
-    versions = fetch_minecraft_versions()
+    """Selects a Minecraft version. Uses mc_version directly if provided, otherwise prompts interactively.
+    Pinned versions resolve from the cached manifest without revalidation unless they aren't listed in it."""
+    pinned = mc_version and mc_version not in ("latest", "latest-snapshot")
+    versions = fetch_minecraft_versions(max_age=None if pinned else MANIFEST_TTL)
+
+    if pinned and not any(mc_version in versions[version_type] for version_type in ["releases", "snapshots"]):
+        versions = fetch_minecraft_versions(max_age=0)
 
     if mc_version:
         if mc_version == "latest":
@@ -129,15 +204,17 @@ def select_minecraft_version(mc_version=None):
 
     return selected_data
 
-def fetch_minecraft_versions():
-    """Fetches the Minecraft version manifest and organizes versions by type."""
-    manifest = fetch_json(MINECRAFT_MANIFEST_URL, label="version manifest")
+def fetch_minecraft_versions(max_age=MANIFEST_TTL):
+    """Fetches the Minecraft version manifest (cached, see fetch_cached_json) and organizes versions by type."""
+    manifest = fetch_cached_json(MINECRAFT_MANIFEST_URL, max_age=max_age, label="version manifest")
 
     def filter_type(version_type):
         return {
             version["id"]: {
+                "id": version["id"],
                 "type": version["type"],
-                "url": version["url"]
+                "url": version["url"],
+                "sha1": version.get("sha1")
             }
             for version in manifest["versions"] if version["type"] == version_type}
 
@@ -159,18 +236,77 @@ def extract_font_assets(jar_data, output_path):
     extracted = []
 
     with zipfile.ZipFile(jar_data) as jar:
-        for file in jar.namelist():
-            if file.endswith("default.json") or "font/" in file:
-                jar.extract(file, path=output_path)
-                extracted.append(file)
+        members = [info for info in jar.infolist() if is_font_asset(info.filename)]
+
+        # Remote JAR: fetch every member's local header + data in as few range requests as possible
+        if isinstance(jar_data, RangeFile):
+            jar_data.prefetch([_member_range(info) for info in members])
+
+        for info in members:
+            jar.extract(info, path=output_path)
+            extracted.append(info.filename)
+
+    if isinstance(jar_data, RangeFile):
+        log(f"→ 🌐 Fetched {jar_data.downloaded // 1024} KB of {jar_data.size // 1024} KB "
+            f"in {jar_data.request_count} range requests")
 
     return extracted
 
+def font_assets_cache_key(client):
+    """Returns the object cache key for a client JAR's font entries, or None if the JAR has no published SHA-1."""
+    return f"{client['sha1']}-fonts" if client.get("sha1") else None
+
+def load_cached_font_assets(client):
+    """Returns a ZIP (BytesIO) of the client JAR's font entries saved by store_font_assets, or None on a miss.
+    Entries failing the ZIP CRC check are dropped and reported as a miss."""
+    cache = get_cache("objects")
+    key = font_assets_cache_key(client)
+    data = cache.get(key) if cache and key else None
+    if data is None:
+        return None
+
+    try:
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            if archive.testzip() is None:
+                return io.BytesIO(data)
+    except (zipfile.BadZipFile, OSError):
+        pass
+    log("→ ⚠️ Cached client.jar font assets are corrupt, downloading again...")
+    cache.remove(key)
+    return None
+
+def store_font_assets(client, files, output_path):
+    """Caches the font entries extracted from a downloaded client JAR as a small ZIP (see load_cached_font_assets)."""
+    cache = get_cache("objects")
+    key = font_assets_cache_key(client)
+    if not cache or not key:
+        return
+
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for file in files:
+            path = os.path.join(output_path, file)
+            if os.path.isfile(path):
+                archive.write(path, file)
+    cache.put(key, buffer.getvalue())
+
+def is_font_asset(file):
+    """Returns True if a JAR entry is a font asset (default.json, font providers, font textures)."""
+    return file.endswith("default.json") or "font/" in file
+
+def _member_range(info):
+    """Returns the (start, end) byte range of a ZIP member's local header and compressed data.
+    The local extra field may be longer than the central directory copy, so some slack is added."""
+    header_size = 30 + len(info.orig_filename.encode("utf-8")) + len(info.extra)
+    return info.header_offset, info.header_offset + header_size + info.compress_size + 1024
+
 def save_jar_to_disk(jar_data, output_path):
-    """Writes the downloaded JAR BytesIO to disk as minecraft.jar."""
+    """Writes the downloaded JAR file object to disk as minecraft.jar."""
     log(f"→ 📦 Extracting client.jar...")
+    jar_data.seek(0)
     with open(f"{output_path}/minecraft.jar", "wb") as f:
-        f.write(jar_data.getbuffer())
+        shutil.copyfileobj(jar_data, f)
+    jar_data.seek(0)
 
 
 # ==========================================
@@ -178,7 +314,8 @@ def save_jar_to_disk(jar_data, output_path):
 # ==========================================
 
 def find_unifont_objects(asset_index):
-    """Locates unifont ZIP file hashes and size overrides in the Minecraft asset index."""
+    """Locates unifont ZIP file hashes and size overrides in the Minecraft asset index.
+    Returns (found, size_overrides), or None when the index has no unifont include or it lists no ZIPs."""
     log(f"🧩 Processing unifont objects...")
     found = {}
     size_overrides = []
@@ -187,7 +324,8 @@ def find_unifont_objects(asset_index):
     # Always read the include file to get hex_file paths
     include_json = objects.get(UNIFONT_PATH)
     if not include_json or "hash" not in include_json:
-        raise RuntimeError(f"Could not locate {UNIFONT_PATH} in asset index")
+        log(f"→ ⚠️ Could not locate {UNIFONT_PATH} in asset index.")
+        return None
 
     # Download and parse the include file
     include = fetch_minecraft_resource(include_json["hash"], label="unifont index")
@@ -211,74 +349,132 @@ def find_unifont_objects(asset_index):
             size_overrides.extend(overrides)
 
     if not found:
-        raise RuntimeError("Could not locate unifont ZIPs from include file")
+        log("→ ⚠️ Could not locate unifont ZIPs from include file.")
+        return None
 
     return found, size_overrides
 
 def download_unifont_glyphs(unifont_objects):
-    """Downloads unifont ZIP archives and parses all .hex files into bitmap glyph data."""
-    glyphs = {}
+    """Downloads unifont ZIP archives concurrently and parses all .hex files into bitmap glyph data.
+    Parsed ZIPs are cached as memory-mappable .npy files keyed by the ZIP hash and the enabled unifont
+    ranges, so warm runs skip both the download and the parse. Later files override earlier ones."""
+    glyphs = UnifontGlyphs()
 
-    for path, sha1 in unifont_objects.items():
-        zip_bytes = fetch_minecraft_resource_bytes(sha1, label=path)
-        log(f"→ 📦 Extracting {path}...")
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as executor:
+        for parsed in executor.map(_load_unifont_zip, unifont_objects.items()):
+            glyphs.update(parsed) # later files override, asset index order
 
-        with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zip_file:
-            for name in zip_file.namelist():
-                if not name.lower().endswith(".hex"):
-                    continue
+    return glyphs
 
-                glyph = parse_unifont_hex_bytes(zip_file.read(name))
-                glyphs.update(glyph) # later files override
+def _load_unifont_zip(unifont_object):
+    """Returns the parsed glyphs of a (path, sha1) unifont ZIP, from the unifont cache when available."""
+    path, sha1 = unifont_object
+    cache = get_cache("unifont")
+    key = f"{sha1}-{get_unifont_ranges_fingerprint()}-v{UnifontGlyphs.FORMAT_VERSION}"
+
+    cached_path = cache.get_path(key) if cache else None
+    if cached_path:
+        try:
+            glyphs = UnifontGlyphs.load(cached_path)
+            log(f"→ 📦 Loaded {path} from cache...")
+            return glyphs
+        except (OSError, ValueError):
+            cache.remove(key)
+
+    glyphs = _parse_unifont_zip(path, fetch_minecraft_resource_bytes(sha1, label=path))
+    if cache:
+        cache.put(key, glyphs.to_bytes())
+    return glyphs
+
+def _parse_unifont_zip(path, zip_bytes):
+    """Parses all .hex files in a unifont ZIP archive into bitmap glyph data."""
+    glyphs = UnifontGlyphs()
+    log(f"→ 📦 Extracting {path}...")
+
+    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zip_file:
+        for name in zip_file.namelist():
+            if not name.lower().endswith(".hex"):
+                continue
+
+            glyph = parse_unifont_hex_bytes(zip_file.read(name))
+            glyphs.update(glyph) # later files override
 
     return glyphs
 
 def parse_unifont_hex_bytes(hex_bytes: bytes):
     """
-    Parse GNU Unifont .hex content -> dict[int, list[list[int]]]
-    Each glyph becomes a 16-row bitmap of 0/1 ints (duospaced 8x16 or 16x16; some wider blocks exist).
+    Parse GNU Unifont .hex content -> UnifontGlyphs
+    Each glyph becomes a 16-row bitmap of 0/1 pixels (duospaced 8x16 or 16x16; some wider blocks exist).
+    Glyphs are grouped by hex length and each group is decoded in one unhexlify pass, rows are kept packed.
     """
-    glyphs = {}
+    codepoints = []
+    bitmaps_hex = []
 
     for raw_line in hex_bytes.splitlines():
-        line = raw_line.strip()
-
-        if not line or b':' not in line:
+        cp_hex, separator, bmp_hex = raw_line.strip().partition(b':')
+        if not separator:
             continue
 
-        cp_hex, bmp_hex = line.split(b':', 1)
         try:
             codepoint = int(cp_hex, 16)
         except ValueError:
             continue
 
-        # Skip codepoints outside desired ranges
-        if not in_unifont_ranges(codepoint):
-            continue
-
-        # Each two hex chars -> one byte = 8 horizontal pixels; bitmap is 16 rows high.
-        byte_len = len(bmp_hex) // 2
-        if byte_len == 0:
-            continue
+        codepoints.append(codepoint)
+        bitmaps_hex.append(bmp_hex)
 
-        bytes_per_row = byte_len // 16 # Unifont rows are concatenated with no separators: 16 rows, each width/8 bytes.
-        width = bytes_per_row * 8 # Width is commonly 8 (32 hex digits) or 16 (64 hex digits) pixels wide, infer from total hex length.
-        img_bits = []
-        row_offset = 0
-        raw = binascii.unhexlify(bmp_hex)
+    if not codepoints:
+        return UnifontGlyphs()
 
-        for _ in range(16):
-            row = []
-            row_bytes = raw[row_offset: row_offset + bytes_per_row]
-            row_offset += bytes_per_row
+    # Later lines override earlier ones for the same codepoint
+    codepoints = np.array(codepoints, dtype=np.int64)
+    _, last_reversed = np.unique(codepoints[::-1], return_index=True)
+    keep = np.zeros(len(codepoints), dtype=bool)
+    keep[len(codepoints) - 1 - last_reversed] = True
 
-            for b in row_bytes:
-                for bit in range(7, -1, -1):
-                    row.append((b >> bit) & 1)
+    # Skip codepoints outside desired ranges
+    keep &= filter_unifont_ranges(codepoints)
 
-            # Trim to declared width (safety)
-            img_bits.append(row[:width])
+    lengths = np.fromiter(map(len, bitmaps_hex), dtype=np.int64, count=len(bitmaps_hex))
+    groups = []
 
-        glyphs[codepoint] = img_bits
+    for hex_len in np.unique(lengths).tolist():
+        # Each two hex chars -> one byte = 8 horizontal pixels; bitmap is 16 rows high.
+        byte_len = hex_len // 2
+        bytes_per_row = byte_len // 16 # Unifont rows are concatenated with no separators: 16 rows, each width/8 bytes.
+        if hex_len % 2 or bytes_per_row == 0:
+            continue # malformed line
 
-    return glyphs
+        indices = np.flatnonzero((lengths == hex_len) & keep)
+        try:
+            raw = binascii.unhexlify(b"".join([bitmaps_hex[i] for i in indices]))
+        except binascii.Error:
+            # A non-hex digit somewhere in the group, drop those lines and decode the rest
+            indices = np.array([i for i in indices if _is_hex(bitmaps_hex[i])], dtype=np.int64)
+            raw = binascii.unhexlify(b"".join([bitmaps_hex[i] for i in indices]))
+        rows = np.frombuffer(raw, dtype=np.uint8).reshape(len(indices), byte_len)[:, :16 * bytes_per_row]
+        groups.append((indices, rows.reshape(len(indices), 16, bytes_per_row)))
+
+    if not groups:
+        return UnifontGlyphs()
+
+    # Width is commonly 8 (32 hex digits) or 16 (64 hex digits) pixels wide, infer from total hex length.
+    # Rows stay packed 8 pixels per byte; narrower glyphs are zero-padded to the widest row.
+    bits = np.zeros((sum(len(indices) for indices, _ in groups), 16, max(rows.shape[2] for _, rows in groups)), dtype=np.uint8)
+    widths = np.empty(len(bits), dtype=np.int64)
+    offset = 0
+    for indices, rows in groups:
+        bits[offset:offset + len(indices), :, :rows.shape[2]] = rows
+        widths[offset:offset + len(indices)] = rows.shape[2] * 8
+        offset += len(indices)
+
+    group_codepoints = np.concatenate([codepoints[indices] for indices, _ in groups])
+    return UnifontGlyphs.from_packed(group_codepoints, widths, bits)
+
+def _is_hex(digits):
+    """Returns True if digits is an even-length run of hex digits."""
+    try:
+        binascii.unhexlify(digits)
+    except binascii.Error:
+        return False
+    return True
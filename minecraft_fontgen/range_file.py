@@ -0,0 +1,124 @@
+import io
+import re
+
+from minecraft_fontgen.config import RANGE_BLOCK_SIZE
+from minecraft_fontgen.functions import http_get, log
+
+class RangeFile(io.RawIOBase):
+    """Read-only, seekable view of a remote file that downloads byte ranges on demand via HTTP Range requests.
+
+    Downloaded ranges are kept as (start, bytes) segments so that zipfile can
+    seek around the central directory and entries without refetching.
+    """
+
+    def __init__(self, url, size, segments=None):
+        """Initializes the view with the remote file size and any already downloaded segments."""
+        super().__init__()
+        self.url = url
+        self.size = size
+        self.position = 0
+        self.segments = list(segments or [])
+        self.request_count = 0
+        self.downloaded = sum(len(data) for _, data in self.segments)
+
+    def readable(self):
+        """Returns True (io.RawIOBase protocol)."""
+        return True
+
+    def seekable(self):
+        """Returns True (io.RawIOBase protocol)."""
+        return True
+
+    def tell(self):
+        """Returns the current read position."""
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        """Moves the read position. Seeking never triggers a download."""
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self.position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+
+        if position < 0:
+            raise ValueError(f"Negative seek position: {position}")
+        self.position = position
+        return position
+
+    def readinto(self, buffer):
+        """Reads into buffer from the current position, downloading the range if it isn't cached."""
+        count = min(len(buffer), self.size - self.position)
+        if count <= 0:
+            return 0
+
+        data = self._read_range(self.position, self.position + count)
+        buffer[:count] = data
+        self.position += count
+        return count
+
+    def prefetch(self, ranges, gap=RANGE_BLOCK_SIZE):
+        """Downloads (start, end) byte ranges up front, merging ranges closer than gap into one request."""
+        merged = []
+        for start, end in sorted(ranges):
+            start, end = max(0, start), min(self.size, end)
+            if merged and start - merged[-1][1] <= gap:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        for start, end in merged:
+            if self._find_segment(start, end) is None:
+                self._fetch(start, end)
+
+    def _find_segment(self, start, end):
+        """Returns the cached bytes for [start, end), or None if no single segment covers it."""
+        for segment_start, data in self.segments:
+            if segment_start <= start and end <= segment_start + len(data):
+                return data[start - segment_start:end - segment_start]
+        return None
+
+    def _read_range(self, start, end):
+        """Returns bytes [start, end), fetching at least RANGE_BLOCK_SIZE bytes on a miss."""
+        data = self._find_segment(start, end)
+        if data is None:
+            fetch_end = min(self.size, max(end, start + RANGE_BLOCK_SIZE))
+            data = self._fetch(start, fetch_end)[:end - start]
+        return data
+
+    def _fetch(self, start, end):
+        """Downloads bytes [start, end) with a single Range request and stores them as a segment."""
+        response = http_get(self.url, headers={"Range": f"bytes={start}-{end - 1}"})
+        response.raise_for_status()
+        if response.status_code != 206:
+            raise RuntimeError(f"→ ❌ Server stopped honoring range requests for {self.url}.")
+
+        data = response.content
+        if len(data) != end - start:
+            raise RuntimeError(f"→ ❌ Short range response for {self.url} ({len(data)} of {end - start} bytes).")
+
+        self.segments.append((start, data))
+        self.request_count += 1
+        self.downloaded += len(data)
+        return data
+
+def open_range_file(url, tail_size, label=None):
+    """Opens a RangeFile over url with its last tail_size bytes pre-loaded (enough for a ZIP's end of
+    central directory). Returns None if the server ignores Range, so callers can fall back to a full download."""
+    log(f"→ 🌐 Reading {label or url} directory...")
+    with http_get(url, label=label, headers={"Range": f"bytes=-{tail_size}"}, stream=True) as response:
+        response.raise_for_status()
+        content_range = re.match(r"bytes (\d+)-(\d+)/(\d+)", response.headers.get("Content-Range", ""))
+        if response.status_code != 206 or not content_range:
+            log(f"→ ⚠️ Range requests not supported for {label or url}, downloading in full...")
+            return None
+
+        start, _, size = (int(value) for value in content_range.groups())
+        data = response.content
+
+    range_file = RangeFile(url, size, [(start, data)])
+    range_file.request_count = 1
+    return range_file
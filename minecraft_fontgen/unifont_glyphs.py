@@ -0,0 +1,119 @@
+import io
+
+import numpy as np
+
+def record_dtype(row_bytes):
+    """Returns the record dtype for glyphs whose rows are packed into row_bytes bytes."""
+    return np.dtype([("codepoint", "<i4"), ("width", "<u2"), ("bits", "u1", (16, row_bytes))])
+
+class UnifontGlyphs:
+    """Parsed unifont bitmaps, stored as a codepoint-sorted record array of packed bits.
+
+    Each record holds a codepoint, its pixel width and its 16 rows packed 8 pixels
+    per byte (padded to the widest glyph). The container behaves like a read-only
+    {codepoint: bitmap} mapping ordered by codepoint, unpacking each bitmap into a
+    fresh (16, width) uint8 array of 0/1 pixels on access. Because the records are
+    a single flat array, they can be saved as one .npy file and memory-mapped back.
+    """
+
+    FORMAT_VERSION = 1 # bump when the record layout changes, invalidates cached files
+
+    def __init__(self, records=None):
+        """Initializes from a record array (see record_dtype) sorted by unique codepoint."""
+        self.records = records if records is not None else np.empty(0, dtype=record_dtype(1))
+        self.codepoints = self.records["codepoint"]
+
+    @classmethod
+    def from_packed(cls, codepoints, widths, bits):
+        """Creates an instance from unique codepoints, pixel widths and (N, 16, row_bytes) packed rows."""
+        records = np.empty(len(codepoints), dtype=record_dtype(max(1, bits.shape[2])))
+        records["codepoint"] = codepoints
+        records["width"] = widths
+        records["bits"] = 0
+        records["bits"][:, :, :bits.shape[2]] = bits
+        return cls(records[np.argsort(records["codepoint"], kind="stable")])
+
+    @classmethod
+    def load(cls, path):
+        """Memory-maps a .npy file holding to_bytes() content. Raises ValueError if it isn't a compatible record array."""
+        records = np.load(path, mmap_mode="r", allow_pickle=False)
+        if records.dtype.names != record_dtype(1).names:
+            raise ValueError(f"Not a unifont glyph file: {path}")
+        return cls(records)
+
+    def to_bytes(self):
+        """Serializes the records as .npy file content."""
+        buffer = io.BytesIO()
+        np.save(buffer, np.ascontiguousarray(self.records), allow_pickle=False)
+        return buffer.getvalue()
+
+    def __len__(self):
+        """Returns the number of glyphs."""
+        return len(self.records)
+
+    def __iter__(self):
+        """Iterates codepoints in ascending order."""
+        return iter(self.codepoints.tolist())
+
+    def __contains__(self, codepoint):
+        """Returns True if a bitmap exists for codepoint."""
+        return self._find(codepoint) is not None
+
+    def __getitem__(self, codepoint):
+        """Returns the (16, width) bitmap for codepoint."""
+        index = self._find(codepoint)
+        if index is None:
+            raise KeyError(codepoint)
+        return np.unpackbits(self.records["bits"][index], axis=1, count=int(self.records["width"][index]))
+
+    def _find(self, codepoint):
+        """Returns the record index of codepoint, or None if missing."""
+        index = int(np.searchsorted(self.codepoints, codepoint))
+        if index < len(self.codepoints) and self.codepoints[index] == codepoint:
+            return index
+        return None
+
+    def items(self):
+        """Yields (codepoint, bitmap) pairs in ascending codepoint order."""
+        bits = self.records["bits"]
+        for index, (codepoint, width) in enumerate(zip(self.codepoints.tolist(), self.records["width"].tolist())):
+            yield codepoint, np.unpackbits(bits[index], axis=1, count=width)
+
+    def take(self, indices):
+        """Returns a new UnifontGlyphs holding the records at the given (ascending) indices."""
+        return UnifontGlyphs(self.records[indices])
+
+    def emboldened(self):
+        """Returns a new UnifontGlyphs with every ink pixel copied one column to the right (the bold variant),
+        computed with one shift-and-OR over all packed rows. Pixels shifted past a glyph's width are cleared."""
+        bits = self.records["bits"]
+        carry = np.zeros_like(bits)
+        carry[..., 1:] = (bits[..., :-1] & 1) << 7 # last pixel of each byte moves to the first of the next
+        bold_bits = bits | (bits >> 1) | carry
+
+        row_pixels = np.arange(bits.shape[2] * 8)
+        width_mask = np.packbits(row_pixels < self.records["width"][:, None].astype(np.intp), axis=1)
+
+        records = np.array(self.records)
+        records["bits"] = bold_bits & width_mask[:, None, :]
+        return UnifontGlyphs(records)
+
+    def update(self, other):
+        """Merges another UnifontGlyphs into this one; glyphs from other override existing codepoints."""
+        if not len(other):
+            return
+        if not len(self):
+            self.records, self.codepoints = other.records, other.codepoints # no copy, keeps a memory map mapped
+            return
+
+        row_bytes = max(self.records.dtype["bits"].shape[1], other.records.dtype["bits"].shape[1])
+        records = np.zeros(len(self.records) + len(other.records), dtype=record_dtype(row_bytes))
+        for part, source in ((records[:len(self.records)], self.records), (records[len(self.records):], other.records)):
+            part["codepoint"] = source["codepoint"]
+            part["width"] = source["width"]
+            part["bits"][:, :, :source.dtype["bits"].shape[1]] = source["bits"]
+
+        # Keep the last occurrence of each codepoint (np.unique returns them sorted)
+        _, last_reversed = np.unique(records["codepoint"][::-1], return_index=True)
+        self.records = records[len(records) - 1 - last_reversed]
+        self.codepoints = self.records["codepoint"]
@@ -0,0 +1,18 @@
+import pytest
+
+import minecraft_fontgen.config as config
+
+from minecraft_fontgen.file_io import clear_trace_memo
+from minecraft_fontgen.functions import set_cache, set_silent
+
+@pytest.fixture(autouse=True)
+def isolated_run():
+    """Runs every test silently, without the persistent cache and with an empty trace memo."""
+    cache_dir, silent = config.CACHE_DIR, config.SILENT_LOG
+    set_silent(True)
+    set_cache(None)
+    clear_trace_memo()
+    yield
+    clear_trace_memo()
+    set_cache(cache_dir)
+    set_silent(silent)
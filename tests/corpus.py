@@ -0,0 +1,97 @@
+"""Bitmaps shared by the tracer, scaling and outline tests.
+
+The synthetic corpus covers the shapes the tracer has to get right: empty and
+full tiles, lone pixels, rings and nested islands, checkerboards full of
+diagonal pinch points, a hand-drawn rook with battlements (the U+26C3 case)
+and seeded random noise at provider and unifont sizes. Set FONTGEN_TEST_UNIFONT
+to the path of a real unifont ZIP to add a sample of its glyphs.
+"""
+import os
+
+import numpy as np
+
+ROOK = """
+................
+................
+.XX.XX.XX.XX.XX.
+.XX.XX.XX.XX.XX.
+.XXXXXXXXXXXXXX.
+..XXXXXXXXXXXX..
+...XX..XX..XX...
+...XX..XX..XX...
+...XXXXXXXXXX...
+...XX.X..X.XX...
+...XXX.XX.XXX...
+...XX.X..X.XX...
+..XXXXXXXXXXXX..
+.XXXXXXXXXXXXXX.
+.XXXXXXXXXXXXXX.
+................
+"""
+
+def parse_bitmap(text):
+    """Returns a uint8 0/1 bitmap from rows of "X" (ink) and "." (background)."""
+    return np.array([[char == "X" for char in row] for row in text.split()], dtype=np.uint8)
+
+def ring(height, width, depth):
+    """Returns depth concentric one-pixel rings, alternating ink and background, with a dot in the middle."""
+    bitmap = np.zeros((height, width), dtype=np.uint8)
+    for level in range(depth):
+        inner = bitmap[level * 2:height - level * 2, level * 2:width - level * 2]
+        if min(inner.shape) < 1:
+            break
+        inner[[0, -1], :] = 1
+        inner[:, [0, -1]] = 1
+    bitmap[height // 2, width // 2] = 1
+    return bitmap
+
+def checkerboard(height, width, phase=0):
+    """Returns a checkerboard, every ink pixel touching its neighbours only at the corners."""
+    rows, columns = np.indices((height, width))
+    return ((rows + columns + phase) % 2).astype(np.uint8)
+
+def synthetic_bitmaps(random_count=400, seed=2024):
+    """Returns [(name, bitmap)] covering the edge cases above plus random_count seeded random bitmaps."""
+    bitmaps = [
+        ("empty", np.zeros((8, 8), dtype=np.uint8)),
+        ("full", np.ones((8, 8), dtype=np.uint8)),
+        ("pixel", np.pad(np.ones((1, 1), dtype=np.uint8), ((3, 4), (2, 5)))),
+        ("corner pixel", np.pad(np.ones((1, 1), dtype=np.uint8), ((0, 7), (7, 0)))),
+        ("diagonal", np.eye(8, dtype=np.uint8)),
+        ("anti-diagonal", np.fliplr(np.eye(16, dtype=np.uint8))),
+        ("rook", parse_bitmap(ROOK)),
+        ("checkerboard 8", checkerboard(8, 8)),
+        ("checkerboard 16", checkerboard(16, 16, 1)),
+        ("checkerboard 12x9", checkerboard(12, 9)),
+        ("rings 8", ring(8, 8, 2)),
+        ("rings 16", ring(16, 16, 4)),
+        ("rings 16x8", ring(16, 8, 2)),
+    ]
+
+    rng = np.random.default_rng(seed)
+    shapes = [(8, 8), (12, 9), (16, 8), (16, 16)]
+    densities = [0.15, 0.3, 0.45, 0.6, 0.8]
+    for index in range(random_count):
+        shape = shapes[index % len(shapes)]
+        density = densities[index // len(shapes) % len(densities)]
+        bitmaps.append((f"random {index}", (rng.random(shape) < density).astype(np.uint8)))
+
+    return bitmaps
+
+def unifont_bitmaps(limit=2000):
+    """Returns [(name, bitmap)] for an evenly spaced sample of the real unifont ZIP at FONTGEN_TEST_UNIFONT,
+    or [] when it isn't set."""
+    path = os.environ.get("FONTGEN_TEST_UNIFONT")
+    if not path:
+        return []
+
+    from minecraft_fontgen.piston import _parse_unifont_zip
+    with open(path, "rb") as file:
+        glyphs = _parse_unifont_zip(path, file.read())
+
+    step = max(1, len(glyphs) // limit)
+    return [(f"U+{codepoint:04X}", bitmap) for index, (codepoint, bitmap) in enumerate(glyphs.items()) if index % step == 0]
+
+def corpus_bitmaps(random_count=400):
+    """Returns the synthetic corpus followed by the optional real unifont sample."""
+    return synthetic_bitmaps(random_count) + unifont_bitmaps()
@@ -0,0 +1,130 @@
+"""Glyph scaling as it was before the single-pass NumPy scaling, shared vertex index and stack-based
+split rewrites, kept verbatim as the oracle for the scaling tests. It scales GlyphTiles one at a time
+and sets tile.scaled to {"outer", "holes"} (no nesting depths)."""
+import sys
+
+from tqdm import tqdm
+from minecraft_fontgen.config import ASCENT, DEFAULT_GLYPH_SIZE, UNITS_PER_EM
+from minecraft_fontgen.functions import is_silent
+
+def precompute_glyph_scaling(glyph_map):
+    """Scales glyph coordinates from pixel space to font units, splits self-touching contours, and insets shared vertices."""
+    total = sum(len(tiles) for tiles in glyph_map.values())
+    with tqdm(total=total, desc=" → 🔣 Scaling", unit="glyph",
+              ncols=80, leave=False, file=sys.stdout, disable=is_silent()) as progress:
+        for style_key in glyph_map:
+            for cp, tile in glyph_map[style_key].items():
+                progress.update(1)
+
+                # Compute scale factor.
+                # Provider glyphs use a uniform pixel scale (UNITS_PER_EM /
+                # DEFAULT_GLYPH_SIZE = 128) so that 1 Minecraft pixel = 1 font
+                # unit regardless of provider height.  This keeps the base
+                # character of accented glyphs (height=12) the same size as the
+                # equivalent standard glyph (height=8), with accents extending
+                # above the normal ascent line.
+                # Unifont fallback glyphs use ASCENT / ascent to compress 16px
+                # rows into the same visual space as 8px provider rows.
+                ascent = tile.ascent
+                if tile.source == "unifont" and ascent > 0:
+                    scale = ASCENT / ascent
+                else:
+                    scale = UNITS_PER_EM / DEFAULT_GLYPH_SIZE
+                tile.units_per_pixel = scale
+
+                outer_paths = [path for path in tile.paths if len(path) >= 3]
+                hole_paths = [path for path in tile.holes if len(path) >= 3]
+
+                all_points = [pt for path in outer_paths + hole_paths for pt in path]
+                if not all_points:
+                    tile.scaled = {"outer": [], "holes": []}
+                    continue
+
+                min_x = min(x for x, y in all_points)
+                descender_offset = ascent if ascent > 0 else ASCENT / scale
+
+                def transform(pt, _min_x=min_x, _s=scale, _do=descender_offset):
+                    x, y = pt
+                    return ((x - _min_x) * _s, (_do - y) * _s)
+
+                scaled_outer = [[transform(pt) for pt in path] for path in outer_paths]
+                scaled_holes = [[transform(pt) for pt in path] for path in hole_paths]
+
+                scaled_outer = _split_self_touching(scaled_outer)
+                scaled_holes = _split_self_touching(scaled_holes)
+                scaled_outer, scaled_holes = _inset_shared_vertices(scaled_outer, scaled_holes)
+
+                tile.scaled = {
+                    "outer": scaled_outer,
+                    "holes": scaled_holes
+                }
+
+def _split_self_touching(contours):
+    """Splits self-touching contours at duplicate vertices.
+
+    Pixel contour tracing can produce figure-eight paths that revisit the
+    same vertex at pinch points. Each loop becomes its own contour.
+    """
+    result = []
+    for contour in contours:
+        pending = [contour]
+        while pending:
+            c = pending.pop()
+            seen = {}
+            split = False
+            for i, pt in enumerate(c):
+                key = (round(pt[0]), round(pt[1]))
+                if key in seen:
+                    loop = c[seen[key]:i]
+                    rest = c[:seen[key]] + c[i:]
+                    if len(loop) >= 3:
+                        result.append(loop)
+                    if len(rest) >= 3:
+                        pending.append(rest)
+                    split = True
+                    break
+                seen[key] = i
+            if not split and len(c) >= 3:
+                result.append(c)
+
+    return result
+
+def _inset_shared_vertices(scaled_outer, scaled_holes):
+    """Insets shared vertices by 1 font unit along the bisector of adjacent edges.
+
+    Breaks vertex sharing between contours (a pixel font artifact that
+    triggers FontForge's wrong-direction false positive).
+    """
+    all_contours = scaled_outer + scaled_holes
+    if len(all_contours) <= 1:
+        return scaled_outer, scaled_holes
+
+    shared_pts = set()
+    for i, ci in enumerate(all_contours):
+        si = {(round(x), round(y)) for x, y in ci}
+        for j, cj in enumerate(all_contours):
+            if i < j:
+                sj = {(round(x), round(y)) for x, y in cj}
+                shared_pts |= si & sj
+
+    if not shared_pts:
+        return scaled_outer, scaled_holes
+
+    for i, contour in enumerate(all_contours):
+        inset = []
+        n = len(contour)
+        for k, (x, y) in enumerate(contour):
+            if (round(x), round(y)) in shared_pts:
+                px, py = contour[(k - 1) % n]
+                nx, ny = contour[(k + 1) % n]
+                dx = (px - x) + (nx - x)
+                dy = (py - y) + (ny - y)
+                dist = (dx * dx + dy * dy) ** 0.5
+                if dist > 0:
+                    x += dx / dist
+                    y += dy / dist
+            inset.append((x, y))
+        all_contours[i] = inset
+
+    outer_count = len(scaled_outer)
+    return all_contours[:outer_count], all_contours[outer_count:]
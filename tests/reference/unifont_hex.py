@@ -0,0 +1,55 @@
+"""The unifont .hex parser as it was before the grouped unhexlify rewrite, kept verbatim as the
+oracle for the unifont parser tests. It decodes line by line into dict[int, list[list[int]]]."""
+import binascii
+
+from minecraft_fontgen.functions import in_unifont_ranges
+
+def parse_unifont_hex_bytes(hex_bytes: bytes):
+    """
+    Parse GNU Unifont .hex content -> dict[int, list[list[int]]]
+    Each glyph becomes a 16-row bitmap of 0/1 ints (duospaced 8x16 or 16x16; some wider blocks exist).
+    """
+    glyphs = {}
+
+    for raw_line in hex_bytes.splitlines():
+        line = raw_line.strip()
+
+        if not line or b':' not in line:
+            continue
+
+        cp_hex, bmp_hex = line.split(b':', 1)
+        try:
+            codepoint = int(cp_hex, 16)
+        except ValueError:
+            continue
+
+        # Skip codepoints outside desired ranges
+        if not in_unifont_ranges(codepoint):
+            continue
+
+        # Each two hex chars -> one byte = 8 horizontal pixels; bitmap is 16 rows high.
+        byte_len = len(bmp_hex) // 2
+        if byte_len == 0:
+            continue
+
+        bytes_per_row = byte_len // 16 # Unifont rows are concatenated with no separators: 16 rows, each width/8 bytes.
+        width = bytes_per_row * 8 # Width is commonly 8 (32 hex digits) or 16 (64 hex digits) pixels wide, infer from total hex length.
+        img_bits = []
+        row_offset = 0
+        raw = binascii.unhexlify(bmp_hex)
+
+        for _ in range(16):
+            row = []
+            row_bytes = raw[row_offset: row_offset + bytes_per_row]
+            row_offset += bytes_per_row
+
+            for b in row_bytes:
+                for bit in range(7, -1, -1):
+                    row.append((b >> bit) & 1)
+
+            # Trim to declared width (safety)
+            img_bits.append(row[:width])
+
+        glyphs[codepoint] = img_bits
+
+    return glyphs
@@ -0,0 +1,138 @@
+"""A synthetic stand-in for a .minecraft directory, so the whole pipeline can run offline in tests.
+
+write_minecraft_dir() lays out version 9.9 the way a launcher installs it:
+the version JSON, a client.jar holding seeded random font atlases, provider
+JSONs for the default and alternate fonts, and an asset index pointing at a
+unifont include file and two unifont ZIPs (the second overriding part of the
+first). Atlases and unifont glyphs mix random noise with rings and diagonals,
+and repeat some bitmaps, so tracing, deduplication and caching are all exercised.
+Everything is derived from fixed seeds, so the files are identical on every run.
+"""
+import hashlib
+import io
+import json
+import os
+import zipfile
+
+import numpy as np
+
+from PIL import Image
+
+VERSION = "9.9"
+ASSET_INDEX = "9"
+
+def atlas_png(rng, tile_width, tile_height, rows):
+    """Returns an RGBA PNG atlas of 16 x rows tiles."""
+    densities = [0.15, 0.3, 0.5, 0.7, 0.45]
+    pixels = np.zeros((tile_height * rows, tile_width * 16), dtype=np.uint8)
+    for index in range(rows * 16):
+        tile = (rng.random((tile_height, tile_width)) < densities[index % len(densities)]).astype(np.uint8)
+        if index % 7 == 0: # ring with a dot inside
+            tile[:] = 0
+            tile[1:tile_height - 1, 0:tile_width - 2] = 1
+            tile[2:tile_height - 2, 1:tile_width - 3] = 0
+            tile[tile_height // 2, tile_width // 2 - 1] = 1
+        if index % 11 == 0: # repeated bitmap
+            tile = np.eye(tile_height, tile_width, dtype=np.uint8)
+        row, column = divmod(index, 16)
+        pixels[row * tile_height:(row + 1) * tile_height, column * tile_width:(column + 1) * tile_width] = tile
+
+    image = np.zeros(pixels.shape + (4,), dtype=np.uint8)
+    image[pixels == 1] = (255, 255, 255, 255)
+    buffer = io.BytesIO()
+    Image.fromarray(image, "RGBA").save(buffer, "PNG")
+    return buffer.getvalue()
+
+def atlas_chars(start, rows):
+    """Returns the "chars" rows of a provider covering 16 x rows codepoints from start (codepoint 0 as \\u0000)."""
+    return ["".join(chr(start + row * 16 + column) for column in range(16)) for row in range(rows)]
+
+def unifont_hex(rng, codepoints):
+    """Returns .hex content for the codepoints, mixing 8 and 16 pixel wide glyphs, a comment and a blank line."""
+    lines = []
+    for codepoint in codepoints:
+        width = 16 if codepoint >= 0x3000 or codepoint % 5 == 0 else 8
+        bits = (rng.random((16, width)) < [0.2, 0.4, 0.55][codepoint % 3]).astype(np.uint8)
+        if codepoint % 13 == 0: # ring
+            bits[:] = 0
+            bits[2:14, 2:width - 2] = 1
+            bits[4:12, 4:width - 4] = 0
+        if codepoint % 17 == 0: # repeated bitmap
+            bits = np.zeros((16, width), dtype=np.uint8)
+            bits[3:13, 3] = 1
+        lines.append(f"{codepoint:04X}:{np.packbits(bits, axis=1).tobytes().hex().upper()}")
+    lines.insert(5, "# comment")
+    lines.insert(7, "")
+    return ("\n".join(lines) + "\n").encode()
+
+def zip_bytes(files):
+    """Returns a ZIP archive holding {name: bytes}."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+def write_minecraft_dir(root, unifont_codepoints=None):
+    """Writes the synthetic .minecraft directory to root. Returns the version to pass to --version.
+    unifont_codepoints replaces the few hundred codepoints of the main unifont file (e.g. for benchmarks)."""
+    if unifont_codepoints is None:
+        unifont_codepoints = list(range(0x20, 0x200)) + list(range(0x3000, 0x3080)) + list(range(0xAC00, 0xAC40))
+
+    rng = np.random.default_rng(1234)
+    font = "assets/minecraft/font"
+    textures = "assets/minecraft/textures/font"
+    default = {"providers": [
+        {"type": "bitmap", "file": "minecraft:font/nonlatin.png", "ascent": 7, "chars": atlas_chars(0x400, 2)},
+        {"type": "bitmap", "file": "minecraft:font/accented.png", "height": 12, "ascent": 10, "chars": atlas_chars(0xC0, 2)},
+        {"type": "bitmap", "file": "minecraft:font/ascii.png", "ascent": 7, "chars": ["\u0000" + atlas_chars(1, 1)[0][:15]] + atlas_chars(0x10, 7)},
+    ]}
+    jar = zip_bytes({
+        "net/minecraft/client/Main.class": rng.bytes(4096),
+        f"{textures}/ascii.png": atlas_png(rng, 8, 8, 8),
+        f"{textures}/accented.png": atlas_png(rng, 9, 12, 2),
+        f"{textures}/nonlatin.png": atlas_png(rng, 8, 8, 2),
+        f"{textures}/alt.png": atlas_png(rng, 8, 8, 2),
+        f"{font}/include/default.json": json.dumps(default).encode(),
+        f"{font}/alt.json": json.dumps({"providers": [{"type": "bitmap", "file": "minecraft:font/alt.png", "ascent": 7, "chars": atlas_chars(0x40, 2)}]}).encode(),
+        f"{font}/illageralt.json": json.dumps({"providers": [{"type": "bitmap", "file": "minecraft:font/alt.png", "ascent": 7, "chars": atlas_chars(0x60, 2)}]}).encode(),
+        "pack.png": rng.bytes(512),
+    })
+
+    include = json.dumps({"providers": [
+        {"type": "unihex", "hex_file": "minecraft:font/unifont.zip", "size_overrides": [{"from": "、", "to": "ヿ", "left": 0, "right": 15}]},
+        {"type": "unihex", "hex_file": "minecraft:font/unifont_jp.zip"},
+    ]}).encode()
+    unifont = zip_bytes({
+        "unifont_all_no_pua.hex": unifont_hex(rng, unifont_codepoints),
+        "README.txt": b"Synthetic unifont",
+        "zz_override.hex": unifont_hex(rng, range(0x100, 0x140)),
+    })
+    unifont_jp = zip_bytes({"unifont_jp_patch.hex": unifont_hex(rng, range(0x3040, 0x3060))})
+
+    objects = {}
+    for name, data in [("minecraft/font/include/unifont.json", include), ("minecraft/font/unifont.zip", unifont),
+                       ("minecraft/font/unifont_jp.zip", unifont_jp)]:
+        sha1 = write_file(root, None, data)
+        objects[name] = {"hash": sha1, "size": len(data)}
+    index = json.dumps({"objects": objects}).encode()
+    write_file(root, f"assets/indexes/{ASSET_INDEX}.json", index)
+
+    jar_sha1 = write_file(root, f"versions/{VERSION}/{VERSION}.jar", jar)
+    version = {
+        "id": VERSION,
+        "assetIndex": {"id": ASSET_INDEX, "sha1": hashlib.sha1(index).hexdigest(), "size": len(index),
+                       "url": f"https://piston-meta.invalid/{ASSET_INDEX}.json"},
+        "downloads": {"client": {"sha1": jar_sha1, "size": len(jar), "url": f"https://piston-data.invalid/{VERSION}.jar"}},
+    }
+    write_file(root, f"versions/{VERSION}/{VERSION}.json", json.dumps(version).encode())
+    return VERSION
+
+def write_file(root, relative_path, data):
+    """Writes data under root (at assets/objects/<hash> when relative_path is None). Returns its SHA-1."""
+    sha1 = hashlib.sha1(data).hexdigest()
+    path = os.path.join(root, *(relative_path or f"assets/objects/{sha1[:2]}/{sha1}").split("/"))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as file:
+        file.write(data)
+    return sha1
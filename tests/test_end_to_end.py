@@ -0,0 +1,104 @@
+"""Runs the whole pipeline on a synthetic .minecraft directory (tests/synthetic_assets.py) and checks the fonts.
+
+Batch, streamed (--stream), parallel (--jobs) and cached (cold and warm) runs
+must produce the same OpenType fonts, and those must match
+tests/fixtures/golden_fonts.json: table digests of the fonts the original
+pipeline built from the same assets.
+Only intended output changes should touch the fixture; regenerate it with
+
+    python -m tests.test_end_to_end --write-golden
+"""
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+from fontTools.ttLib import TTFont
+from tests.synthetic_assets import write_minecraft_dir
+
+GOLDEN_FILE = os.path.join(os.path.dirname(__file__), "fixtures", "golden_fonts.json")
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs main with a smaller stream chunk, so the synthetic glyph map streams in several chunks
+RUN_MAIN = """
+import functools, sys
+import minecraft_fontgen.file_io as file_io
+import minecraft_fontgen.main as main
+if {chunk_size}:
+    main.GlyphMapStream = functools.partial(file_io.GlyphMapStream, chunk_size={chunk_size})
+sys.argv = ["minecraft-fontgen"] + {args!r}
+main.main()
+"""
+
+def run_fontgen(workdir, minecraft_dir, version, output, *args, chunk_size=None):
+    """Runs the CLI pipeline in a subprocess from workdir. Returns the output directory."""
+    args = ["--silent", "--version", version, "--minecraft-dir", minecraft_dir, "--offline", "--output", output, *args]
+    env = dict(os.environ, PYTHONPATH=REPOSITORY + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    for name in ("FONTGEN_NO_CACHE", "FONTGEN_CACHE_DIR", "FONTGEN_JOBS", "FONTGEN_STREAM", "FONTGEN_STYLES", "FONTGEN_TYPE"):
+        env.pop(name, None)
+    subprocess.run([sys.executable, "-c", RUN_MAIN.format(chunk_size=chunk_size, args=args)],
+                   cwd=workdir, env=env, check=True)
+    return os.path.join(workdir, output)
+
+def font_digests(output_dir):
+    """Returns {font file: {table tag: SHA-1}} for every font in output_dir.
+    The head table is hashed without its build timestamps and checksum adjustment."""
+    digests = {}
+    for name in sorted(os.listdir(output_dir)):
+        font = TTFont(os.path.join(output_dir, name), recalcTimestamp=False)
+        tables = {}
+        for tag in sorted(font.keys()):
+            if tag == "GlyphOrder":
+                continue
+            if tag == "head":
+                head = font["head"]
+                head.created = head.modified = head.checkSumAdjustment = 0
+                data = head.compile(font)
+            else:
+                data = font.reader[tag]
+            tables[tag] = hashlib.sha1(data).hexdigest()
+        digests[name] = tables
+    return digests
+
+def build_variants(root):
+    """Builds the synthetic fonts every supported way. Returns {variant: font digests}."""
+    minecraft_dir = os.path.join(root, "minecraft")
+    version = write_minecraft_dir(minecraft_dir)
+
+    def run(output, *args, **kwargs):
+        return font_digests(run_fontgen(root, minecraft_dir, version, output, *args, **kwargs))
+
+    cache_dir = os.path.join(root, "cache")
+    return {
+        "batch": run("otf", "--no-cache"),
+        "cold cache": run("otf-cold", "--cache-dir", cache_dir),
+        "warm cache": run("otf-warm", "--cache-dir", cache_dir),
+        "stream": run("otf-stream", "--no-cache", "--stream", chunk_size=64),
+        "jobs": run("otf-jobs", "--no-cache", "--jobs", "2"),
+    }
+
+@pytest.fixture(scope="module")
+def variants(tmp_path_factory):
+    return build_variants(str(tmp_path_factory.mktemp("end_to_end")))
+
+@pytest.mark.parametrize("variant", ["cold cache", "warm cache", "stream", "jobs"])
+def test_variants_match(variants, variant):
+    assert variants[variant] == variants["batch"]
+
+def test_matches_golden(variants):
+    with open(GOLDEN_FILE, encoding="utf-8") as file:
+        assert variants["batch"] == json.load(file)
+
+if __name__ == "__main__":
+    if sys.argv[1:] != ["--write-golden"]:
+        sys.exit("usage: python -m tests.test_end_to_end --write-golden")
+
+    with tempfile.TemporaryDirectory() as root:
+        built = build_variants(root)
+    with open(GOLDEN_FILE, "w", encoding="utf-8") as file:
+        json.dump(built["batch"], file, indent=2, sort_keys=True)
+        file.write("\n")
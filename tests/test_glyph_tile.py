@@ -0,0 +1,45 @@
+"""GlyphTile must carry exactly the traced data precompute_glyph_scaling and Glyph read, and nothing else."""
+import numpy as np
+
+from minecraft_fontgen.config import DEFAULT_GLYPH_SIZE
+from minecraft_fontgen.file_io import _compact_trace, _decode_trace, _encode_trace, _trace_bitmap_contours2, trace_bitmap_contours
+from minecraft_fontgen.glyph.glyph_tile import GlyphTile
+from tests.corpus import corpus_bitmaps
+
+def test_keeps_traced_corners_and_metrics():
+    for name, bitmap in corpus_bitmaps(random_count=100):
+        traced = _trace_bitmap_contours2(bitmap.copy())
+        tile = GlyphTile(chr(0x41), 0x41, bitmap.shape[::-1], 7, "default.png", trace_bitmap_contours(bitmap))
+
+        assert (tile.width, tile.lsb, tile.advance) == (traced["width"], traced["lsb"], traced["advance"]), name
+        assert tile.paths == [contour["corners"] for contour in traced["paths"].values()], name
+        assert tile.holes == [contour["corners"] for contour in traced["holes"].values()], name
+
+def test_cached_trace_matches_fresh_trace():
+    for name, bitmap in corpus_bitmaps(random_count=100):
+        traced = _trace_bitmap_contours2(bitmap.copy())
+        fresh, cached = _compact_trace(traced), _compact_trace(_decode_trace(_encode_trace(traced)))
+
+        assert np.array_equal(fresh["grid"], cached["grid"]), name
+        assert {key: fresh[key] for key in fresh if key != "grid"} == {key: cached[key] for key in cached if key != "grid"}, name
+
+def test_holds_no_tracing_intermediates():
+    tile = GlyphTile("A", 0x41, (8, 8), 7, "default.png", trace_bitmap_contours(np.eye(8, dtype=np.uint8)))
+    assert not hasattr(tile, "__dict__")
+    assert not any(isinstance(getattr(tile, name), np.ndarray) for name in GlyphTile.__slots__)
+
+def test_empty_tile_defaults():
+    tile = GlyphTile(".notdef", 0, None)
+    assert (tile.width, tile.lsb, tile.advance) == (DEFAULT_GLYPH_SIZE, 0, DEFAULT_GLYPH_SIZE)
+    assert tile.paths == tile.holes == []
+    assert tile.scaled is None and tile.units_per_pixel is None
+
+def test_copy_replaces_fields_and_shares_the_rest():
+    tile = GlyphTile("A", 0x41, (8, 8), 7, "alt.png", trace_bitmap_contours(np.eye(8, dtype=np.uint8)))
+    copy = tile.copy(unicode="a", codepoint=0x61)
+
+    assert (copy.unicode, copy.codepoint) == ("a", 0x61)
+    assert (tile.unicode, tile.codepoint) == ("A", 0x41)
+    for name in GlyphTile.__slots__:
+        if name not in ("unicode", "codepoint"):
+            assert getattr(copy, name) is getattr(tile, name)
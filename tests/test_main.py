@@ -0,0 +1,36 @@
+"""main must report a failed JAR download without waiting for the unifont download still running next to it."""
+import os
+import subprocess
+import sys
+
+from tests.test_end_to_end import REPOSITORY
+
+# Runs main with a JAR download that fails at once and a unifont download that blocks until released
+RUN_MAIN = """
+import sys, threading, time
+import minecraft_fontgen.main as main
+release = threading.Event()
+
+def start_minecraft_downloads(executor, mc_version):
+    def fail():
+        raise RuntimeError("client.jar failed")
+    return executor.submit(fail), executor.submit(release.wait, 60)
+
+main.start_minecraft_downloads = start_minecraft_downloads
+sys.argv = ["minecraft-fontgen", "--silent", "--no-cache", "--offline", "--output", "output"]
+start = time.perf_counter()
+try:
+    main.main()
+except RuntimeError as error:
+    print(f"{error} after {time.perf_counter() - start:.1f}s")
+finally:
+    release.set()
+"""
+
+def test_jar_failure_does_not_wait_for_unifont(tmp_path):
+    env = dict(os.environ, PYTHONPATH=REPOSITORY + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run([sys.executable, "-c", RUN_MAIN], cwd=tmp_path, env=env, check=True,
+                            capture_output=True, text=True, timeout=120)
+    message, elapsed = result.stdout.strip().rsplit(" after ", 1)
+    assert message == "client.jar failed"
+    assert float(elapsed.rstrip("s")) < 10
@@ -0,0 +1,154 @@
+"""outline_encoder must produce the exact bytes of drawing through fontTools' T2CharStringPen and TTGlyphPen."""
+import random
+
+import pytest
+
+from collections import OrderedDict
+from fontTools.pens.t2CharStringPen import T2CharStringPen
+from fontTools.pens.ttGlyphPen import TTGlyphPen
+from fontTools.ttLib import newTable
+from minecraft_fontgen.file_io import precompute_glyph_scaling, trace_bitmap_contours
+from minecraft_fontgen.glyph.glyph import Glyph
+from minecraft_fontgen.glyph.glyph_tile import GlyphTile
+from minecraft_fontgen.glyph.outline_encoder import encode_charstring, encode_glyf
+from tests.corpus import corpus_bitmaps
+
+EDGE_CASES = {
+    "empty glyph": [],
+    "empty contour": [[]],
+    "single point": [[(10, 20)]],
+    "single points in a row": [[(10, 20)], [(10, 20)], [(30, 0)], [(-5, 7)]],
+    "single point then square": [[(3, 4)], [(0, 0), (0, 100), (100, 100), (100, 0)]],
+    "square then single point": [[(0, 0), (0, 100), (100, 100), (100, 0)], [(3, 4)]],
+    "two points": [[(0, 0), (50, 0)]],
+    "closing point repeated": [[(0, 0), (0, 100), (100, 100), (100, 0), (0, 0)]],
+    "collinear horizontal run": [[(0, 0), (10, 0), (20, 0), (35, 0), (35, 10), (0, 10)]],
+    "collinear vertical run": [[(0, 0), (0, 16), (0, 32), (0, 48), (8, 48), (8, 0)]],
+    "collinear reversal": [[(0, 0), (20, 0), (10, 0), (10, 10)]],
+    "zero-length lines": [[(0, 0), (0, 0), (10, 0), (10, 0), (10, 0), (20, 0), (20, 10), (20, 10), (0, 10)]],
+    "zero-length diagonal run": [[(0, 0), (5, 5), (5, 5), (10, 10), (0, 10)]],
+    "rlineto between h/v": [[(0, 0), (10, 3), (20, 0), (25, 7), (25, 20), (0, 20)]],
+    "half-unit coordinates": [[(0.5, 0.5), (0.5, 62.5), (62.5, 62.5), (62.5, 0.5)], [(1.5, -0.5), (-0.5, 2.5), (2.5, 2.5)]],
+    "stack limit": [[(0, 0)] + [(x * 8, (x % 2) * 8) for x in range(1, 200)] + [(1600, -8)]],
+    "diagonal stack limit": [[(x * 3, (x * x) % 17) for x in range(120)]],
+}
+
+_glyf_table = newTable("glyf")
+_glyf_table.glyphs = {}
+_glyf_table.glyphOrder = []
+
+def pen_charstring(contours, width):
+    """Encodes contours the way Glyph.build did before outline_encoder, through a T2CharStringPen."""
+    pen = T2CharStringPen(width, None)
+    for contour in contours:
+        if not contour:
+            continue
+        pen.moveTo(contour[0])
+        for point in contour[1:]:
+            pen.lineTo(point)
+        pen.closePath()
+    return pen.getCharString()
+
+def pen_glyf(contours):
+    """Encodes contours the way Glyph.build did before outline_encoder, through a TTGlyphPen."""
+    pen = TTGlyphPen(None)
+    for contour in contours:
+        if not contour:
+            continue
+        pen.moveTo(contour[0])
+        for point in contour[1:]:
+            pen.lineTo(point)
+        pen.closePath()
+    return pen.glyph()
+
+def charstring_bytes(charstring):
+    charstring.compile()
+    return charstring.bytecode
+
+def glyf_bytes(glyph):
+    return glyph.compile(_glyf_table, recalcBBoxes=True)
+
+def drawn_glyphs():
+    """Returns (name, use_cff, contours, width) for every corpus bitmap traced, scaled and drawn like a real build,
+    upright and italic, for both outline formats."""
+    tiles = OrderedDict()
+    for index, (name, bitmap) in enumerate(corpus_bitmaps(random_count=200)):
+        source = "unifont" if bitmap.shape[0] == 16 else None
+        tiles[name] = GlyphTile(chr(0x4E00 + index), 0x4E00 + index, bitmap.shape[::-1], 15 if source else 7,
+                                source, trace_bitmap_contours(bitmap.copy()))
+    precompute_glyph_scaling({"Regular": tiles})
+
+    glyphs = []
+    for name, tile in tiles.items():
+        for use_cff in (True, False):
+            for italic in (False, True):
+                glyph = Glyph(tile, use_cff)
+                glyph.scale(italic=italic)
+                glyph.draw()
+                glyphs.append((f"{name}{' italic' if italic else ''}", use_cff, glyph.contours, glyph._get_charstring_width()))
+    return glyphs
+
+def random_contours(count=2000, seed=25):
+    """Returns seeded random polygons mixing axis-aligned, zero-length, fractional and diagonal steps."""
+    rng = random.Random(seed)
+    cases = []
+    for _ in range(count):
+        contours = []
+        for _ in range(rng.randint(0, 4)):
+            contour = [(rng.choice([0, 0.5, 3]), rng.choice([0, 1.5]))]
+            for _ in range(rng.choice([1, 1, 2, 3, 4, 8, 30, 80]) - 1):
+                x, y = contour[-1]
+                step = rng.random()
+                if step < 0.35:
+                    x += rng.choice([0, 0.2, 0.5, 1, -1, 62.5, -62.5])
+                elif step < 0.7:
+                    y += rng.choice([0, 0.4, 1, -1, 62.5, -62.5])
+                elif step >= 0.8:
+                    x += rng.uniform(-80, 80)
+                    y += rng.uniform(-80, 80)
+                contour.append((x, y))
+            if rng.random() < 0.2:
+                contour.append(contour[0])
+            contours.append(contour)
+        cases.append((contours, rng.choice([0, 500, 512.5])))
+    return cases
+
+def assert_charstring_matches(contours, width):
+    encoded, drawn = encode_charstring(contours, width), pen_charstring(contours, width)
+    assert encoded.program == drawn.program
+    assert charstring_bytes(encoded) == charstring_bytes(drawn)
+
+def assert_glyf_matches(contours):
+    encoded, drawn = encode_glyf(contours), pen_glyf(contours)
+    assert list(encoded.coordinates) == list(drawn.coordinates)
+    assert encoded.endPtsOfContours == drawn.endPtsOfContours
+    assert encoded.flags == drawn.flags
+    assert glyf_bytes(encoded) == glyf_bytes(drawn)
+
+@pytest.mark.parametrize("name", EDGE_CASES)
+@pytest.mark.parametrize("width", [0, 500, 512.5])
+def test_charstring_edge_cases(name, width):
+    assert_charstring_matches(EDGE_CASES[name], width)
+
+@pytest.mark.parametrize("name", EDGE_CASES)
+def test_glyf_edge_cases(name):
+    assert_glyf_matches(EDGE_CASES[name])
+
+def test_drawn_glyphs():
+    glyphs = drawn_glyphs()
+    assert any(contours for _, _, contours, _ in glyphs)
+    mismatches = []
+    for name, use_cff, contours, width in glyphs:
+        try:
+            if use_cff:
+                assert_charstring_matches(contours, width)
+            else:
+                assert_glyf_matches(contours)
+        except AssertionError:
+            mismatches.append((name, "CFF" if use_cff else "TrueType"))
+    assert not mismatches
+
+def test_random_contours():
+    for contours, width in random_contours():
+        assert_charstring_matches(contours, width)
+        assert_glyf_matches(contours)
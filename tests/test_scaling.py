@@ -0,0 +1,82 @@
+"""Glyph scaling must produce exactly the contours of the per-glyph scaling it replaced (tests/reference/scaling.py)."""
+import random
+
+from collections import OrderedDict
+from minecraft_fontgen.file_io import _inset_shared_vertices, _split_self_touching, _trace_bitmap_contours2, precompute_glyph_scaling
+from minecraft_fontgen.glyph.glyph_tile import GlyphTile
+from tests.corpus import corpus_bitmaps
+from tests.reference import scaling as reference
+
+def corpus_glyph_map():
+    """Returns a glyph map of corpus tiles as provider glyphs (ascent 7 and 10), unifont glyphs (ascent 15),
+    tiles without an ascent and empty tiles, with the Galactic style sharing the Regular tile objects."""
+    glyph_map = {"Regular": OrderedDict(), "Bold": OrderedDict(), "Galactic": OrderedDict()}
+    kinds = [(7, "ascii.png"), (10, "accented.png"), (15, "unifont"), (0, "nonlatin.png")]
+    for index, (name, bitmap) in enumerate(corpus_bitmaps(random_count=600)):
+        ascent, source = kinds[index % len(kinds)]
+        for style_key, bold in (("Regular", False), ("Bold", True)):
+            pixel_data = _trace_bitmap_contours2(bitmap.copy(), bold)
+            glyph_map[style_key][index] = GlyphTile(chr(0x100 + index), 0x100 + index, bitmap.shape[::-1], ascent, source, pixel_data)
+        glyph_map["Galactic"][index] = glyph_map["Regular"][index] if index % 3 else glyph_map["Regular"][index].copy()
+    glyph_map["Regular"][-1] = GlyphTile(".notdef", 0, None)
+    return glyph_map
+
+def copy_glyph_map(glyph_map):
+    """Returns a copy of glyph_map with fresh tiles, keeping tiles shared between styles shared."""
+    copies = {}
+    return {style_key: OrderedDict((cp, copies.setdefault(id(tile), tile.copy())) for cp, tile in tiles.items())
+            for style_key, tiles in glyph_map.items()}
+
+def test_precompute_glyph_scaling():
+    glyph_map = corpus_glyph_map()
+    expected_map = copy_glyph_map(glyph_map)
+    reference.precompute_glyph_scaling(expected_map)
+    precompute_glyph_scaling(glyph_map)
+
+    mismatches = []
+    for style_key, tiles in glyph_map.items():
+        for cp, tile in tiles.items():
+            expected = expected_map[style_key][cp]
+            if tile.units_per_pixel != expected.units_per_pixel:
+                mismatches.append((style_key, cp, "units_per_pixel"))
+            for key in ("outer", "holes"):
+                if tile.scaled[key] != expected.scaled[key]:
+                    mismatches.append((style_key, cp, key))
+    assert not mismatches
+
+def scaled_contour_sets(random_count=600):
+    """Returns (outer, holes) contour lists of the corpus traced regular and bold and scaled like provider glyphs,
+    before self-touching contours are split, followed by seeded random polygons whose vertices often coincide."""
+    contour_sets = []
+    for _, bitmap in corpus_bitmaps(random_count):
+        for bold in (False, True):
+            pixel_data = _trace_bitmap_contours2(bitmap.copy(), bold)
+            outer, holes = ([[(x * 128.0, (7 - y) * 128.0) for x, y in contour["corners"]] for contour in pixel_data[key].values()]
+                            for key in ("paths", "holes"))
+            contour_sets.append((outer, holes))
+
+    rng = random.Random(22)
+    for _ in range(random_count):
+        grid = rng.choice([1, 0.5, 62.5])
+        contours = [[(rng.randint(0, 6) * grid, rng.randint(0, 6) * grid) for _ in range(rng.randint(3, 8))]
+                    for _ in range(rng.randint(1, 5))]
+        split = rng.randint(0, len(contours))
+        contour_sets.append((contours[:split], contours[split:]))
+    return contour_sets
+
+def test_inset_shared_vertices():
+    mismatches = []
+    for index, (outer, holes) in enumerate(scaled_contour_sets()):
+        outer, holes = reference._split_self_touching(outer), reference._split_self_touching(holes)
+        expected = reference._inset_shared_vertices([list(c) for c in outer], [list(c) for c in holes])
+        if _inset_shared_vertices([list(c) for c in outer], [list(c) for c in holes]) != expected:
+            mismatches.append(index)
+    assert not mismatches
+
+def test_split_self_touching():
+    mismatches = []
+    for index, (outer, holes) in enumerate(scaled_contour_sets()):
+        for contours in (outer, holes):
+            if _split_self_touching(contours) != reference._split_self_touching(contours):
+                mismatches.append(index)
+    assert not mismatches
@@ -0,0 +1,41 @@
+"""A corrupt entry in the persistent contour cache must be dropped and the glyph traced again."""
+import hashlib
+import json
+import zlib
+
+import numpy as np
+import pytest
+
+from minecraft_fontgen.cache import get_blob_cache
+from minecraft_fontgen.file_io import _decode_trace, _trace_key, clear_trace_memo, trace_bitmap_contours, trace_bitmaps, trace_memo_stats
+from minecraft_fontgen.functions import set_cache
+from tests.corpus import ROOK, parse_bitmap
+
+CORRUPT = {
+    "not zlib": b"not a zlib stream",
+    "truncated": zlib.compress(b'{"bitmap": "00"}')[:-4],
+    "not json": zlib.compress(b"\x00\x01"),
+    "missing fields": zlib.compress(json.dumps({"bitmap": "00"}).encode()),
+    "bad hex": zlib.compress(json.dumps({"bitmap": "zz", "bitmap_dtype": "|u1", "shape": [1, 1]}).encode()),
+}
+
+@pytest.mark.parametrize("trace", [trace_bitmap_contours, lambda bitmap: trace_bitmaps([bitmap])[0]])
+@pytest.mark.parametrize("name", CORRUPT)
+def test_corrupt_entry_retraced(tmp_path, name, trace):
+    set_cache(str(tmp_path))
+    bitmap = parse_bitmap(ROOK)
+    expected = trace_bitmap_contours(bitmap.copy())
+
+    cache = get_blob_cache("contours")
+    cache_key = hashlib.sha1(repr(_trace_key(bitmap, False)).encode()).hexdigest()
+    cache.put(cache_key, CORRUPT[name])
+    cache.flush()
+    clear_trace_memo()
+
+    pixel_data = trace(bitmap.copy())
+    assert trace_memo_stats["misses"] == 1 and trace_memo_stats["cached"] == 0
+    assert np.array_equal(pixel_data["grid"], expected["grid"])
+    assert pixel_data["paths"] == expected["paths"] and pixel_data["holes"] == expected["holes"]
+
+    cache.flush()
+    assert _decode_trace(cache.get(cache_key))["width"] == expected["width"] # replaced by the new trace
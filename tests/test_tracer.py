@@ -0,0 +1,43 @@
+"""The contour tracer must trace exactly like the flood-fill tracer it replaced (tests/reference/tracer.py)."""
+import numpy as np
+import pytest
+
+from minecraft_fontgen.file_io import _label_pixel_grid, _trace_bitmap_contours2
+from tests.corpus import corpus_bitmaps
+from tests.reference import tracer as reference
+
+CORPUS = corpus_bitmaps(random_count=1000)
+
+@pytest.mark.parametrize("bold", [False, True], ids=["regular", "bold"])
+def test_label_pixel_grid(bold):
+    mismatches = []
+    for name, bitmap in CORPUS:
+        bitmap = bitmap.copy()
+        expected_grid, expected_paths, expected_holes = reference.label_pixel_grid(bitmap, bold) # emboldens bitmap in place
+        pixel_grid, path_labels, hole_labels = _label_pixel_grid(bitmap)
+        if not np.array_equal(pixel_grid, expected_grid) or path_labels != expected_paths or hole_labels != expected_holes:
+            mismatches.append(name)
+    assert not mismatches
+
+def contour_points(contours):
+    """Returns {label: (coords, corners)} with plain int points, so NumPy and Python integers compare alike."""
+    return {label: tuple([tuple(map(int, point)) for point in contour[key]] for key in ("coords", "corners"))
+            for label, contour in contours.items()}
+
+@pytest.mark.parametrize("bold", [False, True], ids=["regular", "bold"])
+def test_trace_bitmap_contours(bold):
+    mismatches = []
+    for name, bitmap in CORPUS:
+        expected = reference._trace_bitmap_contours2(bitmap.copy(), bold)
+        traced = _trace_bitmap_contours2(bitmap.copy(), bold)
+        for key in ("bitmap", "grid"):
+            if not np.array_equal(traced[key], expected[key]):
+                mismatches.append((name, key))
+        for key in ("width", "lsb", "advance"):
+            if traced[key] != expected[key]:
+                mismatches.append((name, key))
+        for key in ("paths", "holes"):
+            # Label order matters too, it decides the contour order in the font
+            if list(contour_points(traced[key]).items()) != list(contour_points(expected[key]).items()):
+                mismatches.append((name, key))
+    assert not mismatches
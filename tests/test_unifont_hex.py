@@ -0,0 +1,71 @@
+"""parse_unifont_hex_bytes must decode the same glyphs as the row-by-row parser it replaced (tests/reference/unifont_hex.py).
+
+tests/fixtures/unifont_sample.hex mixes 8 and 16 pixel wide rows with
+lowercase hex, CRLF line endings, trailing whitespace, 5 and 6 digit
+codepoints, duplicates (the later line wins, even across widths), codepoints
+outside UNIFONT_RANGES, a comment, a blank line, a line without a separator
+and a bad codepoint. Set FONTGEN_TEST_UNIFONT to the path of a real unifont
+ZIP to compare every .hex file in it as well.
+"""
+import os
+import zipfile
+
+import numpy as np
+import pytest
+
+from minecraft_fontgen.piston import parse_unifont_hex_bytes
+from tests.reference.unifont_hex import parse_unifont_hex_bytes as reference_parse
+
+SAMPLE_FILE = os.path.join(os.path.dirname(__file__), "fixtures", "unifont_sample.hex")
+
+# Lines the reference parser raised on or turned into zero-width glyphs, now skipped
+MALFORMED = {
+    "odd length": b"0050:0000000018242442427E424242420",
+    "short": b"0051:0011",
+    "empty bitmap": b"0052:",
+    "non-hex digit": b"0053:0000000018242442427E42424242000G",
+    "non-hex wide": b"A010:" + b"Z" * 64,
+}
+
+def read_sample():
+    with open(SAMPLE_FILE, "rb") as file:
+        return file.read()
+
+def assert_same_glyphs(hex_bytes):
+    glyphs = parse_unifont_hex_bytes(hex_bytes)
+    expected = reference_parse(hex_bytes)
+    assert list(glyphs) == sorted(expected)
+    for codepoint, bitmap in glyphs.items():
+        assert np.array_equal(bitmap, np.array(expected[codepoint], dtype=np.uint8)), f"U+{codepoint:04X}"
+
+def test_sample_matches_reference():
+    sample = read_sample()
+    glyphs = parse_unifont_hex_bytes(sample)
+    assert {glyphs[codepoint].shape[1] for codepoint in glyphs} == {8, 16}
+    assert glyphs[0xA001].shape == (16, 8) # later, narrower duplicate wins
+    assert 0x0800 not in glyphs and 0x10000 not in glyphs # disabled ranges
+    assert_same_glyphs(sample)
+
+@pytest.mark.parametrize("name", MALFORMED)
+def test_malformed_line_skipped(name):
+    line = MALFORMED[name]
+    lines = read_sample().splitlines(keepends=True)
+    with_malformed = b"".join(lines[:20] + [line + b"\n"] + lines[20:])
+
+    try:
+        reference = reference_parse(line)
+    except ValueError: # binascii.Error
+        reference = None
+    assert reference is None or all(not row for bitmap in reference.values() for row in bitmap)
+
+    glyphs = parse_unifont_hex_bytes(with_malformed)
+    expected = parse_unifont_hex_bytes(read_sample())
+    assert list(glyphs) == list(expected)
+    assert all(np.array_equal(glyphs[codepoint], expected[codepoint]) for codepoint in expected)
+
+@pytest.mark.skipif(not os.environ.get("FONTGEN_TEST_UNIFONT"), reason="FONTGEN_TEST_UNIFONT is not set")
+def test_real_unifont_matches_reference():
+    with zipfile.ZipFile(os.environ["FONTGEN_TEST_UNIFONT"]) as archive:
+        for name in archive.namelist():
+            if name.lower().endswith(".hex"):
+                assert_same_glyphs(archive.read(name))